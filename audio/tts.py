@@ -1,25 +1,99 @@
 """Generate audio files using Piper TTS."""
 
+import asyncio
+import atexit
+import contextvars
+import json
 import logging
+import queue
 import subprocess
 import os
+import tempfile
+import threading
+import wave
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import AsyncIterable, NamedTuple
+import numpy as np
+import disk_cache
+import instrumentation
+import profiling
 import settings
+from audio import tts_cache
 
 logger = logging.getLogger(__name__)
 
+# Process-wide cache of loaded PiperVoice objects, keyed by (resolved model path, mtime)
+_voice_cache: dict[tuple[str, int], object] = {}
+_voice_cache_lock = threading.Lock()
+_voice_cache_hits = 0
+_voice_cache_misses = 0
 
-def generate_audio_files(stanzas: list[str], output_dir: str) -> list[str]:
+
+class AudioBuffer(NamedTuple):
+    """Synthesized PCM audio held in memory."""
+    
+    samples: np.ndarray  # int16, shape (n,) for mono or (n, channels)
+    sample_rate: int
+    
+    @property
+    def duration(self) -> float:
+        """Length of the audio in seconds."""
+        return len(self.samples) / self.sample_rate
+    
+    def to_float32(self) -> np.ndarray:
+        """Return samples as float32 in [-1, 1] with shape (n, channels)."""
+        samples = self.samples.astype(np.float32) / 32768.0
+        return samples.reshape(len(samples), -1)
+
+
+def generate_audio_files(stanzas: list[str], output_dir: str, workers: int | None = None) -> list[str]:
     """
-    Uses Piper TTS to generate 3 WAV files (one per stanza).
+    Uses Piper TTS to generate one WAV file per stanza.
     
     Args:
         stanzas: List of stanza text strings
         output_dir: Directory to save audio files
+        workers: Number of concurrent synthesis workers (defaults to settings.TTS_WORKERS)
     
     Returns:
         List of file paths to generated WAV files
     
+    Raises:
+        ValueError: If stanzas list is empty or invalid.
+        RuntimeError: If Piper TTS fails to generate audio.
+    """
+    generate_audio_buffers(stanzas, output_dir=output_dir, workers=workers)
+    return [
+        str(Path(output_dir) / f"stanza_{i}.{settings.OUTPUT_AUDIO_FORMAT}")
+        for i in range(1, len(stanzas) + 1)
+    ]
+
+
+@instrumentation.instrumented("tts")
+def generate_audio_buffers(
+    stanzas: list[str],
+    output_dir: str | None = None,
+    workers: int | None = None
+) -> list[AudioBuffer]:
+    """
+    Uses Piper TTS to synthesize each stanza into an in-memory PCM buffer.
+    
+    WAV files are only written when output_dir is given. With more than one
+    worker, stanzas are synthesized concurrently by a thread pool: the
+    in-process path shares the cached PiperVoice, while the piper CLI path
+    hands each thread its own persistent piper co-process. Buffers are always
+    returned in stanza order.
+    
+    Args:
+        stanzas: List of stanza text strings
+        output_dir: Optional directory to also save stanza_<n>.wav files into
+        workers: Number of concurrent synthesis workers (defaults to settings.TTS_WORKERS)
+    
+    Returns:
+        List of AudioBuffer objects, one per stanza
+    
     Raises:
         ValueError: If stanzas list is empty or invalid.
         RuntimeError: If Piper TTS fails to generate audio.
@@ -27,80 +101,305 @@ def generate_audio_files(stanzas: list[str], output_dir: str) -> list[str]:
     if not stanzas:
         raise ValueError("Stanzas list cannot be empty.")
     
-    if len(stanzas) != 3:
-        logger.warning(f"Expected 3 stanzas, got {len(stanzas)}")
+    output_path = None
+    if output_dir is not None:
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
     
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
+    workers = workers if workers is not None else settings.TTS_WORKERS
+    workers = max(1, min(workers, len(stanzas)))
     
-    audio_paths = []
+    jobs = [
+        (i, stanza, str(output_path / f"stanza_{i}.{settings.OUTPUT_AUDIO_FORMAT}") if output_path else None)
+        for i, stanza in enumerate(stanzas, 1)
+    ]
     
-    for i, stanza in enumerate(stanzas, 1):
-        # Clean stanza text for TTS (remove extra whitespace, newlines)
-        clean_text = ' '.join(stanza.split())
-        
-        audio_filename = f"stanza_{i}.{settings.OUTPUT_AUDIO_FORMAT}"
-        audio_path = output_path / audio_filename
-        
+    if workers == 1:
+        buffers = [_synthesize_stanza(*job) for job in jobs]
+        _prune_tts_cache()
+        return buffers
+    
+    if _piper_package_available():
+        # Load the voice once up front so worker threads all hit the cache
+        get_voice(_resolve_voice_model_path())
+    executor = ThreadPoolExecutor(max_workers=workers)
+    
+    logger.info(f"Generating audio for {len(jobs)} stanzas with {workers} workers...")
+    buffers = [None] * len(jobs)
+    # Each worker runs in a copy of the caller's context so its stages land in the caller's
+    # metrics run (and its calls in the caller's profile)
+    futures = {
+        executor.submit(contextvars.copy_context().run, profiling.run_profiled, _synthesize_stanza, *job): job[0]
+        for job in jobs
+    }
+    try:
+        for future in as_completed(futures):
+            buffers[futures[future] - 1] = future.result()
+    except BaseException:
+        # Fail fast: drop stanzas that have not started yet
+        for future in futures:
+            future.cancel()
+        raise
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    
+    _prune_tts_cache()
+    return buffers
+
+
+@instrumentation.instrumented("tts")
+async def agenerate_audio_buffers(
+    stanzas: AsyncIterable[str],
+    output_dir: str | None = None,
+    workers: int | None = None
+) -> list[AudioBuffer]:
+    """
+    Synthesize stanzas as they arrive from an async iterable (e.g. poem_writer.astream_stanzas).
+    
+    Each stanza is handed to the worker pool as soon as it is yielded, so
+    stanza 1 is being spoken while the model is still writing the later
+    ones. Otherwise behaves like generate_audio_buffers().
+    
+    Args:
+        stanzas: Async iterable of stanza text strings
+        output_dir: Optional directory to also save stanza_<n>.wav files into
+        workers: Number of concurrent synthesis workers (defaults to settings.TTS_WORKERS)
+    
+    Returns:
+        List of AudioBuffer objects, one per stanza, in stanza order
+    
+    Raises:
+        ValueError: If no stanzas arrive.
+        RuntimeError: If Piper TTS fails to generate audio.
+    """
+    output_path = None
+    if output_dir is not None:
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+    
+    workers = max(1, workers if workers is not None else settings.TTS_WORKERS)
+    if _piper_package_available():
+        # Load the voice before the first stanza arrives
+        await asyncio.to_thread(get_voice, _resolve_voice_model_path())
+    
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures = []
+    try:
+        async for stanza in stanzas:
+            index = len(futures) + 1
+            audio_path = str(output_path / f"stanza_{index}.{settings.OUTPUT_AUDIO_FORMAT}") if output_path else None
+            futures.append(loop.run_in_executor(
+                executor, contextvars.copy_context().run,
+                profiling.run_profiled, _synthesize_stanza, index, stanza, audio_path
+            ))
+        if not futures:
+            raise ValueError("Stanzas list cannot be empty.")
+        buffers = await asyncio.gather(*futures)
+    except BaseException:
+        # Fail fast: drop stanzas that have not started yet
+        for future in futures:
+            future.cancel()
+        raise
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    await asyncio.to_thread(_prune_tts_cache)
+    return list(buffers)
+
+
+def _synthesize_stanza(index: int, stanza: str, audio_path: str | None) -> AudioBuffer:
+    """
+    Synthesize a single stanza, optionally saving it to audio_path.
+    
+    Args:
+        index: 1-based stanza number (for logging and errors)
+        stanza: Stanza text
+        audio_path: Destination WAV path, or None to keep the audio in memory only
+    
+    Returns:
+        AudioBuffer with the stanza's audio
+    
+    Raises:
+        RuntimeError: If Piper TTS fails to generate audio.
+    """
+    # Clean stanza text for TTS (remove extra whitespace, newlines)
+    clean_text = ' '.join(stanza.split())
+    
+    with instrumentation.stage("tts.stanza", stanza=index) as stage:
         try:
-            logger.info(f"Generating audio for stanza {i}...")
-            _generate_audio_with_piper(clean_text, str(audio_path))
+            key = None
+            if settings.TTS_CACHE_ENABLED:
+                key = tts_cache.cache_key(clean_text, _voice_identity(), _synthesis_params())
+                cached = tts_cache.lookup(key)
+                if cached is not None:
+                    if audio_path:
+                        disk_cache.link_or_copy(cached, Path(audio_path))
+                    logger.info(f"Reused cached audio for stanza {index}")
+                    buffer = read_wav(str(cached))
+                    stage.labels.update(cache="hit", audio_seconds=round(buffer.duration, 3))
+                    return buffer
             
-            # Validate audio file was created
-            if not audio_path.exists():
-                raise RuntimeError(f"Audio file was not created: {audio_path}")
+            logger.info(f"Generating audio for stanza {index}...")
+            if audio_path:
+                # Never write through an existing hardlink into the cache
+                Path(audio_path).unlink(missing_ok=True)
+            buffer = _generate_audio_with_piper(clean_text, audio_path)
             
-            # Check file size (should be > 0)
-            if audio_path.stat().st_size == 0:
-                raise RuntimeError(f"Audio file is empty: {audio_path}")
+            # Validate audio was produced
+            if len(buffer.samples) == 0:
+                raise RuntimeError(f"Synthesized audio is empty for stanza {index}")
             
-            audio_paths.append(str(audio_path))
-            logger.info(f"Successfully generated audio: {audio_path}")
+            if key is not None:
+                if audio_path:
+                    tts_cache.store(key, audio_path)
+                else:
+                    write_wav(buffer, str(tts_cache.entry_path(key)))
+                    stage.add_output(tts_cache.entry_path(key))
+            if audio_path:
+                stage.add_output(audio_path)
+            
+            stage.labels.update(cache="miss" if key is not None else "off", audio_seconds=round(buffer.duration, 3))
+            logger.info(f"Successfully generated audio for stanza {index} ({buffer.duration:.1f}s)")
+            return buffer
             
         except Exception as e:
-            logger.error(f"Failed to generate audio for stanza {i}: {e}")
-            raise RuntimeError(f"TTS generation failed for stanza {i}: {e}") from e
+            logger.error(f"Failed to generate audio for stanza {index}: {e}")
+            raise RuntimeError(f"TTS generation failed for stanza {index}: {e}") from e
+
+
+def read_wav(path: str) -> AudioBuffer:
+    """
+    Load a PCM WAV file into an AudioBuffer without going through ffmpeg.
+    
+    Args:
+        path: Path to a PCM WAV file
+    
+    Returns:
+        AudioBuffer with int16 samples
+    """
+    with wave.open(path, "rb") as wav_file:
+        channels = wav_file.getnchannels()
+        sample_width = wav_file.getsampwidth()
+        sample_rate = wav_file.getframerate()
+        frames = wav_file.readframes(wav_file.getnframes())
+    
+    if sample_width == 2:
+        samples = np.frombuffer(frames, dtype='<i2').astype(np.int16)
+    elif sample_width == 1:
+        samples = ((np.frombuffer(frames, dtype=np.uint8).astype(np.int16) - 128) << 8)
+    elif sample_width == 4:
+        samples = (np.frombuffer(frames, dtype='<i4') >> 16).astype(np.int16)
+    else:
+        raise ValueError(f"Unsupported WAV sample width {sample_width} in {path}")
+    
+    if channels > 1:
+        samples = samples.reshape(-1, channels)
+    return AudioBuffer(samples, sample_rate)
+
+
+def write_wav(buffer: AudioBuffer, path: str) -> None:
+    """
+    Write an AudioBuffer as a 16-bit PCM WAV file.
+    
+    The file is written next to path and renamed into place, so a partially
+    written file is never visible.
+    """
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    channels = 1 if buffer.samples.ndim == 1 else buffer.samples.shape[1]
+    try:
+        with wave.open(str(tmp), "wb") as wav_file:
+            wav_file.setnchannels(channels)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(buffer.sample_rate)
+            wav_file.writeframes(buffer.samples.astype('<i2').tobytes())
+        os.replace(tmp, target)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _voice_identity() -> list:
+    """
+    Identify the configured voice model for TTS cache keys.
     
-    return audio_paths
+    Uses the model file's path, size and mtime when it exists locally, so that
+    replacing the model invalidates cached audio.
+    """
+    voice_model = settings.PIPER_VOICE_PATH or settings.PIPER_VOICE_MODEL
+    if _piper_package_available():
+        voice_model = _resolve_voice_model_path()
+    if Path(voice_model).is_file():
+        return disk_cache.file_identity(voice_model)
+    return [voice_model]
+
+
+def _synthesis_params() -> dict:
+    """Synthesis parameters that affect the generated audio (part of the TTS cache key)."""
+    return {
+        'backend': 'package' if _piper_package_available() else 'cli',
+        'format': settings.OUTPUT_AUDIO_FORMAT,
+    }
 
 
-def _generate_audio_with_piper(text: str, output_path: str) -> None:
+def _prune_tts_cache() -> None:
+    """Keep the TTS cache within settings.TTS_CACHE_MAX_BYTES."""
+    if settings.TTS_CACHE_ENABLED:
+        tts_cache.prune()
+
+
+def _piper_package_available() -> bool:
+    """Return True if the piper-tts Python package (with PiperVoice) is importable."""
+    try:
+        import piper
+    except ImportError:
+        return False
+    return hasattr(piper, 'PiperVoice')
+
+
+def _generate_audio_with_piper(text: str, output_path: str | None = None) -> AudioBuffer:
     """
     Generate audio using Piper TTS.
     
     Supports multiple Piper installation methods:
-    1. piper-tts Python package (if available)
-    2. piper command-line tool via subprocess
-    3. piper Python bindings
+    1. piper-tts Python package (if available), synthesized in memory
+    2. piper command-line tool via a persistent co-process
     
     Args:
         text: Text to convert to speech
-        output_path: Path to save the WAV file
+        output_path: Optional path to also save the WAV file
+    
+    Returns:
+        AudioBuffer with the synthesized audio
     
     Raises:
         RuntimeError: If Piper TTS is not available or fails.
     """
     # Try method 1: piper-tts Python package (imports as 'piper')
-    try:
-        import piper
-        # Check if it's the piper-tts package (has PiperVoice)
-        if hasattr(piper, 'PiperVoice'):
-            logger.debug("Using piper-tts Python package")
-            _generate_with_piper_package(text, output_path)
-            return
-    except ImportError:
-        pass
+    if _piper_package_available():
+        logger.debug("Using piper-tts Python package")
+        buffer = _synthesize_with_piper_package(text)
+        if output_path:
+            write_wav(buffer, output_path)
+        return buffer
     
-    # Try method 2: piper command-line tool
+    # Try method 2: piper command-line tool (it can only write files)
     try:
         logger.debug("Using piper command-line tool")
-        _generate_with_piper_cli(text, output_path)
-        return
+        if output_path:
+            _generate_with_piper_cli(text, output_path)
+            return read_wav(output_path)
+        fd, tmp_path = tempfile.mkstemp(suffix=".wav")
+        os.close(fd)
+        try:
+            _generate_with_piper_cli(text, tmp_path)
+            return read_wav(tmp_path)
+        finally:
+            Path(tmp_path).unlink(missing_ok=True)
     except (FileNotFoundError, subprocess.CalledProcessError):
         pass
     
-    # Method 3 is now handled by method 1 (piper-tts package)
-    
     # If all methods fail, raise error with helpful message
     raise RuntimeError(
         "Piper TTS is not available. Please install it using one of:\n"
@@ -111,11 +410,116 @@ def _generate_audio_with_piper(text: str, output_path: str) -> None:
     )
 
 
-def _generate_with_piper_package(text: str, output_path: str) -> None:
-    """Generate audio using piper-tts Python package."""
+def _synthesize_with_piper_package(text: str) -> AudioBuffer:
+    """Synthesize text to an in-memory buffer using the piper-tts Python package."""
+    model_path = _resolve_voice_model_path()
+    voice = get_voice(model_path)
+    
+    if hasattr(voice, 'synthesize_stream_raw'):
+        # piper-tts < 1.3 streams raw int16 bytes
+        raw = b"".join(voice.synthesize_stream_raw(text))
+        return AudioBuffer(np.frombuffer(raw, dtype=np.int16), voice.config.sample_rate)
+    
+    # piper-tts >= 1.3 yields AudioChunk objects
+    chunks = list(voice.synthesize(text))
+    if not chunks:
+        return AudioBuffer(np.zeros(0, dtype=np.int16), voice.config.sample_rate)
+    samples = np.concatenate([chunk.audio_int16_array for chunk in chunks])
+    return AudioBuffer(samples, chunks[0].sample_rate)
+
+
+def get_voice(model_path: str):
+    """
+    Return a loaded PiperVoice for model_path, loading it at most once per process.
+    
+    Voices are cached by resolved model path and file mtime, so replacing the
+    .onnx file on disk transparently triggers a reload on the next call. The
+    cache is module-level and therefore shared by the CLI and the web worker.
+    
+    Args:
+        model_path: Path to the .onnx voice model
+    
+    Returns:
+        Loaded piper.PiperVoice instance
+    
+    Raises:
+        RuntimeError: If the voice model cannot be loaded.
+    """
+    global _voice_cache_hits, _voice_cache_misses
     import piper
-    import wave
     
+    resolved = Path(model_path).resolve()
+    try:
+        mtime = resolved.stat().st_mtime_ns
+    except OSError as e:
+        raise RuntimeError(f"Failed to load voice model from '{model_path}': {e}")
+    key = (str(resolved), mtime)
+    
+    with _voice_cache_lock:
+        voice = _voice_cache.get(key)
+        if voice is not None:
+            _voice_cache_hits += 1
+            return voice
+        
+        _voice_cache_misses += 1
+        # Drop stale entries for the same model file (e.g. it was replaced on disk)
+        for stale_key in [k for k in _voice_cache if k[0] == key[0]]:
+            del _voice_cache[stale_key]
+        
+        logger.info(f"Loading Piper voice model: {resolved}")
+        try:
+            voice = piper.PiperVoice.load(str(resolved))
+        except Exception as e:
+            raise RuntimeError(f"Failed to load voice model from '{model_path}': {e}")
+        
+        _voice_cache[key] = voice
+        return voice
+
+
+def unload_voice(model_path: str | None = None) -> int:
+    """
+    Evict cached voices so their memory can be released.
+    
+    Args:
+        model_path: Model to evict. If None, every cached voice is evicted.
+    
+    Returns:
+        Number of voices evicted
+    """
+    with _voice_cache_lock:
+        if model_path is None:
+            keys = list(_voice_cache)
+        else:
+            resolved = str(Path(model_path).resolve())
+            keys = [k for k in _voice_cache if k[0] == resolved]
+        for key in keys:
+            del _voice_cache[key]
+    
+    if keys:
+        logger.info(f"Unloaded {len(keys)} cached Piper voice(s)")
+    return len(keys)
+
+
+def voice_cache_stats() -> dict:
+    """Return hit/miss counters and the number of voices currently loaded."""
+    with _voice_cache_lock:
+        return {
+            'hits': _voice_cache_hits,
+            'misses': _voice_cache_misses,
+            'loaded': len(_voice_cache),
+        }
+
+
+def _resolve_voice_model_path() -> str:
+    """
+    Locate the .onnx voice model, downloading it if necessary.
+    
+    Returns:
+        Path to the voice model file
+    
+    Raises:
+        RuntimeError: If the model cannot be found or downloaded.
+    """
     # Get voice model path
     voice_model = settings.PIPER_VOICE_MODEL
     if settings.PIPER_VOICE_PATH:
@@ -123,91 +527,214 @@ def _generate_with_piper_package(text: str, output_path: str) -> None:
     
     # PiperVoice.load expects a path to .onnx model file
     # Try multiple locations: explicit path, current dir, or download if needed
-    model_path = None
     
     # If it's already a full path with .onnx extension, use it
     if voice_model.endswith('.onnx') and Path(voice_model).exists():
-        model_path = voice_model
+        return voice_model
     # If it's a path without extension, try adding .onnx
-    elif Path(voice_model).exists():
-        model_path = voice_model
+    if Path(voice_model).exists():
+        return voice_model
     # Try current directory with .onnx extension
-    elif Path(f"{voice_model}.onnx").exists():
-        model_path = f"{voice_model}.onnx"
+    if Path(f"{voice_model}.onnx").exists():
+        return f"{voice_model}.onnx"
     # Try in project root
-    elif (Path(settings.BASE_DIR) / f"{voice_model}.onnx").exists():
-        model_path = str(Path(settings.BASE_DIR) / f"{voice_model}.onnx")
-    else:
-        # Try downloading the voice model
-        logger.info(f"Voice model not found locally. Attempting to download '{voice_model}'...")
-        try:
-            import subprocess
-            result = subprocess.run(
-                ["python", "-m", "piper.download_voices", voice_model],
-                capture_output=True,
-                text=True,
-                timeout=120,
-                cwd=str(settings.BASE_DIR)
-            )
-            if result.returncode == 0:
-                # Model downloaded, try loading from current directory
-                if Path(f"{voice_model}.onnx").exists():
-                    model_path = f"{voice_model}.onnx"
-                elif (Path(settings.BASE_DIR) / f"{voice_model}.onnx").exists():
-                    model_path = str(Path(settings.BASE_DIR) / f"{voice_model}.onnx")
-                else:
-                    raise RuntimeError(f"Voice model downloaded but not found: {voice_model}")
-            else:
-                raise RuntimeError(f"Could not download voice model: {result.stderr}")
-        except Exception as e:
-            raise RuntimeError(
-                f"Could not load voice model '{voice_model}'. "
-                f"Please ensure the .onnx model file exists or set PIPER_VOICE_PATH to the full path. Error: {e}"
-            )
+    if (Path(settings.BASE_DIR) / f"{voice_model}.onnx").exists():
+        return str(Path(settings.BASE_DIR) / f"{voice_model}.onnx")
     
-    # Load the voice model
+    # Try downloading the voice model
+    logger.info(f"Voice model not found locally. Attempting to download '{voice_model}'...")
     try:
-        voice = piper.PiperVoice.load(model_path)
+        result = subprocess.run(
+            ["python", "-m", "piper.download_voices", voice_model],
+            capture_output=True,
+            text=True,
+            timeout=120,
+            cwd=str(settings.BASE_DIR)
+        )
+        if result.returncode == 0:
+            # Model downloaded, try loading from current directory
+            if Path(f"{voice_model}.onnx").exists():
+                return f"{voice_model}.onnx"
+            elif (Path(settings.BASE_DIR) / f"{voice_model}.onnx").exists():
+                return str(Path(settings.BASE_DIR) / f"{voice_model}.onnx")
+            else:
+                raise RuntimeError(f"Voice model downloaded but not found: {voice_model}")
+        else:
+            raise RuntimeError(f"Could not download voice model: {result.stderr}")
     except Exception as e:
-        raise RuntimeError(f"Failed to load voice model from '{model_path}': {e}")
-    
-    # Synthesize text to WAV file
-    with wave.open(output_path, "wb") as wav_file:
-        voice.synthesize_wav(text, wav_file)
+        raise RuntimeError(
+            f"Could not load voice model '{voice_model}'. "
+            f"Please ensure the .onnx model file exists or set PIPER_VOICE_PATH to the full path. Error: {e}"
+        )
 
 
 def _generate_with_piper_cli(text: str, output_path: str) -> None:
-    """Generate audio using piper command-line tool."""
+    """Generate audio using a persistent piper command-line co-process."""
     voice_model = settings.PIPER_VOICE_MODEL
     if settings.PIPER_VOICE_PATH:
         voice_model = settings.PIPER_VOICE_PATH
     
-    # Prepare piper command
-    # Format: echo "text" | piper --model <model> --output_file <output>
-    cmd = [
-        "piper",
-        "--model", voice_model,
-        "--output_file", output_path
-    ]
+    process = _acquire_piper_process(voice_model)
+    try:
+        process.synthesize(text, output_path)
+    finally:
+        _release_piper_process(process)
+
+
+class _PiperProcess:
+    """
+    A long-lived `piper --json-input` co-process.
     
-    # Run piper with text input
-    process = subprocess.Popen(
-        cmd,
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
-    )
+    Each request is one JSON line on stdin naming its own output file; piper
+    answers with the written path on stdout. The voice model is therefore
+    loaded once per co-process instead of once per stanza.
+    """
+    
+    def __init__(self, voice_model: str):
+        self.voice_model = voice_model
+        self.cmd = ["piper", "--model", voice_model, "--json-input"]
+        self.process: subprocess.Popen | None = None
+        self._stderr_tail: deque[str] = deque(maxlen=20)
+        self._replies: queue.Queue | None = None
     
-    stdout, stderr = process.communicate(input=text)
+    def start(self) -> None:
+        """Start the co-process. Raises FileNotFoundError if piper is not installed."""
+        logger.info(f"Starting piper co-process for model: {self.voice_model}")
+        self._stderr_tail.clear()
+        self.process = subprocess.Popen(
+            self.cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1
+        )
+        # piper logs to stderr; drain it so the pipe never fills up and blocks
+        threading.Thread(target=self._drain_stderr, args=(self.process,), daemon=True).start()
+        # Replies are read on a thread so synthesize() can wait with a deadline
+        self._replies = queue.Queue()
+        threading.Thread(target=self._read_replies, args=(self.process, self._replies), daemon=True).start()
+    
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
     
-    if process.returncode != 0:
+    def synthesize(self, text: str, output_path: str) -> None:
+        """
+        Synthesize text into output_path, restarting the co-process once if it has crashed.
+        
+        A co-process that stays silent for settings.PIPER_TIMEOUT_SECONDS is
+        killed and replaced, so a hung piper fails the stanza instead of
+        blocking the pipeline.
+        
+        Raises:
+            subprocess.CalledProcessError: If piper exits or fails to answer.
+            subprocess.TimeoutExpired: If piper does not answer in time.
+        """
+        request = json.dumps({"text": text, "output_file": str(Path(output_path).resolve())})
+        
+        for attempt in (1, 2):
+            if not self.is_alive():
+                if self.process is not None:
+                    logger.warning(f"piper co-process exited with code {self.process.returncode}; restarting")
+                self.start()
+            try:
+                self.process.stdin.write(request + "\n")
+                self.process.stdin.flush()
+                reply = self._replies.get(timeout=settings.PIPER_TIMEOUT_SECONDS)
+            except (BrokenPipeError, OSError):
+                reply = ""
+            except queue.Empty:
+                logger.error(f"piper co-process did not answer within {settings.PIPER_TIMEOUT_SECONDS}s; restarting")
+                stderr = "".join(self._stderr_tail)
+                self._kill()
+                self.start()
+                raise subprocess.TimeoutExpired(self.cmd, settings.PIPER_TIMEOUT_SECONDS, stderr=stderr)
+            if reply:
+                return
+            # EOF: piper died while handling this request
+            self._kill()
+        
         raise subprocess.CalledProcessError(
-            process.returncode,
-            cmd,
-            stdout,
-            stderr
+            self.process.returncode if self.process else -1,
+            self.cmd,
+            None,
+            "".join(self._stderr_tail)
         )
+    
+    def close(self) -> None:
+        """Close stdin so piper exits cleanly, killing it if it does not."""
+        if self.process is None:
+            return
+        try:
+            if self.process.stdin:
+                self.process.stdin.close()
+            self.process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self._kill()
+        self.process = None
+    
+    def _kill(self) -> None:
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+    
+    @staticmethod
+    def _read_replies(process: subprocess.Popen, replies: queue.Queue) -> None:
+        for line in process.stdout:
+            replies.put(line)
+        replies.put("")  # EOF
+    
+    def _drain_stderr(self, process: subprocess.Popen) -> None:
+        for line in process.stderr:
+            self._stderr_tail.append(line)
+
+
+# Pool of idle piper co-processes; grows to the peak number of concurrent callers
+_piper_idle: queue.SimpleQueue = queue.SimpleQueue()
+_piper_all: list[_PiperProcess] = []
+_piper_pool_lock = threading.Lock()
 
 
+def _acquire_piper_process(voice_model: str) -> _PiperProcess:
+    """Borrow an idle co-process for voice_model, starting a new one if none is free."""
+    while True:
+        try:
+            process = _piper_idle.get_nowait()
+        except queue.Empty:
+            break
+        if process.voice_model == voice_model:
+            return process
+        # Voice model changed since this co-process was started
+        process.close()
+        with _piper_pool_lock:
+            _piper_all.remove(process)
+    
+    process = _PiperProcess(voice_model)
+    process.start()
+    with _piper_pool_lock:
+        _piper_all.append(process)
+    return process
+
+
+def _release_piper_process(process: _PiperProcess) -> None:
+    """Return a borrowed co-process to the idle pool."""
+    _piper_idle.put(process)
+
+
+def shutdown_piper_workers() -> None:
+    """Stop every piper co-process. Registered with atexit; safe to call more than once."""
+    with _piper_pool_lock:
+        processes = list(_piper_all)
+        _piper_all.clear()
+    while True:
+        try:
+            _piper_idle.get_nowait()
+        except queue.Empty:
+            break
+    for process in processes:
+        process.close()
+    if processes:
+        logger.info(f"Stopped {len(processes)} piper co-process(es)")
+
 
+atexit.register(shutdown_piper_workers)
@@ -0,0 +1,91 @@
+"""Content-addressed on-disk cache of synthesized stanza audio.
+
+Usage:
+    python -m audio.tts_cache stats
+    python -m audio.tts_cache prune [--max-mb N]
+    python -m audio.tts_cache clear
+"""
+
+import argparse
+import logging
+from pathlib import Path
+import disk_cache
+import settings
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(text: str, voice_id, params: dict) -> str:
+    """
+    Build the cache key for one utterance.
+    
+    Args:
+        text: Stanza text (whitespace is normalized before hashing)
+        voice_id: Identity of the voice model (see audio.tts._voice_identity)
+        params: Synthesis parameters that affect the output audio
+    
+    Returns:
+        Hex cache key
+    """
+    normalized = ' '.join(text.split())
+    return disk_cache.content_key(normalized, voice_id, params)
+
+
+def entry_path(key: str) -> Path:
+    """Return the on-disk location of the cache entry for key."""
+    return settings.TTS_CACHE_DIR / key[:2] / f"{key}.{settings.OUTPUT_AUDIO_FORMAT}"
+
+
+def lookup(key: str) -> Path | None:
+    """Return the cached file for key (marking it recently used), or None on a miss."""
+    path = entry_path(key)
+    if not path.exists() or path.stat().st_size == 0:
+        return None
+    disk_cache.touch(path)
+    return path
+
+
+def store(key: str, audio_path: str) -> None:
+    """Add a freshly synthesized file to the cache. Failures are logged, not raised."""
+    try:
+        disk_cache.link_or_copy(Path(audio_path), entry_path(key))
+    except OSError as e:
+        logger.warning(f"Could not store {audio_path} in TTS cache: {e}")
+
+
+def prune(max_bytes: int | None = None) -> tuple[int, int]:
+    """Evict least recently used entries until the cache fits in max_bytes (default settings.TTS_CACHE_MAX_BYTES)."""
+    limit = settings.TTS_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    return disk_cache.prune(settings.TTS_CACHE_DIR, limit, f"*.{settings.OUTPUT_AUDIO_FORMAT}")
+
+
+def stats() -> dict:
+    """Return entry count and total size of the TTS cache."""
+    return disk_cache.stats(settings.TTS_CACHE_DIR, f"*.{settings.OUTPUT_AUDIO_FORMAT}")
+
+
+def main() -> None:
+    """Inspect or prune the TTS cache from the command line."""
+    parser = argparse.ArgumentParser(description="Inspect and prune the TTS audio cache")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="Show entry count and size")
+    prune_parser = sub.add_parser("prune", help="Evict least recently used entries")
+    prune_parser.add_argument("--max-mb", type=int, default=None, help="Size budget in MB (default: settings.TTS_CACHE_MAX_BYTES)")
+    sub.add_parser("clear", help="Remove every entry")
+    args = parser.parse_args()
+    
+    if args.command == "stats":
+        info = stats()
+        print(f"{info['directory']}: {info['entries']} entries, {info['bytes'] / (1024 * 1024):.1f}MB")
+    elif args.command == "prune":
+        max_bytes = args.max_mb * 1024 * 1024 if args.max_mb is not None else None
+        removed, freed = prune(max_bytes)
+        print(f"Removed {removed} entries ({freed / (1024 * 1024):.1f}MB)")
+    else:
+        removed, freed = prune(0)
+        print(f"Removed {removed} entries ({freed / (1024 * 1024):.1f}MB)")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1 @@
+"""Benchmarks for the poem short generator pipeline."""
@@ -0,0 +1,78 @@
+"""Compare the legacy offset-grid caption stroke against PIL's native stroker.
+
+Usage:
+    python -m benchmarks.caption_stroke [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from PIL import Image, ImageDraw
+
+# Allow running as a script from the project root
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import settings
+from video.video_maker import _layout_caption
+
+SAMPLE_STANZA = (
+    "Markets tremble as the rivers rise,\n"
+    "and quiet ministers weigh the cost of rain;\n"
+    "somewhere a harbor counts its empty ships."
+)
+
+
+def _draw_grid_stroke(font, placements, width: int) -> Image.Image:
+    """The original approach: one full text rasterization per (2w+1)^2 offset."""
+    img = Image.new('RGBA', (settings.VIDEO_WIDTH, settings.VIDEO_HEIGHT), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    for x, y, line in placements:
+        for adj in range(-width, width + 1):
+            for adj2 in range(-width, width + 1):
+                if adj != 0 or adj2 != 0:
+                    draw.text((x + adj, y + adj2), line, font=font, fill=settings.CAPTION_STROKE_COLOR + (255,))
+        draw.text((x, y), line, font=font, fill=settings.CAPTION_COLOR + (255,))
+    return img
+
+
+def _draw_native_stroke(font, placements, width: int) -> Image.Image:
+    """The current approach: FreeType strokes and fills each line in one pass."""
+    img = Image.new('RGBA', (settings.VIDEO_WIDTH, settings.VIDEO_HEIGHT), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    for x, y, line in placements:
+        draw.text(
+            (x, y), line, font=font,
+            fill=settings.CAPTION_COLOR + (255,),
+            stroke_width=width,
+            stroke_fill=settings.CAPTION_STROKE_COLOR + (255,)
+        )
+    return img
+
+
+def _time(func, repeat: int) -> float:
+    """Return the best wall time of repeat calls, in milliseconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Caption stroke rendering micro-benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions per width (best is reported)")
+    args = parser.parse_args()
+    
+    font, placements = _layout_caption(SAMPLE_STANZA)
+    
+    print(f"{'width':>5}  {'grid (ms)':>10}  {'native (ms)':>11}  {'speedup':>7}")
+    for width in range(1, 9):
+        grid_ms = _time(lambda: _draw_grid_stroke(font, placements, width), args.repeat)
+        native_ms = _time(lambda: _draw_native_stroke(font, placements, width), args.repeat)
+        print(f"{width:>5}  {grid_ms:>10.1f}  {native_ms:>11.1f}  {grid_ms / native_ms:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Compare encoder profiles by wall time and output size on a fixed fixture.
+
+The fixture is synthetic and deterministic: seeded noise-and-gradient
+backgrounds, fixed stanzas and sine-tone narration, so results only vary
+with the profile, the engine and the machine. Caches are redirected to a
+temporary directory and warmed by an untimed render, so the timings
+measure encoding rather than compositing.
+
+Usage:
+    python -m benchmarks.encoder_profiles [--engine segments] [--seconds 6] [--repeat 1]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Allow running as a script from the project root
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import settings
+from benchmarks.fixtures import make_backgrounds, sine_buffer
+from video.video_maker import build_video
+
+FIXTURE_STANZAS = [
+    "Markets tremble as the rivers rise,\nand quiet ministers weigh the cost of rain.",
+    "Somewhere a harbor counts its empty ships,\nwhile satellites keep watch above the storm.",
+    "The morning papers fold the world in half;\nwe read the creases, hoping for the light.",
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Encoder profile benchmark")
+    parser.add_argument("--engine", choices=["moviepy", "ffmpeg", "segments"], default=settings.VIDEO_ENGINE, help="Rendering engine")
+    parser.add_argument("--seconds", type=float, default=6.0, help="Narration length per stanza")
+    parser.add_argument("--repeat", type=int, default=1, help="Timed renders per profile (best is reported)")
+    parser.add_argument("--profiles", type=str, default=None, help="Comma-separated profiles (default: all)")
+    args = parser.parse_args()
+    
+    profiles = args.profiles.split(",") if args.profiles else list(settings.ENCODER_PROFILES)
+    settings.VIDEO_ENGINE = args.engine
+    
+    with tempfile.TemporaryDirectory(prefix="encoder_bench_") as tmp_dir:
+        tmp = Path(tmp_dir)
+        settings.FRAME_CACHE_DIR = tmp / "frames"
+        settings.BACKGROUND_STORE_DIR = tmp / "backgrounds"
+        backgrounds = make_backgrounds(tmp / "inputs", len(FIXTURE_STANZAS))
+        narration = [sine_buffer(args.seconds, 220 + 110 * i) for i in range(len(FIXTURE_STANZAS))]
+        
+        def render(profile: str, path: Path) -> float:
+            start = time.perf_counter()
+            build_video(
+                backgrounds, FIXTURE_STANZAS, str(path),
+                audio_buffers=narration, renditions=[], encoder_profile=profile
+            )
+            return time.perf_counter() - start
+        
+        # Untimed render to populate the background store and frame cache
+        render(profiles[0], tmp / "warmup.mp4")
+        
+        duration = args.seconds * len(FIXTURE_STANZAS)
+        print(f"engine={args.engine}  video={duration:.1f}s  {settings.VIDEO_WIDTH}x{settings.VIDEO_HEIGHT}")
+        print(f"{'profile':<12}  {'wall (s)':>8}  {'size (KiB)':>10}  {'kbit/s':>7}")
+        for profile in profiles:
+            output = tmp / f"{profile}.mp4"
+            wall = min(render(profile, output) for _ in range(args.repeat))
+            size = output.stat().st_size
+            print(f"{profile:<12}  {wall:>8.2f}  {size / 1024:>10.0f}  {size * 8 / 1000 / duration:>7.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""Deterministic offline fixtures shared by the benchmarks.
+
+Backgrounds are seeded noise over a gradient, narration is sine tones, and
+the OpenAI stub returns canned text shaped like real responses, so results
+depend only on the code under test and the machine.
+"""
+
+import asyncio
+import contextlib
+import functools
+import random
+import re
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+import numpy as np
+from PIL import Image
+
+import settings
+from audio import tts
+from audio.tts import AudioBuffer
+from poem import poem_writer, summarizer
+
+SAMPLE_RATE = 22050
+SECONDS_PER_WORD = 0.3  # Fake TTS speaking rate
+
+FAKE_SUMMARY = (
+    "Leaders met to negotiate a ceasefire as fighting displaced thousands. "
+    "Central banks held rates steady while inflation cooled in several economies. "
+    "Floods swept across river deltas, straining emergency services. "
+    "A major chipmaker announced new export restrictions. "
+    "Climate negotiators debated funding for vulnerable nations. "
+    "Shipping costs rose as a key canal faced drought. "
+    "Regulators proposed new rules for artificial intelligence."
+)
+FAKE_TITLE = "Ceasefire Talks, Floods And Chip Curbs"
+_POEM_WORDS = (
+    "harbor river market ember ledger quiet border signal storm grain silver "
+    "promise winter engine lantern treaty harvest distant echo thread"
+).split()
+
+
+def make_backgrounds(directory: Path, count: int) -> list[str]:
+    """Write count seeded noise-over-gradient backgrounds at the video size."""
+    directory.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(0)
+    height, width = settings.VIDEO_HEIGHT, settings.VIDEO_WIDTH
+    gradient = np.linspace(40, 200, height, dtype=np.float32)[:, None, None]
+    paths = []
+    for i in range(count):
+        noise = rng.normal(0, 25, (height, width, 3)).astype(np.float32)
+        tint = np.array([1.0, 0.6 + 0.4 * (i % 4) / 3, 0.6], dtype=np.float32)
+        image = np.clip(gradient * tint + noise, 0, 255).astype(np.uint8)
+        path = directory / f"background_{i}.png"
+        Image.fromarray(image).save(path)
+        paths.append(str(path))
+    return paths
+
+
+def sine_buffer(seconds: float, frequency: float = 220.0) -> AudioBuffer:
+    """Return a sine tone of exactly seconds length."""
+    t = np.arange(int(round(seconds * SAMPLE_RATE))) / SAMPLE_RATE
+    return AudioBuffer((np.sin(2 * np.pi * frequency * t) * 8000).astype(np.int16), SAMPLE_RATE)
+
+
+def fake_stanzas(count: int) -> list[str]:
+    """Return count deterministic 2-3 line stanzas."""
+    stanzas = []
+    for i in range(count):
+        rng = random.Random(i)
+        lines = [" ".join(rng.choice(_POEM_WORDS) for _ in range(6)).capitalize() for _ in range(2 + i % 2)]
+        stanzas.append("\n".join(lines))
+    return stanzas
+
+
+def _fake_completion(messages: list[dict]) -> str:
+    """Answer a summarizer, poem or title prompt with canned text of the right shape."""
+    system = messages[0]["content"].lower()
+    prompt = messages[-1]["content"]
+    if "poet" in system:
+        match = re.search(r"into a (\d+)-stanza poem", prompt)
+        return "\n\n".join(fake_stanzas(int(match.group(1)) if match else 7))
+    if "title" in system:
+        return FAKE_TITLE
+    return FAKE_SUMMARY
+
+
+class FakeOpenAI:
+    """Stand-in for openai.OpenAI that answers chat completions offline."""
+    
+    def __init__(self, *args, latency: float = 0.0, **kwargs):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=functools.partial(self._create, latency)))
+    
+    @staticmethod
+    def _create(latency: float, messages: list[dict], **kwargs):
+        if latency:
+            time.sleep(latency)
+        message = SimpleNamespace(role="assistant", content=_fake_completion(messages))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+
+class FakeAsyncOpenAI:
+    """Stand-in for openai.AsyncOpenAI that answers chat completions offline."""
+    
+    def __init__(self, *args, latency: float = 0.0, **kwargs):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=functools.partial(self._create, latency)))
+    
+    @staticmethod
+    async def _create(latency: float, messages: list[dict], stream: bool = False, **kwargs):
+        if stream:
+            return _FakeStream(_fake_completion(messages), latency)
+        if latency:
+            await asyncio.sleep(latency)
+        return FakeOpenAI._create(0.0, messages, **kwargs)
+
+
+class _FakeStream:
+    """Async chat completion stream that emits one word per chunk, spreading latency across them."""
+    
+    def __init__(self, text: str, latency: float):
+        self.pieces = re.findall(r"\s*\S+", text)
+        self.delay = latency / max(1, len(self.pieces))
+    
+    async def __aiter__(self):
+        for piece in self.pieces:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            delta = SimpleNamespace(role="assistant", content=piece)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason=None)])
+    
+    async def close(self) -> None:
+        pass
+
+
+def _fake_tts(text: str, output_path: str | None = None) -> AudioBuffer:
+    """Deterministic replacement for tts._generate_audio_with_piper: a sine tone sized by word count."""
+    words = len(text.split())
+    buffer = sine_buffer(max(1, words) * SECONDS_PER_WORD, 180 + 20 * (words % 10))
+    if output_path:
+        tts.write_wav(buffer, output_path)
+    return buffer
+
+
+@contextlib.contextmanager
+def offline_pipeline(cache_dir: Path, llm_latency: float = 0.0):
+    """
+    Patch the pipeline to run without network access or a Piper voice.
+    
+    The poem package's shared OpenAI clients are replaced by FakeOpenAI and
+    FakeAsyncOpenAI, Piper by sine-tone synthesis, and every on-disk cache
+    is redirected into cache_dir so each run starts cold.
+    
+    Args:
+        cache_dir: Directory for the TTS, frame, background and LLM caches
+        llm_latency: Simulated seconds per chat completion
+    """
+    client = FakeOpenAI(latency=llm_latency)
+    async_client = FakeAsyncOpenAI(latency=llm_latency)
+    with contextlib.ExitStack() as stack:
+        for module in (summarizer, poem_writer):
+            stack.enter_context(mock.patch.object(module, "get_client", lambda: client))
+            stack.enter_context(mock.patch.object(module, "get_async_client", lambda: async_client))
+        stack.enter_context(mock.patch.object(tts, "_generate_audio_with_piper", _fake_tts))
+        stack.enter_context(mock.patch.object(tts, "_voice_identity", lambda: ["benchmark-sine"]))
+        stack.enter_context(mock.patch.object(tts, "_piper_package_available", lambda: False))
+        for name, value in (
+            ("OPENAI_API_KEY", settings.OPENAI_API_KEY or "offline-benchmark"),
+            ("TTS_CACHE_DIR", cache_dir / "tts"),
+            ("FRAME_CACHE_DIR", cache_dir / "frames"),
+            ("BACKGROUND_STORE_DIR", cache_dir / "backgrounds"),
+            ("LLM_CACHE_PATH", cache_dir / "llm.sqlite3"),
+        ):
+            stack.enter_context(mock.patch.object(settings, name, value))
+        yield
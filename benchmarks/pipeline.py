@@ -0,0 +1,170 @@
+"""End-to-end pipeline benchmark that runs main.py fully offline.
+
+OpenAI and Piper are replaced by the deterministic stubs in
+benchmarks.fixtures, backgrounds are generated, and every cache starts
+cold. Each stage's wall and CPU time comes from the run's metrics.json
+(see instrumentation), at several stanza counts, and the results are
+written as JSON so releases can be compared.
+
+Usage:
+    python -m benchmarks.pipeline [--stanzas 3,7,15,30] [--repeat 1] [--stream-stanzas] [--output pipeline_benchmark.json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+# Allow running as a script from the project root
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import instrumentation
+import main as pipeline_main
+import settings
+from benchmarks.fixtures import make_backgrounds, offline_pipeline
+
+TOP_LEVEL_STAGES = ("summarizer", "poem_writer", "summarizer.title", "tts", "video")
+
+
+def run_once(stanza_count: int, work_dir: Path, backgrounds_dir: Path, args: argparse.Namespace) -> dict:
+    """
+    Run main.py once offline and return its timings.
+    
+    Returns:
+        Dict with total wall time, per-stage totals, video length and output size
+    """
+    output_dir = work_dir / "output"
+    argv = [
+        "main.py", "--stanzas", str(stanza_count),
+        "--output-dir", str(output_dir), "--backgrounds", str(backgrounds_dir),
+        *(["--tts-workers", str(args.tts_workers)] if args.tts_workers else []),
+        *(["--encoder-profile", args.encoder_profile] if args.encoder_profile else []),
+        *(["--stream-stanzas"] if args.stream_stanzas else []),
+    ]
+    # Same background choice on every run
+    random.seed(stanza_count)
+    
+    start = time.perf_counter()
+    with offline_pipeline(work_dir / "cache", llm_latency=args.llm_latency), mock.patch.object(sys, "argv", argv):
+        pipeline_main.main()
+    wall = time.perf_counter() - start
+    
+    run_dir = next(output_dir.iterdir())
+    metrics = instrumentation.load_metrics(run_dir)
+    video = min(run_dir.glob(f"*.{settings.OUTPUT_VIDEO_FORMAT}"), key=lambda f: len(f.stem))
+    video_seconds = sum(
+        record["labels"].get("audio_seconds", 0) for record in metrics["stages"] if record["stage"] == "tts.stanza"
+    )
+    return {
+        "wall_seconds": round(wall, 6),
+        "video_seconds": round(video_seconds, 3),
+        "output_bytes": video.stat().st_size,
+        "peak_rss_bytes": metrics["peak_rss_bytes"],
+        "stages": metrics["summary"],
+    }
+
+
+def summarize_runs(stanza_count: int, runs: list[dict]) -> dict:
+    """Reduce repeated runs at one stanza count to medians and throughput."""
+    wall = statistics.median(run["wall_seconds"] for run in runs)
+    video_seconds = runs[0]["video_seconds"]
+    stages = {}
+    for name in sorted({name for run in runs for name in run["stages"]}):
+        totals = [run["stages"][name] for run in runs if name in run["stages"]]
+        stages[name] = {
+            "wall_seconds": round(statistics.median(t["wall_seconds"] for t in totals), 6),
+            "cpu_seconds": round(statistics.median(t["cpu_seconds"] + t["child_cpu_seconds"] for t in totals), 6),
+            "bytes_written": int(statistics.median(t["bytes_written"] for t in totals)),
+        }
+    return {
+        "stanzas": stanza_count,
+        "wall_seconds": round(wall, 6),
+        "video_seconds": video_seconds,
+        "stanzas_per_second": round(stanza_count / wall, 4),
+        "realtime_factor": round(video_seconds / wall, 4),
+        "output_bytes": runs[0]["output_bytes"],
+        "stages": stages,
+        "runs": runs,
+    }
+
+
+def _git_revision() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=Path(__file__).parent.parent, timeout=10
+        )
+        return result.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline end-to-end pipeline benchmark")
+    parser.add_argument("--stanzas", type=str, default="3,7,15,30", help="Comma-separated stanza counts")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per stanza count (medians are reported)")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="Simulated seconds per OpenAI call")
+    parser.add_argument("--tts-workers", type=int, default=None, help="Passed through to main.py")
+    parser.add_argument("--encoder-profile", type=str, default=None, help="Passed through to main.py")
+    parser.add_argument("--stream-stanzas", action="store_true", help="Passed through to main.py")
+    parser.add_argument("--output", type=str, default="pipeline_benchmark.json", help="JSON results file")
+    args = parser.parse_args()
+    
+    # Keep the pipeline's own progress logging out of the report
+    logging.getLogger().setLevel(logging.WARNING)
+    
+    stanza_counts = [int(n) for n in args.stanzas.split(",")]
+    results = []
+    with tempfile.TemporaryDirectory(prefix="pipeline_bench_") as tmp_dir:
+        tmp = Path(tmp_dir)
+        backgrounds_dir = tmp / "backgrounds"
+        make_backgrounds(backgrounds_dir, 8)
+        
+        for stanza_count in stanza_counts:
+            runs = []
+            for attempt in range(args.repeat):
+                work_dir = tmp / f"run_{stanza_count}_{attempt}"
+                runs.append(run_once(stanza_count, work_dir, backgrounds_dir, args))
+            results.append(summarize_runs(stanza_count, runs))
+            
+            result = results[-1]
+            stage_text = "  ".join(
+                f"{name}={result['stages'][name]['wall_seconds']:.2f}s"
+                for name in TOP_LEVEL_STAGES if name in result["stages"]
+            )
+            print(f"{stanza_count:>3} stanzas: {result['wall_seconds']:.2f}s total  {stage_text}")
+    
+    report = {
+        "benchmark": "pipeline",
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "config": {
+            "video_engine": settings.VIDEO_ENGINE,
+            "encoder_profile": args.encoder_profile or settings.ENCODER_PROFILE,
+            "tts_workers": args.tts_workers or settings.TTS_WORKERS,
+            "stream_stanzas": args.stream_stanzas or settings.STREAM_STANZAS,
+            "llm_latency": args.llm_latency,
+            "repeat": args.repeat,
+            "resolution": f"{settings.VIDEO_WIDTH}x{settings.VIDEO_HEIGHT}",
+        },
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2), encoding='utf-8')
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
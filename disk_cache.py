@@ -0,0 +1,113 @@
+"""Helpers for the size-bounded, content-addressed file caches under settings.CACHE_DIR."""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def content_key(*parts) -> str:
+    """
+    Hash arbitrary JSON-serializable parts into a stable hex cache key.
+    
+    Args:
+        *parts: Values identifying the cached content (text, settings, file identities...)
+    
+    Returns:
+        SHA-256 hex digest
+    """
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def file_identity(path: str | Path) -> list:
+    """Return a cheap identity for a file (resolved path, size, mtime) for use in cache keys."""
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    return [str(resolved), stat.st_size, stat.st_mtime_ns]
+
+
+def touch(path: Path) -> None:
+    """Mark a cache entry as recently used (LRU order is tracked via mtime)."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def link_or_copy(src: Path, dest: Path) -> None:
+    """
+    Place src at dest, preferring a hardlink and falling back to a copy.
+    
+    The file is staged next to dest under a per-process, per-thread name and
+    renamed into place, so readers never see a partially written file and
+    concurrent writers of the same entry don't collide.
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        try:
+            os.link(src, tmp)
+        except OSError:
+            shutil.copy2(src, tmp)
+        os.replace(tmp, dest)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def entries(directory: Path, pattern: str = "*") -> list[Path]:
+    """Return cache entry files in directory, least recently used first."""
+    if not directory.exists():
+        return []
+    files = [f for f in directory.rglob(pattern) if f.is_file() and not f.name.startswith('.')]
+    return sorted(files, key=lambda f: f.stat().st_mtime)
+
+
+def stats(directory: Path, pattern: str = "*") -> dict:
+    """Return the number of entries and total size in bytes of a cache directory."""
+    files = entries(directory, pattern)
+    return {
+        'directory': str(directory),
+        'entries': len(files),
+        'bytes': sum(f.stat().st_size for f in files),
+    }
+
+
+def prune(directory: Path, max_bytes: int, pattern: str = "*") -> tuple[int, int]:
+    """
+    Evict least recently used entries until the cache fits in max_bytes.
+    
+    Args:
+        directory: Cache directory
+        max_bytes: Size budget in bytes (0 removes everything)
+        pattern: Glob pattern selecting entry files
+    
+    Returns:
+        Tuple of (entries removed, bytes freed)
+    """
+    files = entries(directory, pattern)
+    total = sum(f.stat().st_size for f in files)
+    removed = 0
+    freed = 0
+    
+    for f in files:
+        if total <= max_bytes:
+            break
+        size = f.stat().st_size
+        try:
+            f.unlink()
+        except OSError as e:
+            logger.warning(f"Could not evict cache entry {f}: {e}")
+            continue
+        total -= size
+        freed += size
+        removed += 1
+    
+    if removed:
+        logger.info(f"Evicted {removed} entries ({freed // 1024}KB) from {directory}")
+    return removed, freed
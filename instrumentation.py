@@ -0,0 +1,397 @@
+"""Lightweight stage instrumentation: wall time, CPU time, peak RSS and bytes written.
+
+Pipeline modules wrap their work in stage() (or decorate it with
+instrumented()). main.py and the web app bracket each generation with
+start_run()/finish_run(), which writes every stage record to metrics.json
+in the run's output directory. Stages entered while no run is active are
+still measured but not kept, so library callers pay only a few clock reads.
+
+The active run lives in a context variable, so generations running
+concurrently on different threads or asyncio tasks each collect their own
+records. asyncio tasks and asyncio.to_thread() inherit it; work submitted to
+a thread pool directly must carry it along with contextvars.copy_context().
+
+Usage:
+    python -m instrumentation output/*/metrics.json
+"""
+
+import argparse
+import contextlib
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+METRICS_FILENAME = "metrics.json"
+
+_active_run: contextvars.ContextVar["RunMetrics | None"] = contextvars.ContextVar("instrumentation_run", default=None)
+_listeners: list = []
+_thread_stages: dict[int, list[str]] = {}  # Open stage names per thread, outermost first
+
+
+class Stage:
+    """Handle for a stage in progress; lets the caller attach output sizes and labels."""
+    
+    def __init__(self, name: str, labels: dict):
+        self.name = name
+        self.labels = labels
+        self.bytes_written = 0
+        self.record: dict | None = None  # Filled in when the stage ends
+    
+    def add_bytes(self, count: int) -> None:
+        """Count bytes this stage wrote (e.g. an in-memory buffer it persisted)."""
+        self.bytes_written += int(count)
+    
+    def add_output(self, path: str | Path) -> None:
+        """Count the size of a file this stage wrote."""
+        try:
+            self.bytes_written += Path(path).stat().st_size
+        except OSError:
+            pass
+
+
+class RunMetrics:
+    """Stage records collected during one pipeline run."""
+    
+    def __init__(self, **info):
+        self.info = info
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self._start = time.perf_counter()
+        self._records: list[dict] = []
+        self._lock = threading.Lock()
+    
+    def add(self, record: dict) -> None:
+        """Append a finished stage record."""
+        with self._lock:
+            self._records.append(record)
+    
+    @property
+    def records(self) -> list[dict]:
+        """Stage records in completion order."""
+        with self._lock:
+            return list(self._records)
+    
+    def elapsed(self) -> float:
+        """Seconds since the run started."""
+        return time.perf_counter() - self._start
+    
+    def to_dict(self) -> dict:
+        """Return the run's metrics as a JSON-serializable dict."""
+        records = self.records
+        usage = _resource_usage()
+        return {
+            "started_at": self.started_at,
+            "wall_seconds": round(self.elapsed(), 6),
+            "peak_rss_bytes": usage["peak_rss_bytes"],
+            "child_peak_rss_bytes": usage["child_peak_rss_bytes"],
+            "info": self.info,
+            "stages": records,
+            "summary": summarize(records),
+        }
+    
+    def write(self, path: str | Path) -> Path:
+        """Write the metrics to path as JSON (atomically) and return the path."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self.to_dict(), indent=2, default=str), encoding='utf-8')
+        os.replace(tmp, path)
+        return path
+
+
+def start_run(**info) -> RunMetrics:
+    """
+    Start collecting stage records for a pipeline run in the current context.
+    
+    Args:
+        **info: Run parameters to store alongside the records (tone, model...)
+    
+    Returns:
+        The active RunMetrics
+    """
+    if _active_run.get() is not None:
+        logger.warning("Starting a new metrics run while another is active; the previous one is discarded")
+    run = RunMetrics(**info)
+    _active_run.set(run)
+    return run
+
+
+def finish_run(output_dir: str | Path | None = None) -> dict | None:
+    """
+    Stop collecting and optionally write metrics.json into output_dir.
+    
+    Args:
+        output_dir: Run output directory (None to skip writing)
+    
+    Returns:
+        The run's metrics dict, or None if no run was active
+    """
+    run = _active_run.get()
+    _active_run.set(None)
+    if run is None:
+        return None
+    
+    metrics = run.to_dict()
+    if output_dir is not None:
+        try:
+            path = run.write(Path(output_dir) / METRICS_FILENAME)
+            logger.info(f"Metrics saved to: {path}")
+        except OSError as e:
+            logger.warning(f"Could not write metrics: {e}")
+    return metrics
+
+
+def current_run() -> RunMetrics | None:
+    """Return the current context's active run, if any."""
+    return _active_run.get()
+
+
+def add_record(record: dict | None) -> None:
+    """Add a record measured elsewhere (e.g. returned by a worker process) to the active run."""
+    run = _active_run.get()
+    if run is not None and record is not None:
+        run.add(record)
+        _notify(record)
+
+
+def active_stages(thread_id: int | None = None) -> list[str]:
+    """Return the names of the stages open on a thread (default: the calling thread), outermost first."""
+    return list(_thread_stages.get(thread_id if thread_id is not None else threading.get_ident(), ()))
+
+
+def add_listener(callback) -> None:
+    """
+    Call callback(record) for every stage that finishes inside a run.
+    
+    Listeners run on the thread that finished the stage, so they should be
+    cheap (e.g. updating in-process counters); their exceptions are logged
+    and otherwise ignored.
+    """
+    if callback not in _listeners:
+        _listeners.append(callback)
+
+
+def _notify(record: dict) -> None:
+    for callback in list(_listeners):
+        try:
+            callback(record)
+        except Exception as e:
+            logger.debug(f"Metrics listener {callback!r} failed: {e}")
+
+
+@contextlib.contextmanager
+def stage(name: str, **labels) -> Iterator[Stage]:
+    """
+    Measure a block of work as a named stage.
+    
+    cpu_seconds is the whole process's CPU time over the block (it includes
+    other threads working concurrently); thread_cpu_seconds covers only the
+    calling thread. child_cpu_seconds counts subprocesses (e.g. ffmpeg) that
+    finished during the block. Peak RSS is the process high-water mark when
+    the block ends.
+    
+    Args:
+        name: Stage name, dotted for sub-stages (e.g. "tts.stanza")
+        **labels: JSON-serializable labels (e.g. stanza=3)
+    
+    Yields:
+        Stage handle for recording bytes written and extra labels
+    """
+    handle = Stage(name, labels)
+    run = _active_run.get()
+    thread_id = threading.get_ident()
+    open_stages = _thread_stages.setdefault(thread_id, [])
+    open_stages.append(name)
+    started = run.elapsed() if run is not None else 0.0
+    before = _resource_usage()
+    wall_start = time.perf_counter()
+    thread_start = time.thread_time()
+    status = "ok"
+    try:
+        yield handle
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        # Coroutines sharing a thread can finish their stages out of order
+        del open_stages[len(open_stages) - 1 - open_stages[::-1].index(name)]
+        if not open_stages:
+            _thread_stages.pop(thread_id, None)
+        wall = time.perf_counter() - wall_start
+        thread_cpu = time.thread_time() - thread_start
+        after = _resource_usage()
+        handle.record = {
+            "stage": name,
+            "labels": handle.labels,
+            "status": status,
+            "started_seconds": round(started, 6),
+            "wall_seconds": round(wall, 6),
+            "cpu_seconds": round(after["cpu_seconds"] - before["cpu_seconds"], 6),
+            "thread_cpu_seconds": round(thread_cpu, 6),
+            "child_cpu_seconds": round(after["child_cpu_seconds"] - before["child_cpu_seconds"], 6),
+            "peak_rss_bytes": after["peak_rss_bytes"],
+            "bytes_written": handle.bytes_written,
+        }
+        if run is not None:
+            run.add(handle.record)
+            _notify(handle.record)
+
+
+def instrumented(name: str):
+    """Decorator that runs the wrapped function (or coroutine function) inside stage(name)."""
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with stage(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _resource_usage() -> dict:
+    """Return process and child CPU seconds and peak RSS in bytes."""
+    if resource is None:
+        return {"cpu_seconds": time.process_time(), "child_cpu_seconds": 0.0, "peak_rss_bytes": 0, "child_peak_rss_bytes": 0}
+    
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    rss_unit = 1 if sys.platform == "darwin" else 1024
+    return {
+        "cpu_seconds": own.ru_utime + own.ru_stime,
+        "child_cpu_seconds": children.ru_utime + children.ru_stime,
+        "peak_rss_bytes": own.ru_maxrss * rss_unit,
+        "child_peak_rss_bytes": children.ru_maxrss * rss_unit,
+    }
+
+
+def summarize(records: list[dict]) -> dict[str, dict]:
+    """
+    Total the records of one run per stage name.
+    
+    Returns:
+        Mapping of stage name to count, errors, wall/CPU totals, max wall,
+        max peak RSS and total bytes written
+    """
+    summary: dict[str, dict] = {}
+    for record in records:
+        entry = summary.setdefault(record["stage"], {
+            "count": 0, "errors": 0, "wall_seconds": 0.0, "max_wall_seconds": 0.0,
+            "cpu_seconds": 0.0, "child_cpu_seconds": 0.0, "peak_rss_bytes": 0, "bytes_written": 0,
+        })
+        entry["count"] += 1
+        entry["errors"] += record.get("status") == "error"
+        entry["wall_seconds"] += record["wall_seconds"]
+        entry["max_wall_seconds"] = max(entry["max_wall_seconds"], record["wall_seconds"])
+        entry["cpu_seconds"] += record["cpu_seconds"]
+        entry["child_cpu_seconds"] += record["child_cpu_seconds"]
+        entry["peak_rss_bytes"] = max(entry["peak_rss_bytes"], record["peak_rss_bytes"])
+        entry["bytes_written"] += record["bytes_written"]
+    for entry in summary.values():
+        for key in ("wall_seconds", "max_wall_seconds", "cpu_seconds", "child_cpu_seconds"):
+            entry[key] = round(entry[key], 6)
+    return summary
+
+
+def load_metrics(path: str | Path) -> dict:
+    """Load a metrics.json file (or a run directory containing one)."""
+    path = Path(path)
+    if path.is_dir():
+        path = path / METRICS_FILENAME
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def aggregate(runs: list[dict]) -> dict[str, dict]:
+    """
+    Aggregate per-stage totals across several runs' metrics.
+    
+    Each run contributes its per-stage totals (e.g. all tts.stanza records
+    summed), so percentiles describe whole runs rather than single stanzas.
+    
+    Args:
+        runs: Metrics dicts as returned by finish_run() or load_metrics()
+    
+    Returns:
+        Mapping of stage name to runs, mean/p50/p95/max wall seconds, mean
+        CPU seconds, max peak RSS and mean bytes written
+    """
+    per_stage: dict[str, list[dict]] = {}
+    for run in runs:
+        for name, totals in (run.get("summary") or summarize(run.get("stages", []))).items():
+            per_stage.setdefault(name, []).append(totals)
+    
+    result = {}
+    for name, totals in sorted(per_stage.items()):
+        walls = sorted(t["wall_seconds"] for t in totals)
+        result[name] = {
+            "runs": len(totals),
+            "mean_wall_seconds": round(sum(walls) / len(walls), 6),
+            "p50_wall_seconds": _percentile(walls, 50),
+            "p95_wall_seconds": _percentile(walls, 95),
+            "max_wall_seconds": walls[-1],
+            "mean_cpu_seconds": round(sum(t["cpu_seconds"] + t["child_cpu_seconds"] for t in totals) / len(totals), 6),
+            "max_peak_rss_bytes": max(t["peak_rss_bytes"] for t in totals),
+            "mean_bytes_written": round(sum(t["bytes_written"] for t in totals) / len(totals)),
+        }
+    return result
+
+
+def _percentile(sorted_values: list[float], percent: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Aggregate pipeline metrics.json files")
+    parser.add_argument("paths", nargs="+", help="metrics.json files or run directories")
+    parser.add_argument("--json", action="store_true", help="Print the aggregate as JSON")
+    args = parser.parse_args()
+    
+    runs = []
+    for path in args.paths:
+        try:
+            runs.append(load_metrics(path))
+        except (OSError, ValueError) as e:
+            print(f"Skipping {path}: {e}", file=sys.stderr)
+    if not runs:
+        sys.exit("No metrics found")
+    
+    result = aggregate(runs)
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    
+    print(f"{len(runs)} run(s)")
+    print(f"{'stage':<20}  {'runs':>4}  {'mean (s)':>8}  {'p95 (s)':>8}  {'cpu (s)':>8}  {'peak RSS (MB)':>13}  {'written (MB)':>12}")
+    for name, stats in result.items():
+        print(
+            f"{name:<20}  {stats['runs']:>4}  {stats['mean_wall_seconds']:>8.2f}  {stats['p95_wall_seconds']:>8.2f}  "
+            f"{stats['mean_cpu_seconds']:>8.2f}  {stats['max_peak_rss_bytes'] / 1e6:>13.1f}  {stats['mean_bytes_written'] / 1e6:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,23 @@
 """Main entry point for the poem short generator pipeline."""
 
 import argparse
+import asyncio
 import logging
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Awaitable
 import random
 import re
 
-from poem.summarizer import get_world_news_summary, generate_short_title
-from poem.poem_writer import make_stanzas
-from audio.tts import generate_audio_files
+from poem.summarizer import aget_world_news_summary, agenerate_short_title
+from poem.poem_writer import amake_stanzas, astream_stanzas
+from poem import llm_cache
+from poem.client import aclose_client
+from audio.tts import agenerate_audio_buffers, generate_audio_buffers
 from video.video_maker import build_video
+import instrumentation
+import profiling
 import settings
 
 # Configure logging
@@ -30,11 +36,18 @@ logger = logging.getLogger(__name__)
 def main() -> None:
     """Main entry point orchestrating the pipeline."""
     args = _parse_args()
+    if args.no_llm_cache:
+        llm_cache.set_mode("off")
+    elif args.refresh_llm_cache:
+        llm_cache.set_mode("refresh")
     openai_model = args.model or settings.OPENAI_MODEL
-    tone = args.tone
-    backgrounds_override = args.backgrounds
     base_output_dir = Path(args.output_dir) if args.output_dir else settings.OUTPUT_BASE_DIR
-    stanza_count = args.stanzas
+    output_dir = None
+    instrumentation.start_run(
+        tone=args.tone, model=openai_model, stanzas=args.stanzas, engine=settings.VIDEO_ENGINE,
+        preview=args.preview, from_run=args.from_run
+    )
+    profiler = profiling.Profiler().start() if args.profile else None
     try:
         logger.info("=" * 60)
         logger.info("Starting Poem Short Generator Pipeline")
@@ -45,74 +58,211 @@ def main() -> None:
         output_dir = base_output_dir / timestamp
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        audio_dir = output_dir / "audio"
-        audio_dir.mkdir(exist_ok=True)
-        
         logger.info(f"Output directory: {output_dir}")
         
+        final_video_path = asyncio.run(_close_clients_after(run_pipeline(
+            output_dir,
+            tone=args.tone,
+            model=openai_model,
+            stanza_count=args.stanzas,
+            backgrounds_dir=args.backgrounds,
+            tts_workers=args.tts_workers,
+            preview=args.preview,
+            renditions=args.renditions.split(",") if args.renditions else None,
+            encoder_profile=args.encoder_profile,
+            from_run=Path(args.from_run) if args.from_run else None,
+            stream_stanzas=args.stream_stanzas or settings.STREAM_STANZAS
+        )))
+        
+        logger.info("\n" + "=" * 60)
+        logger.info("Pipeline completed successfully!")
+        logger.info("=" * 60)
+        logger.info(f"Final video: {final_video_path}")
+        logger.info(f"All outputs saved to: {output_dir}")
+        if args.preview:
+            logger.info(f"Render at full quality with: python main.py --from-run {output_dir}")
+        
+    except KeyboardInterrupt:
+        logger.warning("\nPipeline interrupted by user.")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"\nPipeline failed with error: {e}", exc_info=True)
+        sys.exit(1)
+    finally:
+        if profiler is not None:
+            profiler.stop(output_dir)
+        metrics = instrumentation.finish_run(output_dir)
+        if metrics:
+            for name, totals in metrics["summary"].items():
+                if "." not in name:
+                    logger.info(
+                        f"Stage {name}: {totals['wall_seconds']:.1f}s wall, "
+                        f"{totals['cpu_seconds'] + totals['child_cpu_seconds']:.1f}s CPU"
+                    )
+
+
+async def run_pipeline(
+    output_dir: Path,
+    tone: str = "poetic insight",
+    model: str | None = None,
+    stanza_count: int = 7,
+    backgrounds_dir: str | None = None,
+    tts_workers: int | None = None,
+    preview: bool = False,
+    renditions: list[str] | None = None,
+    encoder_profile: str | None = None,
+    from_run: Path | None = None,
+    stream_stanzas: bool = False,
+) -> str:
+    """
+    Generate one video into output_dir on the running event loop.
+    
+    OpenAI calls go through the async client and only hold the loop while
+    waiting, so many generations can share one loop. The title is requested
+    alongside the stanzas and awaited only for the video filename. TTS and
+    video rendering are blocking and CPU-bound, so they run in worker threads
+    (asyncio.to_thread) through profiling.run_profiled(), which keeps them in
+    an active --profile run. Stages are measured with instrumentation; wrap
+    the call in start_run()/finish_run() to collect them into metrics.json. The
+    metrics run and llm_cache.set_mode() are context-local, so concurrent
+    generations should each set them inside their own task.
+    
+    Args:
+        output_dir: Existing directory for this run's outputs, named YYYYmmdd_HHMMSS (its date prefixes the video filename)
+        tone: Tone/style for the poem
+        model: OpenAI model (defaults to settings.OPENAI_MODEL)
+        stanza_count: Number of stanzas/slides to generate
+        backgrounds_dir: Background image directory (defaults to settings.ASSETS_BACKGROUNDS_DIR)
+        tts_workers: Stanzas to synthesize concurrently (defaults to settings.TTS_WORKERS)
+        preview: Render a fast low-resolution preview
+        renditions: Extra rendition names from settings.VIDEO_RENDITION_PRESETS
+        encoder_profile: Encoder profile name from settings.ENCODER_PROFILES
+        from_run: Earlier run directory whose summary, stanzas and title are reused instead of calling OpenAI
+        stream_stanzas: Stream the poem and synthesize each stanza as soon as it is written
+    
+    Returns:
+        Path to the rendered video
+    
+    Raises:
+        RuntimeError: If no background images are available.
+    """
+    output_dir = Path(output_dir)
+    audio_dir = output_dir / "audio"
+    
+    previous_backgrounds = None
+    audio_buffers = None
+    title_task: asyncio.Task | None = None
+    if from_run:
+        # Re-render an earlier run (e.g. a preview) without calling OpenAI again
+        logger.info(f"\n[Steps 1-2/4] Reusing summary, stanzas and title from {from_run}")
+        summary, stanzas, safe_title, previous_backgrounds = _load_previous_run(from_run)
+        _save_summary(output_dir, summary)
+    else:
         # Step 1: Generate world news summary
         logger.info("\n[Step 1/4] Generating world news summary...")
-        summary = get_world_news_summary(model=openai_model)
+        summary = await aget_world_news_summary(model=model)
+        # Saved right away so a run that fails later still keeps it
+        _save_summary(output_dir, summary)
         
-        # Save summary
-        summary_path = output_dir / "summary.txt"
-        summary_path.write_text(summary, encoding='utf-8')
-        logger.info(f"Summary saved to: {summary_path}")
-        
-        # Step 2: Convert summary to poem stanzas
+        # Step 2: Convert summary to poem stanzas while the title is generated alongside;
+        # the title is only needed for the video filename, so TTS doesn't wait for it
         logger.info("\n[Step 2/4] Converting summary to poem stanzas...")
-        stanzas = make_stanzas(summary, tone=tone, model=openai_model, stanza_count=stanza_count)
-        
+        title_task = asyncio.create_task(agenerate_short_title(summary, model=model))
+        try:
+            if stream_stanzas:
+                # Steps 2 and 3 overlap: TTS starts on stanza 1 while the rest are still being written
+                logger.info("\n[Step 3/4] Generating audio files as stanzas arrive...")
+                stanzas = []
+                
+                async def collect_stanzas():
+                    async for stanza in astream_stanzas(summary, tone=tone, model=model, stanza_count=stanza_count):
+                        stanzas.append(stanza)
+                        yield stanza
+                
+                audio_buffers = await agenerate_audio_buffers(
+                    collect_stanzas(),
+                    output_dir=str(audio_dir) if settings.SAVE_AUDIO_FILES else None,
+                    workers=tts_workers or settings.TTS_WORKERS
+                )
+            else:
+                stanzas = await amake_stanzas(summary, tone=tone, model=model, stanza_count=stanza_count)
+        except BaseException:
+            title_task.cancel()
+            raise
+    
+    try:
         # Save stanzas
         stanzas_path = output_dir / "stanzas.txt"
         stanzas_text = "\n\n".join(f"Stanza {i}:\n{stanza}" for i, stanza in enumerate(stanzas, 1))
         stanzas_path.write_text(stanzas_text, encoding='utf-8')
         logger.info(f"Stanzas saved to: {stanzas_path}")
-
-        # Generate short title
-        title = generate_short_title(summary, model=openai_model)
-        logger.info(f"Generated title: {title}")
-        safe_title = _slugify(title)
         
-        # Step 3: Generate audio files
-        logger.info("\n[Step 3/4] Generating audio files...")
-        audio_paths = generate_audio_files(stanzas, str(audio_dir))
-        logger.info(f"Generated {len(audio_paths)} audio files")
+        # Step 3: Generate audio files (already done if the stanzas were streamed)
+        if audio_buffers is None:
+            logger.info("\n[Step 3/4] Generating audio files...")
+            audio_buffers = await asyncio.to_thread(
+                profiling.run_profiled,
+                generate_audio_buffers,
+                stanzas,
+                output_dir=str(audio_dir) if settings.SAVE_AUDIO_FILES else None,
+                workers=tts_workers or settings.TTS_WORKERS
+            )
+        logger.info(f"Generated audio for {len(audio_buffers)} stanzas")
         
         # Step 4: Build video
         logger.info("\n[Step 4/4] Building video...")
         
-        # Select background images
-        background_paths = _select_backgrounds(len(stanzas), override_dir=backgrounds_override)
+        # Select background images (keep the earlier run's choice when re-rendering)
+        if previous_backgrounds and all(Path(p).exists() for p in previous_backgrounds):
+            background_paths = previous_backgrounds
+        else:
+            background_paths = _select_backgrounds(len(stanzas), override_dir=backgrounds_dir)
         if not background_paths:
             raise RuntimeError(
                 f"No background images found in {settings.ASSETS_BACKGROUNDS_DIR}. "
                 "Please add at least 3 background images."
             )
+        (output_dir / "backgrounds.txt").write_text("\n".join(background_paths), encoding='utf-8')
         
-        # Build video
-        date_prefix = timestamp.split("_")[0]
-        video_filename = f"{date_prefix}_{safe_title}.{settings.OUTPUT_VIDEO_FORMAT}" if safe_title else f"video.{settings.OUTPUT_VIDEO_FORMAT}"
-        video_path = output_dir / video_filename
-        final_video_path = build_video(
-            backgrounds=background_paths,
-            stanzas=stanzas,
-            audio_paths=audio_paths,
-            output_path=str(video_path)
-        )
-        
-        logger.info("\n" + "=" * 60)
-        logger.info("Pipeline completed successfully!")
-        logger.info("=" * 60)
-        logger.info(f"Final video: {final_video_path}")
-        logger.info(f"All outputs saved to: {output_dir}")
-        
-    except KeyboardInterrupt:
-        logger.warning("\nPipeline interrupted by user.")
-        sys.exit(1)
-    except Exception as e:
-        logger.error(f"\nPipeline failed with error: {e}", exc_info=True)
-        sys.exit(1)
+        if title_task is not None:
+            title = await title_task
+            logger.info(f"Generated title: {title}")
+            safe_title = _slugify(title)
+    finally:
+        if title_task is not None and not title_task.done():
+            title_task.cancel()
+    
+    # Build video (dated like the run directory, even if the run crosses midnight)
+    date_prefix = output_dir.name.split("_")[0]
+    suffix = "_preview" if preview else ""
+    video_filename = f"{date_prefix}_{safe_title}{suffix}.{settings.OUTPUT_VIDEO_FORMAT}" if safe_title else f"video{suffix}.{settings.OUTPUT_VIDEO_FORMAT}"
+    video_path = output_dir / video_filename
+    return await asyncio.to_thread(
+        profiling.run_profiled,
+        build_video,
+        backgrounds=background_paths,
+        stanzas=stanzas,
+        output_path=str(video_path),
+        audio_buffers=audio_buffers,
+        preview=preview,
+        renditions=renditions,
+        encoder_profile=encoder_profile
+    )
+
+
+async def _close_clients_after(pipeline: Awaitable[str]) -> str:
+    """Await pipeline, then close the loop's shared AsyncOpenAI client."""
+    try:
+        return await pipeline
+    finally:
+        await aclose_client()
+
+
+def _save_summary(output_dir: Path, summary: str) -> None:
+    """Write the news summary into the run's output directory."""
+    summary_path = output_dir / "summary.txt"
+    summary_path.write_text(summary, encoding='utf-8')
+    logger.info(f"Summary saved to: {summary_path}")
 
 
 def _select_backgrounds(count: int, override_dir: str | None = None) -> list[str]:
@@ -158,6 +308,49 @@ def _select_backgrounds(count: int, override_dir: str | None = None) -> list[str
     return selected
 
 
+def _load_previous_run(run_dir: Path) -> tuple[str, list[str], str, list[str] | None]:
+    """
+    Load the summary, stanzas, title slug and backgrounds of an earlier run.
+    
+    Args:
+        run_dir: Timestamped output directory of the earlier run
+    
+    Returns:
+        Tuple of (summary, stanzas, safe_title, background paths or None)
+    
+    Raises:
+        ValueError: If the run directory is missing its summary or stanzas.
+    """
+    summary_path = run_dir / "summary.txt"
+    stanzas_path = run_dir / "stanzas.txt"
+    if not summary_path.exists() or not stanzas_path.exists():
+        raise ValueError(f"{run_dir} does not contain summary.txt and stanzas.txt")
+    
+    summary = summary_path.read_text(encoding='utf-8')
+    stanzas_text = stanzas_path.read_text(encoding='utf-8')
+    stanzas = [
+        part.strip()
+        for part in re.split(r"(?:^|\n\n)Stanza \d+:\n", stanzas_text)
+        if part.strip()
+    ]
+    
+    # Title slug comes from the earlier video's filename: <date>_<slug>[_preview].<ext>
+    safe_title = "video"
+    # Renditions are named <main stem>_<rendition>, so the shortest stem is the main video
+    videos = sorted(run_dir.glob(f"*.{settings.OUTPUT_VIDEO_FORMAT}"), key=lambda f: (len(f.stem), f.name))
+    if videos:
+        parts = videos[0].stem.split("_", 1)
+        if len(parts) == 2:
+            safe_title = parts[1].removesuffix("_preview")
+    
+    backgrounds = None
+    backgrounds_path = run_dir / "backgrounds.txt"
+    if backgrounds_path.exists():
+        backgrounds = [line for line in backgrounds_path.read_text(encoding='utf-8').splitlines() if line.strip()]
+    
+    return summary, stanzas, safe_title, backgrounds
+
+
 def _parse_args() -> argparse.Namespace:
     """Parse CLI arguments for customization."""
     parser = argparse.ArgumentParser(description="Poem Short Generator")
@@ -166,6 +359,16 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument("--backgrounds", type=str, default=None, help="Path to backgrounds directory (overrides settings)")
     parser.add_argument("--output-dir", type=str, default=None, help="Base output directory (overrides settings)")
     parser.add_argument("--stanzas", type=int, default=7, help="Number of stanzas/slides to generate (default: 7)")
+    parser.add_argument("--tts-workers", type=int, default=None, help="Number of stanzas to synthesize concurrently (overrides settings)")
+    parser.add_argument("--preview", action="store_true", help="Render a fast low-resolution preview instead of the final video")
+    parser.add_argument("--encoder-profile", choices=list(settings.ENCODER_PROFILES), default=None, help="Encoder profile from settings.ENCODER_PROFILES (overrides settings)")
+    parser.add_argument("--renditions", type=str, default=None, help="Comma-separated extra renditions from settings.VIDEO_RENDITION_PRESETS (e.g. 720p,square)")
+    parser.add_argument("--profile", action="store_true", help="Write cProfile and collapsed-stack profiles into the run directory")
+    parser.add_argument("--stream-stanzas", action="store_true", help="Stream the poem and start TTS on each stanza as it arrives (overrides settings)")
+    llm_cache_group = parser.add_mutually_exclusive_group()
+    llm_cache_group.add_argument("--no-llm-cache", action="store_true", help="Neither read nor write the LLM response cache")
+    llm_cache_group.add_argument("--refresh-llm-cache", action="store_true", help="Ignore cached LLM responses but store the fresh ones")
+    parser.add_argument("--from-run", type=str, default=None, help="Re-render an earlier run's stanzas (e.g. a preview) without calling OpenAI")
     return parser.parse_args()
 
 
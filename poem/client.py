@@ -0,0 +1,124 @@
+"""Shared OpenAI clients (sync and async) for the poem package."""
+
+import asyncio
+import logging
+import threading
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+import settings
+
+logger = logging.getLogger(__name__)
+
+_client: OpenAI | None = None
+_client_api_key: str | None = None
+_client_lock = threading.Lock()
+_async_clients: dict[asyncio.AbstractEventLoop, tuple[str | None, AsyncOpenAI]] = {}  # Per loop: (API key, client)
+_async_clients_lock = threading.Lock()
+_closing: set[asyncio.Task] = set()  # Close tasks for replaced clients, referenced until they finish
+
+
+def get_client() -> OpenAI:
+    """
+    Return the process-wide OpenAI client, creating it on first use.
+    
+    Every OpenAI() owns its own httpx connection pool, so building one per
+    call repeats the TCP and TLS handshakes. The shared client keeps
+    connections alive between the summary, stanza and title calls, across
+    runs in a batch and across web-triggered jobs. It is thread-safe and is
+    rebuilt if settings.OPENAI_API_KEY changes.
+    
+    Returns:
+        Shared OpenAI client
+    """
+    global _client, _client_api_key
+    
+    with _client_lock:
+        if _client is None or _client_api_key != settings.OPENAI_API_KEY:
+            if _client is not None:
+                _client.close()
+            timeout = _timeout()
+            _client = OpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                timeout=timeout,
+                http_client=DefaultHttpxClient(timeout=timeout, limits=_limits())
+            )
+            _client_api_key = settings.OPENAI_API_KEY
+            logger.debug("Created shared OpenAI client")
+        return _client
+
+
+def close_client() -> None:
+    """Close the shared client and its pooled connections (a new one is created on next use)."""
+    global _client, _client_api_key
+    
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = None
+        _client_api_key = None
+
+
+def get_async_client() -> AsyncOpenAI:
+    """
+    Return the shared AsyncOpenAI client for the running event loop.
+    
+    httpx async connections are bound to the loop that opened them, so one
+    client is kept per loop: every generation on a loop shares its pool,
+    with the same limits and timeouts as get_client(). Whoever owns the loop
+    should await aclose_client() before it ends (main.py does). If
+    settings.OPENAI_API_KEY changes, the loop's old client is closed in the
+    background and replaced.
+    
+    Returns:
+        Shared AsyncOpenAI client
+    
+    Raises:
+        RuntimeError: If called outside a running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        _forget_closed_loops()
+        api_key, client = _async_clients.get(loop, (None, None))
+        if client is not None and api_key == settings.OPENAI_API_KEY:
+            return client
+        if client is not None:
+            task = loop.create_task(client.close())
+            _closing.add(task)
+            task.add_done_callback(_closing.discard)
+        
+        timeout = _timeout()
+        client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            timeout=timeout,
+            http_client=DefaultAsyncHttpxClient(timeout=timeout, limits=_limits())
+        )
+        _async_clients[loop] = (settings.OPENAI_API_KEY, client)
+        logger.debug("Created shared AsyncOpenAI client")
+        return client
+
+
+async def aclose_client() -> None:
+    """Close the running loop's async client and its pooled connections (a new one is created on next use)."""
+    with _async_clients_lock:
+        _, client = _async_clients.pop(asyncio.get_running_loop(), (None, None))
+    if client is not None:
+        await client.close()
+
+
+def _forget_closed_loops() -> None:
+    """Drop clients whose loop ended without aclose_client(); their connections can no longer be closed."""
+    for loop in [loop for loop in _async_clients if loop.is_closed()]:
+        del _async_clients[loop]
+        logger.warning("Dropped an AsyncOpenAI client whose event loop closed without aclose_client()")
+
+
+def _timeout() -> httpx.Timeout:
+    return httpx.Timeout(settings.OPENAI_TIMEOUT_SECONDS, connect=settings.OPENAI_CONNECT_TIMEOUT_SECONDS)
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.OPENAI_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.OPENAI_MAX_CONNECTIONS,
+        keepalive_expiry=settings.OPENAI_KEEPALIVE_SECONDS
+    )
@@ -0,0 +1,114 @@
+"""Chat completion calls with LLM caching and retries, shared by the sync and async generators."""
+
+import asyncio
+import logging
+import time
+from typing import Callable, TypeVar
+from openai import AsyncOpenAI, OpenAI
+from poem import llm_cache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def complete(
+    client: OpenAI,
+    kind: str,
+    request: dict,
+    parse: Callable[[str], T],
+    description: str,
+    max_retries: int,
+    backoff_seconds: float
+) -> T:
+    """
+    Run a chat completion through the LLM cache, retrying failed calls.
+    
+    Args:
+        client: OpenAI client
+        kind: LLM cache call type ("summary", "stanzas" or "title")
+        request: Chat completion arguments
+        parse: Turns the response text into the result
+        description: What is being generated, for log messages
+        max_retries: Number of attempts
+        backoff_seconds: Base backoff in seconds between attempts
+    
+    Returns:
+        The parsed response
+    
+    Raises:
+        Exception: The last error if every attempt fails.
+    """
+    cached = llm_cache.lookup(kind, request)
+    if cached is not None:
+        return parse(cached)
+    
+    last_error: Exception | None = None
+    for attempt in range(1, max_retries + 1):
+        try:
+            logger.info(f"Generating {description} (attempt {attempt}/{max_retries})...")
+            response = client.chat.completions.create(**request)
+            return _handle_response(kind, request, response, parse)
+        except Exception as e:
+            last_error = e
+            logger.warning(f"Attempt {attempt} failed to generate {description}: {e}")
+            if attempt < max_retries:
+                time.sleep(backoff_seconds * attempt)
+    
+    logger.error(f"Failed to generate {description} after {max_retries} attempts: {last_error}")
+    raise last_error
+
+
+async def acomplete(
+    client: AsyncOpenAI,
+    kind: str,
+    request: dict,
+    parse: Callable[[str], T],
+    description: str,
+    max_retries: int,
+    backoff_seconds: float
+) -> T:
+    """
+    Async variant of complete(); retries back off with asyncio.sleep, so waiting doesn't hold a thread.
+    
+    Args:
+        client: AsyncOpenAI client
+        kind: LLM cache call type ("summary", "stanzas" or "title")
+        request: Chat completion arguments
+        parse: Turns the response text into the result
+        description: What is being generated, for log messages
+        max_retries: Number of attempts
+        backoff_seconds: Base backoff in seconds between attempts
+    
+    Returns:
+        The parsed response
+    
+    Raises:
+        Exception: The last error if every attempt fails.
+    """
+    cached = llm_cache.lookup(kind, request)
+    if cached is not None:
+        return parse(cached)
+    
+    last_error: Exception | None = None
+    for attempt in range(1, max_retries + 1):
+        try:
+            logger.info(f"Generating {description} (attempt {attempt}/{max_retries})...")
+            response = await client.chat.completions.create(**request)
+            return _handle_response(kind, request, response, parse)
+        except Exception as e:
+            last_error = e
+            logger.warning(f"Attempt {attempt} failed to generate {description}: {e}")
+            if attempt < max_retries:
+                await asyncio.sleep(backoff_seconds * attempt)
+    
+    logger.error(f"Failed to generate {description} after {max_retries} attempts: {last_error}")
+    raise last_error
+
+
+def _handle_response(kind: str, request: dict, response, parse: Callable[[str], T]) -> T:
+    """Parse a completion's text and cache it once parsing succeeded, so a bad response is retried rather than reused."""
+    text = response.choices[0].message.content
+    result = parse(text)
+    llm_cache.store(kind, request, text)
+    return result
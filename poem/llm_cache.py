@@ -0,0 +1,195 @@
+"""SQLite cache of OpenAI chat completions, so re-runs against the same day's news skip repeat calls.
+
+Entries are keyed by the request's model, messages, temperature and
+max_tokens, so a different tone or stanza count (both part of the poem
+prompt) is a different entry. Each kind of call has its own TTL
+(settings.LLM_CACHE_TTL_SECONDS): the news summary goes stale within hours,
+while stanzas and titles are derived from the summary text they embed.
+
+Usage:
+    python -m poem.llm_cache stats
+    python -m poem.llm_cache prune
+    python -m poem.llm_cache clear
+"""
+
+import argparse
+import contextlib
+import contextvars
+import logging
+import sqlite3
+import time
+import disk_cache
+import settings
+
+logger = logging.getLogger(__name__)
+
+MODES = ("use", "refresh", "off")
+
+_mode: contextvars.ContextVar[str | None] = contextvars.ContextVar("llm_cache_mode", default=None)  # Override of settings.LLM_CACHE_ENABLED (see set_mode)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL
+)
+"""
+
+
+def set_mode(mode: str | None) -> None:
+    """
+    Override how the cache is used in the current context.
+    
+    The mode is a context variable: it applies to the calling thread or
+    asyncio task and to tasks and asyncio.to_thread() calls started from it
+    afterwards, so concurrent generations can use different modes.
+    
+    Args:
+        mode: "use" (read and write), "refresh" (skip reads but store fresh
+            responses), "off" (bypass entirely), or None to follow
+            settings.LLM_CACHE_ENABLED
+    
+    Raises:
+        ValueError: If mode is not one of MODES.
+    """
+    if mode is not None and mode not in MODES:
+        raise ValueError(f"Unknown LLM cache mode '{mode}'. Available: {', '.join(MODES)}")
+    _mode.set(mode)
+
+
+def current_mode() -> str:
+    """Return the effective cache mode."""
+    mode = _mode.get()
+    if mode is not None:
+        return mode
+    return "use" if settings.LLM_CACHE_ENABLED else "off"
+
+
+def cache_key(request: dict) -> str:
+    """
+    Build the cache key for a chat completion request.
+    
+    Args:
+        request: Chat completion arguments (model, messages, temperature, max_tokens)
+    
+    Returns:
+        Hex cache key
+    """
+    return disk_cache.content_key(
+        request["model"], request["messages"], request.get("temperature"), request.get("max_tokens")
+    )
+
+
+def lookup(kind: str, request: dict) -> str | None:
+    """
+    Return the cached response text for request if it is younger than kind's TTL.
+    
+    Args:
+        kind: Call type ("summary", "stanzas" or "title"), selects the TTL
+        request: Chat completion arguments
+    
+    Returns:
+        Response text on a hit, None on a miss, when expired, or when reads are disabled
+    """
+    if current_mode() != "use":
+        return None
+    try:
+        with contextlib.closing(_connect()) as conn:
+            row = conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (cache_key(request),)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logger.warning(f"Could not read LLM cache: {e}")
+        return None
+    
+    if row is None:
+        return None
+    response, created_at = row
+    age = time.time() - created_at
+    if age > _ttl(kind):
+        logger.info(f"Cached {kind} response expired ({age / 3600:.1f}h old)")
+        return None
+    logger.info(f"Reused cached {kind} response ({age / 3600:.1f}h old)")
+    return response
+
+
+def store(kind: str, request: dict, response: str) -> None:
+    """Cache a response for request. Failures are logged, not raised."""
+    if current_mode() == "off":
+        return
+    try:
+        with contextlib.closing(_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, kind, model, response, created_at) VALUES (?, ?, ?, ?, ?)",
+                (cache_key(request), kind, request["model"], response, time.time())
+            )
+    except sqlite3.Error as e:
+        logger.warning(f"Could not store {kind} response in LLM cache: {e}")
+
+
+def prune() -> int:
+    """Delete expired entries and return how many were removed."""
+    if not settings.LLM_CACHE_PATH.exists():
+        return 0
+    now = time.time()
+    removed = 0
+    with contextlib.closing(_connect()) as conn, conn:
+        for kind, in conn.execute("SELECT DISTINCT kind FROM responses").fetchall():
+            removed += conn.execute(
+                "DELETE FROM responses WHERE kind = ? AND created_at < ?", (kind, now - _ttl(kind))
+            ).rowcount
+    return removed
+
+
+def clear() -> int:
+    """Delete every entry and return how many were removed."""
+    if not settings.LLM_CACHE_PATH.exists():
+        return 0
+    with contextlib.closing(_connect()) as conn, conn:
+        return conn.execute("DELETE FROM responses").rowcount
+
+
+def stats() -> dict:
+    """Return the cache location and entry counts per call type."""
+    kinds = {}
+    if settings.LLM_CACHE_PATH.exists():
+        with contextlib.closing(_connect()) as conn:
+            kinds = dict(conn.execute("SELECT kind, COUNT(*) FROM responses GROUP BY kind").fetchall())
+    return {"path": str(settings.LLM_CACHE_PATH), "entries": sum(kinds.values()), "kinds": kinds}
+
+
+def _ttl(kind: str) -> float:
+    return settings.LLM_CACHE_TTL_SECONDS.get(kind, 0.0)
+
+
+def _connect() -> sqlite3.Connection:
+    settings.LLM_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(settings.LLM_CACHE_PATH, timeout=10)
+    conn.execute(_SCHEMA)
+    return conn
+
+
+def main() -> None:
+    """Inspect or prune the LLM response cache from the command line."""
+    parser = argparse.ArgumentParser(description="Inspect and prune the LLM response cache")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="Show entry counts per call type")
+    sub.add_parser("prune", help="Remove expired entries")
+    sub.add_parser("clear", help="Remove every entry")
+    args = parser.parse_args()
+    
+    if args.command == "stats":
+        info = stats()
+        kinds = ", ".join(f"{kind}: {count}" for kind, count in sorted(info["kinds"].items()))
+        print(f"{info['path']}: {info['entries']} entries" + (f" ({kinds})" if kinds else ""))
+    elif args.command == "prune":
+        print(f"Removed {prune()} expired entries")
+    else:
+        print(f"Removed {clear()} entries")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
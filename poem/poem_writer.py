@@ -1,14 +1,19 @@
 """Convert news summary into 3-stanza poem using OpenAI."""
 
+import asyncio
 import logging
 import re
-import time
-from openai import OpenAI
+from typing import AsyncIterator
+import instrumentation
 import settings
+from poem import llm_cache
+from poem.client import get_async_client, get_client
+from poem.completion import acomplete, complete
 
 logger = logging.getLogger(__name__)
 
 
+@instrumentation.instrumented("poem_writer")
 def make_stanzas(
     summary_text: str,
     tone: str = "poetic insight",
@@ -36,15 +41,164 @@ def make_stanzas(
         ValueError: If OpenAI API key is not configured or summary is empty.
         Exception: If OpenAI API call fails or cannot parse stanzas.
     """
+    _check_inputs(summary_text)
+    return complete(
+        get_client(), "stanzas", _stanza_request(summary_text, tone, model, stanza_count),
+        lambda poem_text: _stanzas_from_text(poem_text.strip(), stanza_count),
+        "poem stanzas", max_retries, backoff_seconds
+    )
+
+
+@instrumentation.instrumented("poem_writer")
+async def amake_stanzas(
+    summary_text: str,
+    tone: str = "poetic insight",
+    model: str | None = None,
+    stanza_count: int = 7,
+    max_retries: int = 3,
+    backoff_seconds: float = 1.5,
+) -> list[str]:
+    """
+    Async variant of make_stanzas() on the shared AsyncOpenAI client.
+    
+    Args:
+        summary_text: The news summary text to convert.
+        tone: Desired tone/style for the poem.
+        model: Optional OpenAI model override.
+        stanza_count: Number of stanzas to produce.
+        max_retries: Number of retry attempts on failure.
+        backoff_seconds: Base backoff in seconds between retries.
+    
+    Returns:
+        List of stanza_count strings, each representing one stanza.
+    
+    Raises:
+        ValueError: If OpenAI API key is not configured or summary is empty.
+        Exception: If OpenAI API call fails or cannot parse stanzas.
+    """
+    _check_inputs(summary_text)
+    return await acomplete(
+        get_async_client(), "stanzas", _stanza_request(summary_text, tone, model, stanza_count),
+        lambda poem_text: _stanzas_from_text(poem_text.strip(), stanza_count),
+        "poem stanzas", max_retries, backoff_seconds
+    )
+
+
+async def astream_stanzas(
+    summary_text: str,
+    tone: str = "poetic insight",
+    model: str | None = None,
+    stanza_count: int = 7,
+    max_retries: int = 3,
+    backoff_seconds: float = 1.5,
+) -> AsyncIterator[str]:
+    """
+    Stream the poem and yield each stanza as soon as it is complete.
+    
+    The completion is consumed chunk by chunk and a stanza is emitted at each
+    blank line, so callers can start on stanza 1 (e.g. TTS) while the model
+    is still writing the rest. Stanzas are cleaned like make_stanzas() does,
+    but since earlier stanzas are already out, a short poem is padded by
+    repeating the last stanza rather than by splitting long ones, and the
+    stream stops once stanza_count stanzas have been yielded. Failed calls
+    are retried only until the first stanza has been yielded. A poem found in
+    the LLM cache (poem.llm_cache) is yielded at once; a streamed one is
+    cached only after every stanza has been parsed and yielded.
+    
+    Args:
+        summary_text: The news summary text to convert.
+        tone: Desired tone/style for the poem.
+        model: Optional OpenAI model override.
+        stanza_count: Number of stanzas to produce.
+        max_retries: Number of retry attempts on failure.
+        backoff_seconds: Base backoff in seconds between retries.
+    
+    Yields:
+        Stanza strings in order, exactly stanza_count of them
+    
+    Raises:
+        ValueError: If OpenAI API key is not configured or summary is empty.
+        Exception: If OpenAI API call fails or the response has no stanzas.
+    """
+    _check_inputs(summary_text)
+    client = get_async_client()
+    request = _stanza_request(summary_text, tone, model, stanza_count)
+    
+    with instrumentation.stage("poem_writer", streaming=True):
+        cached = llm_cache.lookup("stanzas", request)
+        if cached is not None:
+            for stanza in _stanzas_from_text(cached.strip(), stanza_count):
+                yield stanza
+            return
+        
+        last_error: Exception | None = None
+        for attempt in range(1, max_retries + 1):
+            emitted: list[str] = []
+            try:
+                logger.info(f"Streaming poem stanzas from news summary (attempt {attempt}/{max_retries})...")
+                stream = await client.chat.completions.create(**request, stream=True)
+                received = pending = ""
+                try:
+                    async for chunk in stream:
+                        if not chunk.choices:
+                            continue
+                        received += chunk.choices[0].delta.content or ""
+                        pending += chunk.choices[0].delta.content or ""
+                        # Everything before the last blank line is made of complete stanzas
+                        *finished, pending = re.split(r'\n\s*\n', pending)
+                        for stanza in _parse_stanzas("\n\n".join(finished)):
+                            if len(emitted) < stanza_count:
+                                emitted.append(_check_stanza_lines(stanza, len(emitted) + 1))
+                                logger.info(f"Received stanza {len(emitted)}/{stanza_count}")
+                                yield emitted[-1]
+                        if len(emitted) >= stanza_count:
+                            break
+                finally:
+                    await stream.close()
+                
+                for stanza in _parse_stanzas(pending):
+                    if len(emitted) < stanza_count:
+                        emitted.append(_check_stanza_lines(stanza, len(emitted) + 1))
+                        yield emitted[-1]
+                if not emitted:
+                    raise ValueError("Streamed response contained no stanzas")
+                if len(emitted) < stanza_count:
+                    logger.warning(f"Expected {stanza_count} stanzas, got {len(emitted)}. Repeating the last stanza.")
+                while len(emitted) < stanza_count:
+                    emitted.append(emitted[-1])
+                    yield emitted[-1]
+                
+                # Cache only a poem that was parsed and delivered in full; a stream cut
+                # short after stanza_count stanzas still holds all a cache hit needs
+                llm_cache.store("stanzas", request, received)
+                logger.info(f"Successfully streamed {len(emitted)} stanzas")
+                return
+                
+            except Exception as e:
+                if emitted:
+                    # Stanzas already handed to the caller can't be taken back
+                    logger.error(f"Poem stream failed after {len(emitted)} stanzas: {e}")
+                    raise
+                last_error = e
+                logger.warning(f"Attempt {attempt} failed to stream poem stanzas: {e}")
+                if attempt < max_retries:
+                    await asyncio.sleep(backoff_seconds * attempt)
+        
+        logger.error(f"Failed to stream poem stanzas after {max_retries} attempts: {last_error}")
+        raise last_error
+
+
+def _check_inputs(summary_text: str) -> None:
+    """Raise ValueError if the API key is missing or the summary is empty."""
     if not settings.OPENAI_API_KEY:
         raise ValueError("OPENAI_API_KEY is not configured. Please set it in your environment or .env file.")
     
     if not summary_text or not summary_text.strip():
         raise ValueError("Summary text cannot be empty.")
-    
-    client = OpenAI(api_key=settings.OPENAI_API_KEY)
-    model_name = model or settings.OPENAI_MODEL
-    
+
+
+def _stanza_request(summary_text: str, tone: str, model: str | None, stanza_count: int) -> dict:
+    """Build the chat completion arguments for the poem."""
     prompt = f"""Convert the following world news summary into a {stanza_count}-stanza poem.
 - Each stanza must have 2-3 lines and focus on a distinct facet of the news.
 - Write with {tone} while keeping factual anchoring and insight.
@@ -68,50 +222,52 @@ Stanza {stanza_count} line 1
 Stanza {stanza_count} line 2
 [optional line 3]"""
 
-    last_error: Exception | None = None
-    for attempt in range(1, max_retries + 1):
-        try:
-            logger.info(f"Generating poem stanzas from news summary (attempt {attempt}/{max_retries})...")
-            response = client.chat.completions.create(
-                model=model_name,
-                messages=[
-                    {"role": "system", "content": "You are a poet who crafts insightful, evocative poetry grounded in real news, balancing empathy, clarity, and global perspective."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.75,
-                max_tokens=420
-            )
-            
-            poem_text = response.choices[0].message.content.strip()
-            
-            # Parse stanzas from the response
-            stanzas = _parse_stanzas(poem_text)
-            
-            # Validate we have exact stanza_count
-            if len(stanzas) != stanza_count:
-                logger.warning(f"Expected {stanza_count} stanzas, got {len(stanzas)}. Attempting to fix...")
-                stanzas = _fix_stanza_count(stanzas, poem_text, stanza_count=stanza_count)
-            
-            # Validate each stanza has 2-3 lines
-            for i, stanza in enumerate(stanzas, 1):
-                lines = [line.strip() for line in stanza.split('\n') if line.strip()]
-                if len(lines) < 2:
-                    logger.warning(f"Stanza {i} has only {len(lines)} lines. May need adjustment.")
-                elif len(lines) > 3:
-                    logger.warning(f"Stanza {i} has {len(lines)} lines. Truncating to 3.")
-                    stanzas[i-1] = '\n'.join(lines[:3])
-            
-            logger.info(f"Successfully generated {len(stanzas)} stanzas")
-            return stanzas
-            
-        except Exception as e:
-            last_error = e
-            logger.warning(f"Attempt {attempt} failed to generate poem stanzas: {e}")
-            if attempt < max_retries:
-                time.sleep(backoff_seconds * attempt)
-    
-    logger.error(f"Failed to generate poem stanzas after {max_retries} attempts: {last_error}")
-    raise last_error
+    return {
+        "model": model or settings.OPENAI_MODEL,
+        "messages": [
+            {"role": "system", "content": "You are a poet who crafts insightful, evocative poetry grounded in real news, balancing empathy, clarity, and global perspective."},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.75,
+        "max_tokens": 420,
+    }
+
+
+def _stanzas_from_text(poem_text: str, stanza_count: int) -> list[str]:
+    """
+    Parse a completed poem into exactly stanza_count stanzas of at most 3 lines.
+    
+    Args:
+        poem_text: Raw poem text from OpenAI.
+        stanza_count: Number of stanzas expected.
+    
+    Returns:
+        List of stanza strings.
+    """
+    # Parse stanzas from the response
+    stanzas = _parse_stanzas(poem_text)
+    
+    # Validate we have exact stanza_count
+    if len(stanzas) != stanza_count:
+        logger.warning(f"Expected {stanza_count} stanzas, got {len(stanzas)}. Attempting to fix...")
+        stanzas = _fix_stanza_count(stanzas, poem_text, stanza_count=stanza_count)
+    
+    # Validate each stanza has 2-3 lines
+    stanzas = [_check_stanza_lines(stanza, i) for i, stanza in enumerate(stanzas, 1)]
+    
+    logger.info(f"Successfully generated {len(stanzas)} stanzas")
+    return stanzas
+
+
+def _check_stanza_lines(stanza: str, index: int) -> str:
+    """Warn about stanzas under 2 lines and truncate stanzas over 3 lines."""
+    lines = [line.strip() for line in stanza.split('\n') if line.strip()]
+    if len(lines) < 2:
+        logger.warning(f"Stanza {index} has only {len(lines)} lines. May need adjustment.")
+    elif len(lines) > 3:
+        logger.warning(f"Stanza {index} has {len(lines)} lines. Truncating to 3.")
+        return '\n'.join(lines[:3])
+    return stanza
 
 
 def _parse_stanzas(poem_text: str) -> list[str]:
@@ -1,13 +1,15 @@
 """Generate world news summary using OpenAI."""
 
 import logging
-import time
-from openai import OpenAI
+import instrumentation
 import settings
+from poem.client import get_async_client, get_client
+from poem.completion import acomplete, complete
 
 logger = logging.getLogger(__name__)
 
 
+@instrumentation.instrumented("summarizer")
 def get_world_news_summary(model: str | None = None, max_retries: int = 3, backoff_seconds: float = 1.5) -> str:
     """
     Uses OpenAI to generate a 6-8 sentence global news digest.
@@ -19,68 +21,107 @@ def get_world_news_summary(model: str | None = None, max_retries: int = 3, backo
         ValueError: If OpenAI API key is not configured.
         Exception: If OpenAI API call fails.
     """
-    if not settings.OPENAI_API_KEY:
-        raise ValueError("OPENAI_API_KEY is not configured. Please set it in your environment or .env file.")
-    
-    client = OpenAI(api_key=settings.OPENAI_API_KEY)
-    model_name = model or settings.OPENAI_MODEL
-    
-    prompt = """Generate a concise 6-8 sentence summary of today's most important world news.
-- Cover geopolitics, economy/markets, major conflicts, climate/disasters, tech/policy shifts.
-- Highlight why each item matters (implications, stakes, affected regions).
-- Avoid timestamps; write in clear, neutral journalistic prose.
-- Keep it factual, globally balanced, and non-speculative."""
+    _check_api_key()
+    return complete(
+        get_client(), "summary", _summary_request(model), _parse_summary,
+        "world news summary", max_retries, backoff_seconds
+    )
 
-    last_error: Exception | None = None
-    for attempt in range(1, max_retries + 1):
-        try:
-            logger.info(f"Generating world news summary using OpenAI (attempt {attempt}/{max_retries})...")
-            response = client.chat.completions.create(
-                model=model_name,
-                messages=[
-                    {"role": "system", "content": "You are a world news summarizer. Provide concise, factual, globally balanced summaries with clear implications."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.6,
-                max_tokens=600
-            )
-            
-            summary = response.choices[0].message.content.strip()
-            
-            # Validate summary length (rough check for 6-10 sentences)
-            sentences = summary.split('.')
-            sentence_count = len([s for s in sentences if s.strip()])
-            
-            if sentence_count < 4:
-                logger.warning(f"Generated summary has only {sentence_count} sentences. May need adjustment.")
-            elif sentence_count > 10:
-                logger.warning(f"Generated summary has {sentence_count} sentences. May be too long.")
-            
-            logger.info(f"Successfully generated news summary ({sentence_count} sentences)")
-            return summary
-            
-        except Exception as e:
-            last_error = e
-            logger.warning(f"Attempt {attempt} failed to generate news summary: {e}")
-            if attempt < max_retries:
-                time.sleep(backoff_seconds * attempt)
+
+@instrumentation.instrumented("summarizer")
+async def aget_world_news_summary(model: str | None = None, max_retries: int = 3, backoff_seconds: float = 1.5) -> str:
+    """
+    Async variant of get_world_news_summary() on the shared AsyncOpenAI client.
     
-    logger.error(f"Failed to generate news summary after {max_retries} attempts: {last_error}")
-    raise last_error
+    Returns:
+        Summary text as string.
+    
+    Raises:
+        ValueError: If OpenAI API key is not configured.
+        Exception: If OpenAI API call fails.
+    """
+    _check_api_key()
+    return await acomplete(
+        get_async_client(), "summary", _summary_request(model), _parse_summary,
+        "world news summary", max_retries, backoff_seconds
+    )
 
 
+@instrumentation.instrumented("summarizer.title")
 def generate_short_title(summary_text: str, model: str | None = None, max_retries: int = 2, backoff_seconds: float = 1.0) -> str:
     """
     Generate a very short, descriptive title (3-7 words) for the video.
     """
+    _check_title_inputs(summary_text)
+    return complete(
+        get_client(), "title", _title_request(summary_text, model), _parse_title,
+        "title", max_retries, backoff_seconds
+    )
+
+
+@instrumentation.instrumented("summarizer.title")
+async def agenerate_short_title(summary_text: str, model: str | None = None, max_retries: int = 2, backoff_seconds: float = 1.0) -> str:
+    """
+    Async variant of generate_short_title() on the shared AsyncOpenAI client.
+    """
+    _check_title_inputs(summary_text)
+    return await acomplete(
+        get_async_client(), "title", _title_request(summary_text, model), _parse_title,
+        "title", max_retries, backoff_seconds
+    )
+
+
+def _check_api_key() -> None:
+    """Raise ValueError if the OpenAI API key is missing."""
     if not settings.OPENAI_API_KEY:
         raise ValueError("OPENAI_API_KEY is not configured. Please set it in your environment or .env file.")
+
+
+def _check_title_inputs(summary_text: str) -> None:
+    """Raise ValueError if the API key is missing or the summary is empty."""
+    _check_api_key()
     if not summary_text.strip():
         raise ValueError("Summary text cannot be empty for title generation.")
 
-    client = OpenAI(api_key=settings.OPENAI_API_KEY)
-    model_name = model or settings.OPENAI_MODEL
 
+def _summary_request(model: str | None) -> dict:
+    """Build the chat completion arguments for the news summary."""
+    prompt = """Generate a concise 6-8 sentence summary of today's most important world news.
+- Cover geopolitics, economy/markets, major conflicts, climate/disasters, tech/policy shifts.
+- Highlight why each item matters (implications, stakes, affected regions).
+- Avoid timestamps; write in clear, neutral journalistic prose.
+- Keep it factual, globally balanced, and non-speculative."""
+    
+    return {
+        "model": model or settings.OPENAI_MODEL,
+        "messages": [
+            {"role": "system", "content": "You are a world news summarizer. Provide concise, factual, globally balanced summaries with clear implications."},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.6,
+        "max_tokens": 600,
+    }
+
+
+def _parse_summary(text: str) -> str:
+    """Clean up the summary text and sanity-check its length."""
+    summary = text.strip()
+    
+    # Validate summary length (rough check for 6-10 sentences)
+    sentences = summary.split('.')
+    sentence_count = len([s for s in sentences if s.strip()])
+    
+    if sentence_count < 4:
+        logger.warning(f"Generated summary has only {sentence_count} sentences. May need adjustment.")
+    elif sentence_count > 10:
+        logger.warning(f"Generated summary has {sentence_count} sentences. May be too long.")
+    
+    logger.info(f"Successfully generated news summary ({sentence_count} sentences)")
+    return summary
+
+
+def _title_request(summary_text: str, model: str | None) -> dict:
+    """Build the chat completion arguments for the video title."""
     prompt = f"""Generate a concise, catchy title (3-7 words) that captures the essence of this day's world news summary. Avoid dates. Be specific, balanced, and informative.
 
 Summary:
@@ -88,28 +129,20 @@ Summary:
 
 Respond with only the title."""
 
-    last_error: Exception | None = None
-    for attempt in range(1, max_retries + 1):
-        try:
-            response = client.chat.completions.create(
-                model=model_name,
-                messages=[
-                    {"role": "system", "content": "You write brief, vivid titles for daily world news digests."},
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.5,
-                max_tokens=30,
-            )
-            title = response.choices[0].message.content.strip()
-            # guard against newlines
-            title = title.replace("\n", " ").strip()
-            return title
-        except Exception as e:
-            last_error = e
-            logger.warning(f"Attempt {attempt} failed to generate title: {e}")
-            if attempt < max_retries:
-                time.sleep(backoff_seconds * attempt)
-
-    logger.error(f"Failed to generate title after {max_retries} attempts: {last_error}")
-    raise last_error
+    return {
+        "model": model or settings.OPENAI_MODEL,
+        "messages": [
+            {"role": "system", "content": "You write brief, vivid titles for daily world news digests."},
+            {"role": "user", "content": prompt},
+        ],
+        "temperature": 0.5,
+        "max_tokens": 30,
+    }
+
+
+def _parse_title(text: str) -> str:
+    """Clean up the title text."""
+    title = text.strip()
+    # guard against newlines
+    return title.replace("\n", " ").strip()
 
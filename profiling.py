@@ -0,0 +1,166 @@
+"""Opt-in profiling for a pipeline run (main.py --profile, or "profile" on /api/generate).
+
+Two complementary profiles are written into the run's output directory:
+
+- profile.prof: a cProfile dump of the thread that runs the pipeline, merged
+  with the work it hands to worker threads through run_profiled() (e.g.
+  TTS and build_video under asyncio.to_thread), for pstats/snakeviz.
+- profile.collapsed: wall-clock stack samples in the collapsed format read
+  by flamegraph.pl and speedscope. Every stack is rooted at the
+  instrumentation stages that were open when it was taken, e.g.
+  "[video];[video.encode];...", so samples from different runs can be
+  compared stage by stage.
+
+The sampler only records threads that are inside an instrumentation stage,
+plus the thread that started profiling, which keeps idle web server and
+piper stderr threads out of the profile. Work done in child processes
+(ffmpeg, segment workers) shows up as the parent waiting on them.
+"""
+
+import cProfile
+import contextvars
+import logging
+import pstats
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+import instrumentation
+import settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_FILENAME = "profile.prof"
+COLLAPSED_FILENAME = "profile.collapsed"
+
+_active: contextvars.ContextVar["Profiler | None"] = contextvars.ContextVar("profiler", default=None)
+
+
+class Profiler:
+    """cProfile plus a stage-aware stack sampler for one pipeline run."""
+    
+    def __init__(self, interval: float | None = None):
+        """
+        Args:
+            interval: Seconds between stack samples (defaults to settings.PROFILE_SAMPLE_INTERVAL)
+        """
+        self.interval = interval or settings.PROFILE_SAMPLE_INTERVAL
+        self.samples: Counter[str] = Counter()
+        self._profile = cProfile.Profile()
+        self._worker_profiles: list[cProfile.Profile] = []  # Finished run_profiled() calls
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+        self._owner: int | None = None
+    
+    def start(self) -> "Profiler":
+        """Start profiling the calling thread (and run_profiled() calls from its context) and sampling staged threads."""
+        self._owner = threading.get_ident()
+        _active.set(self)
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample_loop, name="profile-sampler", daemon=True)
+        self._sampler.start()
+        self._profile.enable()
+        return self
+    
+    def stop(self, output_dir: str | Path | None = None) -> dict[str, Path]:
+        """
+        Stop profiling and write the profiles into output_dir.
+        
+        Args:
+            output_dir: Run output directory (None to discard the results)
+        
+        Returns:
+            Mapping of profile kind ("cprofile", "collapsed") to written path
+        """
+        self._profile.disable()
+        if _active.get() is self:
+            _active.set(None)
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        
+        if output_dir is None:
+            return {}
+        
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        paths = {
+            "cprofile": output_dir / PROFILE_FILENAME,
+            "collapsed": output_dir / COLLAPSED_FILENAME,
+        }
+        stats = pstats.Stats(self._profile)
+        with self._lock:
+            for profile in self._worker_profiles:
+                stats.add(profile)
+        stats.dump_stats(str(paths["cprofile"]))
+        paths["collapsed"].write_text(
+            "".join(f"{stack} {count}\n" for stack, count in sorted(self.samples.items())),
+            encoding='utf-8'
+        )
+        
+        total = sum(self.samples.values())
+        logger.info(f"Profile saved to: {paths['cprofile']} and {paths['collapsed']} ({total} samples)")
+        for stage, count in self.stage_samples().most_common(5):
+            logger.info(f"  {stage}: {count / total:.0%} of samples")
+        return paths
+    
+    def stage_samples(self) -> Counter[str]:
+        """Count samples by innermost open stage."""
+        counts: Counter[str] = Counter()
+        for stack, count in self.samples.items():
+            roots = [frame for frame in stack.split(";") if frame.startswith("[")]
+            counts[roots[-1][1:-1] if roots else "unstaged"] += count
+        return counts
+    
+    def _add_worker_profile(self, profile: cProfile.Profile) -> None:
+        with self._lock:
+            self._worker_profiles.append(profile)
+    
+    def _sample_loop(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                stages = instrumentation.active_stages(thread_id)
+                if not stages and thread_id != self._owner:
+                    continue
+                self.samples[";".join([f"[{name}]" for name in stages] + _stack(frame))] += 1
+
+
+def run_profiled(func, *args, **kwargs):
+    """
+    Call func, adding its cProfile stats to the calling context's active Profiler.
+    
+    cProfile only sees the thread that enabled it, so work the profiled
+    thread hands to another thread (e.g. asyncio.to_thread(run_profiled,
+    build_video, ...)) is profiled on that thread and merged into
+    profile.prof when the Profiler stops. Without an active Profiler, or on a
+    thread that is already being profiled, func just runs.
+    
+    Returns:
+        What func returns
+    """
+    profiler = _active.get()
+    if profiler is None or sys.getprofile() is not None:
+        return func(*args, **kwargs)
+    
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        profile.disable()
+        profiler._add_worker_profile(profile)
+
+
+def _stack(frame) -> list[str]:
+    """Return a frame's call stack, outermost first, as "function (file:line)" entries."""
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})".replace(";", ","))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
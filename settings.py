@@ -10,21 +10,70 @@ load_dotenv()
 # OpenAI Configuration
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 OPENAI_MODEL = "gpt-4"
+OPENAI_TIMEOUT_SECONDS = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "60"))  # Per-request timeout
+OPENAI_CONNECT_TIMEOUT_SECONDS = float(os.getenv("OPENAI_CONNECT_TIMEOUT_SECONDS", "10"))
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "10"))  # Pooled connections of the shared client
+OPENAI_KEEPALIVE_SECONDS = float(os.getenv("OPENAI_KEEPALIVE_SECONDS", "120"))  # Idle time before a pooled connection is closed
+STREAM_STANZAS = os.getenv("STREAM_STANZAS", "false").lower() == "true"  # Start TTS on each stanza as it streams in
 
 # Piper TTS Configuration
 PIPER_VOICE_MODEL = os.getenv("PIPER_VOICE_MODEL", "en_US-lessac-medium")
 PIPER_VOICE_PATH = os.getenv("PIPER_VOICE_PATH", None)  # Optional: path to voice model file
+TTS_WORKERS = int(os.getenv("TTS_WORKERS", "1"))  # Stanzas synthesized concurrently (1 = sequential)
+PIPER_TIMEOUT_SECONDS = float(os.getenv("PIPER_TIMEOUT_SECONDS", "120"))  # Max wait for the piper co-process to answer one stanza
 
 # Video Configuration
 VIDEO_WIDTH = 1080
 VIDEO_HEIGHT = 1920
 VIDEO_FPS = 30
 VIDEO_CODEC = "libx264"
+VIDEO_ENGINE = os.getenv("VIDEO_ENGINE", "moviepy")  # "moviepy" (frame compositing), "ffmpeg" (pre-composited frames piped to ffmpeg) or "segments" (one still segment per stanza)
+SEGMENT_FPS = 1  # Frame rate of still stanza segments in the "segments" engine
+PREVIEW_SCALE = 1 / 3  # Preview renders: fraction of full resolution (360×640)
+PREVIEW_FPS = 10
+PREVIEW_PRESET = "ultrafast"
+ENCODER_PROFILES = {  # x264 settings per profile; threads 0 lets ffmpeg decide, keyframe_interval is in seconds (None keeps x264's default)
+    "fast-draft": {"preset": "veryfast", "crf": 28, "threads": 0, "tune": "stillimage", "keyframe_interval": 10, "audio_bitrate": "96k"},
+    "balanced": {"preset": "medium", "crf": 23, "threads": 0, "tune": None, "keyframe_interval": None, "audio_bitrate": "128k"},  # Same output as before profiles existed
+    "archive": {"preset": "slow", "crf": 18, "threads": 0, "tune": "stillimage", "keyframe_interval": 2, "audio_bitrate": "192k"},
+}
+ENCODER_PROFILE = os.getenv("ENCODER_PROFILE", "balanced")  # Default profile (override per run with --encoder-profile)
+VIDEO_RENDITION_PRESETS = {  # Extra outputs encoded from the same composition (scaled, or center-cropped for other aspect ratios)
+    "720p": {"width": 720, "height": 1280, "video_bitrate": "2500k"},
+    "square": {"width": 1080, "height": 1080, "video_bitrate": "4M"},
+}
+VIDEO_RENDITIONS = [name.strip() for name in os.getenv("VIDEO_RENDITIONS", "").split(",") if name.strip()]  # Preset names rendered alongside every video
+VIDEO_RENDER_WORKERS = int(os.getenv("VIDEO_RENDER_WORKERS", os.cpu_count() or 1))  # Parallel segment renderers ("segments" engine)
 
 # Paths
 BASE_DIR = Path(__file__).parent
 ASSETS_BACKGROUNDS_DIR = BASE_DIR / "assets" / "backgrounds"
 OUTPUT_BASE_DIR = BASE_DIR / "output"
+CACHE_DIR = Path(os.getenv("CACHE_DIR", BASE_DIR / "cache"))
+BACKGROUND_STORE_DIR = CACHE_DIR / "backgrounds"  # Backgrounds pre-cropped/resized to the video size
+BACKGROUND_CROP_MODE = os.getenv("BACKGROUND_CROP_MODE", "center")  # "center" or "saliency" (crop around the most detailed region)
+
+# TTS Audio Cache (content-addressed by stanza text + voice + synthesis params)
+TTS_CACHE_ENABLED = os.getenv("TTS_CACHE_ENABLED", "true").lower() == "true"
+TTS_CACHE_DIR = CACHE_DIR / "tts"
+TTS_CACHE_MAX_BYTES = int(os.getenv("TTS_CACHE_MAX_MB", "500")) * 1024 * 1024
+
+# LLM Response Cache (SQLite, keyed by model, messages, temperature and max_tokens)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_PATH = CACHE_DIR / "llm.sqlite3"
+LLM_CACHE_TTL_SECONDS = {  # Per call type; stanzas are also keyed by tone and stanza count via the prompt
+    "summary": float(os.getenv("LLM_CACHE_SUMMARY_TTL_HOURS", "6")) * 3600,
+    "stanzas": float(os.getenv("LLM_CACHE_STANZAS_TTL_HOURS", "24")) * 3600,
+    "title": float(os.getenv("LLM_CACHE_TITLE_TTL_HOURS", "24")) * 3600,
+}
+
+# Composited Frame Cache (background + caption, keyed by content and caption settings)
+FRAME_CACHE_ENABLED = os.getenv("FRAME_CACHE_ENABLED", "true").lower() == "true"
+FRAME_CACHE_DIR = CACHE_DIR / "frames"
+FRAME_CACHE_MAX_BYTES = int(os.getenv("FRAME_CACHE_MAX_MB", "1000")) * 1024 * 1024
+
+# Profiling (main.py --profile / "profile" on /api/generate)
+PROFILE_SAMPLE_INTERVAL = float(os.getenv("PROFILE_SAMPLE_INTERVAL", "0.005"))  # Seconds between stack samples
 
 # Caption Styling
 CAPTION_FONT = "Arial"  # Default font, can be overridden with path to TTF file
@@ -32,10 +81,11 @@ CAPTION_FONT_SIZE = 48
 CAPTION_COLOR = (255, 255, 255)  # White in RGB
 CAPTION_POSITION = "center"  # Options: "center", "bottom", "top"
 CAPTION_STROKE_COLOR = (0, 0, 0)  # Black outline for better readability
-CAPTION_STROKE_WIDTH = 2
+CAPTION_STROKE_WIDTH = int(os.getenv("CAPTION_STROKE_WIDTH", "2"))  # Outline width in pixels (cost is independent of width)
 CAPTION_MAX_WIDTH = 900  # Maximum width for text wrapping (pixels)
 
 # Output Configuration
 OUTPUT_VIDEO_FORMAT = "mp4"
 OUTPUT_AUDIO_FORMAT = "wav"
+SAVE_AUDIO_FILES = os.getenv("SAVE_AUDIO_FILES", "true").lower() == "true"  # Keep per-stanza WAVs in the run's audio/ dir
 
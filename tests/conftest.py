@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Allow running pytest from any directory
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,27 @@
+"""Tests for poem.client."""
+
+import asyncio
+
+import settings
+from poem import client
+
+
+def test_async_clients_are_per_loop_and_closed(monkeypatch):
+    async def generation():
+        monkeypatch.setattr(settings, "OPENAI_API_KEY", "key-1")
+        shared = client.get_async_client()
+        assert client.get_async_client() is shared
+        
+        monkeypatch.setattr(settings, "OPENAI_API_KEY", "key-2")
+        replacement = client.get_async_client()
+        await asyncio.sleep(0.01)
+        assert shared.is_closed() and not replacement.is_closed()
+        
+        await client.aclose_client()
+        assert replacement.is_closed()
+        return replacement
+    
+    first = asyncio.run(generation())
+    second = asyncio.run(generation())
+    assert first is not second
+    assert client._async_clients == {}
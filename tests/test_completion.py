@@ -0,0 +1,86 @@
+"""Tests for poem.completion."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import settings
+from poem import completion, llm_cache
+
+
+class _Completions:
+    def __init__(self, replies: list):
+        self.replies = list(replies)
+        self.calls = 0
+    
+    def _next(self):
+        self.calls += 1
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=reply))])
+
+
+class _SyncCompletions(_Completions):
+    def create(self, **request):
+        return self._next()
+
+
+class _AsyncCompletions(_Completions):
+    async def create(self, **request):
+        return self._next()
+
+
+def _client(completions: _Completions) -> SimpleNamespace:
+    return SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+
+def _run(client: SimpleNamespace, asynchronous: bool, parse=str.upper):
+    args = (client, "title", {"model": "test", "messages": []}, parse, "title", 3, 0)
+    if asynchronous:
+        return asyncio.run(completion.acomplete(*args))
+    return completion.complete(*args)
+
+
+@pytest.fixture
+def llm_cache_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "LLM_CACHE_PATH", tmp_path / "llm.sqlite3")
+    llm_cache.set_mode("use")
+    yield settings.LLM_CACHE_PATH
+    llm_cache.set_mode(None)
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_complete_retries_then_caches(llm_cache_path, asynchronous):
+    completions = (_AsyncCompletions if asynchronous else _SyncCompletions)([ConnectionError("reset"), "a title"])
+    
+    assert _run(_client(completions), asynchronous) == "A TITLE"
+    assert completions.calls == 2
+    # The second call is answered from the cache
+    assert _run(_client(completions), asynchronous) == "A TITLE"
+    assert completions.calls == 2
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_complete_raises_last_error(llm_cache_path, asynchronous):
+    completions = (_AsyncCompletions if asynchronous else _SyncCompletions)([ConnectionError(str(i)) for i in range(3)])
+    
+    with pytest.raises(ConnectionError, match="2"):
+        _run(_client(completions), asynchronous)
+    assert completions.calls == 3
+
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_complete_caches_only_parsed_responses(llm_cache_path, asynchronous):
+    def parse(text: str) -> str:
+        if not text.strip():
+            raise ValueError("empty response")
+        return text
+    
+    completions = (_AsyncCompletions if asynchronous else _SyncCompletions)(["  "] * 3)
+    
+    with pytest.raises(ValueError, match="empty response"):
+        _run(_client(completions), asynchronous, parse)
+    assert llm_cache.stats()["entries"] == 0
@@ -0,0 +1,30 @@
+"""Tests for instrumentation."""
+
+import asyncio
+
+import instrumentation
+from poem import llm_cache
+
+
+def test_concurrent_runs_keep_their_own_records_and_cache_mode():
+    async def generation(name: str, mode: str) -> dict:
+        instrumentation.start_run(name=name)
+        llm_cache.set_mode(mode)
+        with instrumentation.stage("outer", run=name):
+            await asyncio.sleep(0.05)
+            assert llm_cache.current_mode() == mode
+            await asyncio.to_thread(_inner_stage, name)
+        return instrumentation.finish_run()
+    
+    async def both() -> list[dict]:
+        return await asyncio.gather(generation("a", "off"), generation("b", "refresh"))
+    
+    for metrics in asyncio.run(both()):
+        name = metrics["info"]["name"]
+        assert [(r["stage"], r["labels"]["run"]) for r in metrics["stages"]] == [("inner", name), ("outer", name)]
+    assert instrumentation.current_run() is None
+
+
+def _inner_stage(name: str) -> None:
+    with instrumentation.stage("inner", run=name):
+        pass
@@ -0,0 +1,23 @@
+"""Tests for main.run_pipeline."""
+
+import asyncio
+
+import pytest
+
+import main
+from benchmarks import fixtures
+
+
+def test_summary_is_kept_when_stanza_generation_fails(tmp_path, monkeypatch):
+    async def failing_stanzas(*args, **kwargs):
+        raise RuntimeError("poem request failed")
+    
+    monkeypatch.setattr(main, "amake_stanzas", failing_stanzas)
+    output_dir = tmp_path / "20250101_235959"
+    output_dir.mkdir()
+    
+    with fixtures.offline_pipeline(tmp_path / "cache"):
+        with pytest.raises(RuntimeError, match="poem request failed"):
+            asyncio.run(main.run_pipeline(output_dir, stanza_count=3))
+    
+    assert (output_dir / "summary.txt").read_text(encoding='utf-8') == fixtures.FAKE_SUMMARY
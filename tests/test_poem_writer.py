@@ -0,0 +1,32 @@
+"""Tests for poem.poem_writer."""
+
+import asyncio
+
+from benchmarks import fixtures
+from poem import llm_cache, poem_writer
+
+
+def test_streamed_poem_is_cached_only_when_delivered_in_full(tmp_path, monkeypatch):
+    # A poem one stanza short, so the last stanza is padding
+    fake_stanzas = fixtures.fake_stanzas
+    monkeypatch.setattr(fixtures, "fake_stanzas", lambda count: fake_stanzas(count - 1))
+    
+    async def stanzas(limit: int) -> list[str]:
+        stream = poem_writer.astream_stanzas("Some news.", stanza_count=3)
+        received = []
+        try:
+            async for stanza in stream:
+                received.append(stanza)
+                if len(received) == limit:
+                    break
+        finally:
+            await stream.aclose()
+        return received
+    
+    with fixtures.offline_pipeline(tmp_path):
+        # The consumer stops at the last yield, before the generator finishes
+        assert len(asyncio.run(stanzas(3))) == 3
+        assert llm_cache.stats()["entries"] == 0
+        
+        assert len(asyncio.run(stanzas(4))) == 3
+        assert llm_cache.stats()["entries"] == 1
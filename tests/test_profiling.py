@@ -0,0 +1,25 @@
+"""Tests for profiling."""
+
+import asyncio
+import pstats
+
+import main
+import profiling
+from benchmarks import fixtures
+
+
+def test_profile_includes_work_done_in_worker_threads(tmp_path):
+    output_dir = tmp_path / "20250101_120000"
+    output_dir.mkdir()
+    backgrounds = tmp_path / "backgrounds"
+    fixtures.make_backgrounds(backgrounds, 2)
+    
+    with fixtures.offline_pipeline(tmp_path / "cache"):
+        profiler = profiling.Profiler().start()
+        try:
+            asyncio.run(main.run_pipeline(output_dir, stanza_count=2, backgrounds_dir=str(backgrounds), preview=True))
+        finally:
+            paths = profiler.stop(output_dir)
+    
+    functions = {name for _, _, name in pstats.Stats(str(paths["cprofile"])).stats}
+    assert {"build_video", "generate_audio_buffers"} <= functions
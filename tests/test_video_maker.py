@@ -0,0 +1,88 @@
+"""Tests for video.video_maker."""
+
+import threading
+
+import numpy as np
+import pytest
+from moviepy.editor import VideoFileClip
+
+from audio.tts import AudioBuffer, read_wav
+from benchmarks import fixtures
+from video import video_maker
+
+SAMPLE_RATE = 22050
+
+
+def _tone(seconds: float, channels: int = 1) -> AudioBuffer:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    samples = (np.sin(2 * np.pi * 220 * t) * 8000).astype(np.int16)
+    if channels > 1:
+        samples = np.repeat(samples[:, None], channels, axis=1)
+    return AudioBuffer(samples, SAMPLE_RATE)
+
+
+@pytest.mark.parametrize("channels", [1, 2])
+def test_buffer_audio_clip_keeps_duration(tmp_path, channels):
+    clip = video_maker._load_audio_clip(_tone(4.0, channels))
+    path = tmp_path / "stanza.wav"
+    clip.write_audiofile(str(path), fps=SAMPLE_RATE, logger=None)
+    
+    assert clip.duration == pytest.approx(4.0)
+    assert read_wav(str(path)).duration == pytest.approx(4.0, abs=0.05)
+
+
+def test_ffmpeg_pipe_stops_ffmpeg_when_frame_composition_fails(tmp_path, monkeypatch):
+    calls = []
+    
+    def compose(stanza, bg_path, spec):
+        calls.append(stanza)
+        if len(calls) > 1:
+            raise OSError("corrupt background")
+        return video_maker.Image.new("RGB", (spec.width, spec.height))
+    
+    monkeypatch.setattr(video_maker, "_get_stanza_frame", compose)
+    outcome = {}
+    
+    def render():
+        try:
+            video_maker._render_with_ffmpeg_pipe(
+                ["one", "two"], [_tone(0.5), _tone(0.5)], ["a.jpg", "b.jpg"],
+                str(tmp_path / "out.mp4"), video_maker.render_spec(preview=True)
+            )
+        except Exception as e:
+            outcome["error"] = e
+    
+    thread = threading.Thread(target=render, daemon=True)
+    thread.start()
+    thread.join(timeout=30)
+    
+    assert not thread.is_alive(), "render hung waiting for ffmpeg"
+    assert isinstance(outcome.get("error"), OSError)
+    assert str(outcome["error"]) == "corrupt background"
+
+
+@pytest.mark.parametrize("engine", ["moviepy", "ffmpeg", "segments"])
+def test_renditions_are_encoded_from_the_composition(tmp_path, monkeypatch, engine):
+    monkeypatch.setattr(video_maker.settings, "VIDEO_ENGINE", engine)
+    monkeypatch.setattr(video_maker.settings, "VIDEO_WIDTH", 216)
+    monkeypatch.setattr(video_maker.settings, "VIDEO_HEIGHT", 384)
+    monkeypatch.setattr(video_maker.settings, "FRAME_CACHE_ENABLED", False)
+    monkeypatch.setattr(video_maker.settings, "VIDEO_RENDER_WORKERS", 1)
+    backgrounds = fixtures.make_backgrounds(tmp_path / "backgrounds", 2)
+    renditions = [video_maker.Rendition("small", 108, 192), video_maker.Rendition("square", 216, 216)]
+    
+    output_path = str(tmp_path / "out.mp4")
+    video_maker.build_video(
+        backgrounds, ["one\nline", "two\nline"], output_path,
+        audio_buffers=[_tone(1.0), _tone(1.5)], renditions=renditions
+    )
+    
+    for path, size in [(output_path, [216, 384])] + [
+        (video_maker.rendition_path(output_path, r), [r.width, r.height]) for r in renditions
+    ]:
+        clip = VideoFileClip(str(path))
+        try:
+            assert clip.size == size
+            assert clip.duration == pytest.approx(2.5, abs=0.05)
+        finally:
+            clip.close()
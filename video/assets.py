@@ -0,0 +1,205 @@
+"""Normalized background asset store.
+
+Backgrounds are decoded once, cropped to the video aspect ratio (centered,
+or around the most detailed region) and resized to exactly the target frame
+size, then kept as uncompressed .npy files that the renderer memory-maps
+instead of decoding and resampling JPEGs per run. The chosen crop box is
+recorded in a .json sidecar next to each entry.
+
+Usage:
+    python -m video.assets ingest [--dir assets/backgrounds]
+    python -m video.assets stats
+    python -m video.assets clear
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+import numpy as np
+from PIL import Image
+import disk_cache
+import settings
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.bmp', '.gif'}
+
+
+def normalized_background(path: str, width: int, height: int) -> np.ndarray:
+    """
+    Return a background cropped and resized to width × height, ingesting it on first use.
+    
+    Entries are keyed by the source file's path, size and mtime, so editing
+    or replacing the image invalidates its normalized copy.
+    
+    Args:
+        path: Source image path
+        width: Target width in pixels
+        height: Target height in pixels
+    
+    Returns:
+        Read-only uint8 array of shape (height, width, 3), memory-mapped from the store
+    """
+    entry = _entry_path(path, width, height)
+    if entry.exists():
+        try:
+            return np.load(entry, mmap_mode='r')
+        except (OSError, ValueError) as e:
+            logger.warning(f"Re-ingesting unreadable background {entry}: {e}")
+    
+    return np.load(_ingest(path, width, height, entry), mmap_mode='r')
+
+
+def ingest_backgrounds(directory: Path, width: int, height: int) -> int:
+    """
+    Pre-normalize every image in directory.
+    
+    Returns:
+        Number of images newly ingested
+    """
+    count = 0
+    for f in sorted(directory.iterdir()):
+        if not f.is_file() or f.suffix.lower() not in IMAGE_EXTENSIONS:
+            continue
+        entry = _entry_path(str(f), width, height)
+        if not entry.exists():
+            _ingest(str(f), width, height, entry)
+            count += 1
+    return count
+
+
+def _entry_path(path: str, width: int, height: int) -> Path:
+    """Store location for a source image at a given size (prefix groups all versions of one source)."""
+    source_prefix = hashlib.sha256(str(Path(path).resolve()).encode('utf-8')).hexdigest()[:16]
+    key = disk_cache.content_key(
+        disk_cache.file_identity(path), width, height, settings.BACKGROUND_CROP_MODE
+    )
+    return settings.BACKGROUND_STORE_DIR / f"{source_prefix}_{width}x{height}_{key[:16]}.npy"
+
+
+def _ingest(path: str, width: int, height: int, entry: Path) -> Path:
+    """Decode, crop and resize one background into the store, replacing stale versions."""
+    mode = settings.BACKGROUND_CROP_MODE.lower()
+    logger.info(f"Normalizing background {path} to {width}x{height} ({mode} crop)...")
+    with Image.open(path) as img:
+        img = img.convert('RGB')
+        if mode == "saliency":
+            box = _saliency_crop_box(img, width, height)
+        else:
+            box = _center_crop_box(img.size, width, height)
+        img = img.crop(box)
+        img = img.resize((width, height), Image.LANCZOS)
+        pixels = np.asarray(img)
+    
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    # Drop earlier versions of this source at this size (the file or crop mode changed)
+    prefix = entry.name.split('_', 1)[0]
+    for stale in entry.parent.glob(f"{prefix}_{width}x{height}_*"):
+        if stale.stem != entry.stem:
+            stale.unlink(missing_ok=True)
+    
+    tmp = entry.with_name(f".{entry.stem}.{os.getpid()}.{threading.get_ident()}.npy")
+    try:
+        np.save(tmp, pixels)
+        os.replace(tmp, entry)
+    finally:
+        tmp.unlink(missing_ok=True)
+    
+    entry.with_suffix('.json').write_text(
+        json.dumps({'source': str(Path(path).resolve()), 'mode': mode, 'crop_box': list(box)}),
+        encoding='utf-8'
+    )
+    return entry
+
+
+def _center_crop_box(size: tuple[int, int], width: int, height: int) -> tuple[int, int, int, int]:
+    """Largest centered box of size's image with the width:height aspect ratio."""
+    src_w, src_h = size
+    target_ratio = width / height
+    if src_w / src_h > target_ratio:
+        crop_w = round(src_h * target_ratio)
+        left = (src_w - crop_w) // 2
+        return (left, 0, left + crop_w, src_h)
+    crop_h = round(src_w / target_ratio)
+    top = (src_h - crop_h) // 2
+    return (0, top, src_w, top + crop_h)
+
+
+def _saliency_crop_box(img: Image.Image, width: int, height: int) -> tuple[int, int, int, int]:
+    """
+    Position the width:height crop window over the most detailed part of img.
+    
+    Detail is measured as gradient magnitude on a downscaled grayscale copy;
+    the window slides along the axis being cropped and the offset with the
+    highest (mildly center-weighted) gradient energy wins.
+    """
+    left, top, right, bottom = _center_crop_box(img.size, width, height)
+    src_w, src_h = img.size
+    crop_w, crop_h = right - left, bottom - top
+    if (crop_w, crop_h) == (src_w, src_h):
+        return (left, top, right, bottom)
+    
+    # Work on a small copy: saliency only needs coarse structure
+    scale = min(1.0, 256 / max(src_w, src_h))
+    small = np.asarray(
+        img.convert('L').resize((max(1, round(src_w * scale)), max(1, round(src_h * scale))), Image.BILINEAR),
+        dtype=np.float32
+    )
+    grad_y, grad_x = np.gradient(small)
+    energy = np.hypot(grad_x, grad_y)
+    
+    horizontal = crop_w < src_w
+    profile = energy.sum(axis=0) if horizontal else energy.sum(axis=1)
+    window = max(1, min(len(profile), round((crop_w if horizontal else crop_h) * scale)))
+    
+    # Energy of every window position via a cumulative sum
+    cumulative = np.concatenate([[0.0], np.cumsum(profile)])
+    window_energy = cumulative[window:] - cumulative[:-window]
+    if window_energy.max() <= 0:
+        return (left, top, right, bottom)
+    
+    # Prefer the center when the image has no clear subject
+    positions = np.arange(len(window_energy))
+    center = (len(window_energy) - 1) / 2
+    spread = max(len(window_energy) / 2, 1.0)
+    window_energy = window_energy * (1.0 - 0.25 * ((positions - center) / spread) ** 2)
+    
+    offset = int(round(int(np.argmax(window_energy)) / scale))
+    if horizontal:
+        offset = min(max(offset, 0), src_w - crop_w)
+        return (offset, 0, offset + crop_w, src_h)
+    offset = min(max(offset, 0), src_h - crop_h)
+    return (0, offset, src_w, offset + crop_h)
+
+
+def main() -> None:
+    """Ingest, inspect or clear the normalized background store."""
+    parser = argparse.ArgumentParser(description="Manage the normalized background asset store")
+    sub = parser.add_subparsers(dest="command", required=True)
+    ingest_parser = sub.add_parser("ingest", help="Normalize every background image")
+    ingest_parser.add_argument("--dir", type=str, default=None, help="Backgrounds directory (default: settings.ASSETS_BACKGROUNDS_DIR)")
+    sub.add_parser("stats", help="Show entry count and size")
+    sub.add_parser("clear", help="Remove every entry")
+    args = parser.parse_args()
+    
+    if args.command == "ingest":
+        directory = Path(args.dir) if args.dir else settings.ASSETS_BACKGROUNDS_DIR
+        count = ingest_backgrounds(directory, settings.VIDEO_WIDTH, settings.VIDEO_HEIGHT)
+        print(f"Ingested {count} new backgrounds from {directory}")
+    elif args.command == "stats":
+        info = disk_cache.stats(settings.BACKGROUND_STORE_DIR, "*.npy")
+        print(f"{info['directory']}: {info['entries']} entries, {info['bytes'] / (1024 * 1024):.1f}MB")
+    else:
+        removed, freed = disk_cache.prune(settings.BACKGROUND_STORE_DIR, 0, "*.npy")
+        for sidecar in settings.BACKGROUND_STORE_DIR.glob("*.json"):
+            sidecar.unlink(missing_ok=True)
+        print(f"Removed {removed} entries ({freed / (1024 * 1024):.1f}MB)")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,143 @@
+"""Cache of pre-composited stanza frames (background + caption), stored as .npy for mmap loading.
+
+Usage:
+    python -m video.frame_cache stats
+    python -m video.frame_cache prune [--max-mb N]
+    python -m video.frame_cache clear
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+import numpy as np
+import disk_cache
+import settings
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever caption/frame rendering changes so stale frames are never reused
+FRAME_FORMAT_VERSION = 3
+
+# Content hashes of background files, keyed by (path, size, mtime) so each file is read once
+_file_hashes: dict[tuple, str] = {}
+_file_hashes_lock = threading.Lock()
+
+
+def frame_key(background_path: str, text: str, font_id, width: int, height: int) -> str:
+    """
+    Build the cache key for a composited stanza frame.
+    
+    Args:
+        background_path: Background image path (its content hash is used)
+        text: Caption text
+        font_id: Identity of the caption font
+        width: Frame width in pixels
+        height: Frame height in pixels
+    
+    Returns:
+        Hex cache key
+    """
+    caption_settings = {
+        'size': settings.CAPTION_FONT_SIZE,
+        'color': settings.CAPTION_COLOR,
+        'position': settings.CAPTION_POSITION,
+        'stroke_color': settings.CAPTION_STROKE_COLOR,
+        'stroke_width': settings.CAPTION_STROKE_WIDTH,
+        'max_width': settings.CAPTION_MAX_WIDTH,
+        'crop_mode': settings.BACKGROUND_CROP_MODE,
+    }
+    return disk_cache.content_key(
+        FRAME_FORMAT_VERSION, _file_hash(background_path), text.strip(), font_id, caption_settings, width, height
+    )
+
+
+def _file_hash(path: str) -> str:
+    """Return the SHA-256 of a file's content, memoized per (path, size, mtime)."""
+    identity = tuple(disk_cache.file_identity(path))
+    with _file_hashes_lock:
+        cached = _file_hashes.get(identity)
+    if cached is not None:
+        return cached
+    
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    
+    with _file_hashes_lock:
+        _file_hashes[identity] = digest.hexdigest()
+    return digest.hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    return settings.FRAME_CACHE_DIR / key[:2] / f"{key}.npy"
+
+
+def lookup(key: str) -> np.ndarray | None:
+    """Return the cached frame for key as a read-only memory map, or None on a miss."""
+    path = _entry_path(key)
+    if not path.exists():
+        return None
+    try:
+        frame = np.load(path, mmap_mode='r')
+    except (OSError, ValueError) as e:
+        logger.warning(f"Discarding unreadable frame cache entry {path}: {e}")
+        path.unlink(missing_ok=True)
+        return None
+    disk_cache.touch(path)
+    return frame
+
+
+def store(key: str, frame: np.ndarray) -> None:
+    """Add a composited frame to the cache. Failures are logged, not raised."""
+    path = _entry_path(key)
+    tmp = path.with_name(f".{path.stem}.{os.getpid()}.{threading.get_ident()}.npy")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(tmp, np.ascontiguousarray(frame))
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"Could not store frame in cache: {e}")
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def prune(max_bytes: int | None = None) -> tuple[int, int]:
+    """Evict least recently used frames until the cache fits in max_bytes (default settings.FRAME_CACHE_MAX_BYTES)."""
+    limit = settings.FRAME_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    return disk_cache.prune(settings.FRAME_CACHE_DIR, limit, "*.npy")
+
+
+def stats() -> dict:
+    """Return entry count and total size of the frame cache."""
+    return disk_cache.stats(settings.FRAME_CACHE_DIR, "*.npy")
+
+
+def main() -> None:
+    """Inspect or prune the frame cache from the command line."""
+    parser = argparse.ArgumentParser(description="Inspect and prune the composited frame cache")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="Show entry count and size")
+    prune_parser = sub.add_parser("prune", help="Evict least recently used entries")
+    prune_parser.add_argument("--max-mb", type=int, default=None, help="Size budget in MB (default: settings.FRAME_CACHE_MAX_BYTES)")
+    sub.add_parser("clear", help="Remove every entry")
+    args = parser.parse_args()
+    
+    if args.command == "stats":
+        info = stats()
+        print(f"{info['directory']}: {info['entries']} entries, {info['bytes'] / (1024 * 1024):.1f}MB")
+    elif args.command == "prune":
+        max_bytes = args.max_mb * 1024 * 1024 if args.max_mb is not None else None
+        removed, freed = prune(max_bytes)
+        print(f"Removed {removed} entries ({freed / (1024 * 1024):.1f}MB)")
+    else:
+        removed, freed = prune(0)
+        print(f"Removed {removed} entries ({freed / (1024 * 1024):.1f}MB)")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -1,31 +1,163 @@
 """Create vertical video from components using moviepy."""
 
+import functools
 import logging
+import math
+import os
+import subprocess
+import tempfile
+import wave
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from fractions import Fraction
 from pathlib import Path
+from typing import Iterable, NamedTuple
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
-from moviepy.editor import (
-    ImageClip, CompositeVideoClip, AudioFileClip, concatenate_videoclips
-)
+from PIL import Image, ImageDraw, ImageFont, ImageOps
+from moviepy.editor import ImageClip, AudioFileClip, concatenate_videoclips
+from moviepy.audio.AudioClip import AudioArrayClip
+import instrumentation
 import settings
+from video import assets, frame_cache
 
 logger = logging.getLogger(__name__)
 
 
+class EncoderProfile(NamedTuple):
+    """Encoder settings for one quality/speed trade-off (see settings.ENCODER_PROFILES)."""
+    
+    name: str
+    preset: str
+    crf: int
+    threads: int = 0  # 0 lets ffmpeg decide
+    tune: str | None = None
+    keyframe_interval: float | None = 5.0  # Seconds between keyframes (None keeps the encoder's default)
+    audio_bitrate: str = "128k"
+
+
+def get_encoder_profile(name: str | None = None) -> EncoderProfile:
+    """
+    Look up an encoder profile from settings.ENCODER_PROFILES.
+    
+    Args:
+        name: Profile name (defaults to settings.ENCODER_PROFILE)
+    
+    Raises:
+        ValueError: If no profile has that name.
+    """
+    name = name or settings.ENCODER_PROFILE
+    try:
+        options = settings.ENCODER_PROFILES[name]
+    except KeyError:
+        available = ", ".join(settings.ENCODER_PROFILES) or "none"
+        raise ValueError(f"Unknown encoder profile '{name}' (available: {available})") from None
+    return EncoderProfile(name=name, **options)
+
+
+class RenderSpec(NamedTuple):
+    """Output geometry and encoder settings for one render."""
+    
+    width: int
+    height: int
+    fps: int
+    encoder: EncoderProfile
+    scale: float = 1.0  # Caption layout scale relative to the full-size video
+
+
+def render_spec(preview: bool = False, encoder_profile: str | None = None) -> RenderSpec:
+    """
+    Return the full-quality render spec, or a reduced one for fast previews.
+    
+    Preview renders shrink resolution by settings.PREVIEW_SCALE, drop to
+    settings.PREVIEW_FPS and use settings.PREVIEW_PRESET; captions are laid
+    out with the same logic, scaled proportionally.
+    
+    Args:
+        preview: Return the preview spec
+        encoder_profile: Name from settings.ENCODER_PROFILES (defaults to settings.ENCODER_PROFILE)
+    """
+    encoder = get_encoder_profile(encoder_profile)
+    if not preview:
+        return RenderSpec(settings.VIDEO_WIDTH, settings.VIDEO_HEIGHT, settings.VIDEO_FPS, encoder)
+    
+    scale = settings.PREVIEW_SCALE
+    # libx264 with yuv420p needs even dimensions
+    width = max(2, int(settings.VIDEO_WIDTH * scale) // 2 * 2)
+    height = max(2, int(settings.VIDEO_HEIGHT * scale) // 2 * 2)
+    return RenderSpec(
+        width, height, settings.PREVIEW_FPS, encoder._replace(preset=settings.PREVIEW_PRESET), scale
+    )
+
+
+class Rendition(NamedTuple):
+    """An extra output encoded from the same composited frames as the main video."""
+    
+    name: str
+    width: int
+    height: int
+    video_bitrate: str | None = None  # e.g. "2500k"; None keeps x264's default CRF
+    codec: str | None = None  # Defaults to settings.VIDEO_CODEC
+    preset: str | None = None  # Defaults to the main video's preset
+
+
+def get_rendition(name: str) -> Rendition:
+    """
+    Look up a rendition preset from settings.VIDEO_RENDITION_PRESETS.
+    
+    Raises:
+        ValueError: If no preset has that name.
+    """
+    try:
+        options = settings.VIDEO_RENDITION_PRESETS[name]
+    except KeyError:
+        available = ", ".join(settings.VIDEO_RENDITION_PRESETS) or "none"
+        raise ValueError(f"Unknown rendition '{name}' (available: {available})") from None
+    return Rendition(name=name, **options)
+
+
+def rendition_path(output_path: str, rendition: Rendition) -> Path:
+    """Return the file a rendition is written to, next to the main output (<stem>_<name><ext>)."""
+    output_file = Path(output_path)
+    return output_file.with_name(f"{output_file.stem}_{rendition.name}{output_file.suffix}")
+
+
 def build_video(
     backgrounds: list[str],
     stanzas: list[str],
-    audio_paths: list[str],
-    output_path: str
+    output_path: str,
+    audio_paths: list[str] | None = None,
+    audio_buffers: list | None = None,
+    preview: bool = False,
+    renditions: list[Rendition | str] | None = None,
+    encoder_profile: str | None = None
 ) -> str:
     """
     Creates vertical video (1080×1920) with synced audio and captions.
     
+    Audio is taken either from WAV files (audio_paths) or directly from
+    in-memory buffers (audio_buffers, audio.tts.AudioBuffer objects), which
+    skips the ffmpeg decode round-trip.
+    With preview=True the video is rendered at reduced resolution and frame
+    rate with a fast encoder preset (see render_spec).
+    
+    Each rendition (e.g. 720p or a square crop) is encoded from the same
+    composited frames as the main video, never from the encoded main output,
+    and written to rendition_path(output_path, rendition), so an extra
+    rendition costs encode time only. The ffmpeg engine, and the moviepy
+    engine when renditions are requested, fan the raw frames out to every
+    encoder in one ffmpeg process; the segments engine encodes each
+    rendition's still segments from the same cached stanza frame and
+    concatenates them per rendition.
+    
     Args:
         backgrounds: List of background image file paths (one per stanza)
         stanzas: List of stanza text strings
-        audio_paths: List of audio file paths (one per stanza)
         output_path: Path for final output video
+        audio_paths: List of audio file paths (one per stanza), or None when audio_buffers is given
+        audio_buffers: Optional list of in-memory audio buffers (one per stanza)
+        preview: Render a quick low-resolution preview instead of the final video
+        renditions: Extra outputs, as Rendition objects or names from settings.VIDEO_RENDITION_PRESETS
+            (defaults to settings.VIDEO_RENDITIONS; ignored for previews)
+        encoder_profile: Name from settings.ENCODER_PROFILES (defaults to settings.ENCODER_PROFILE)
     
     Returns:
         Path to generated video file
@@ -35,8 +167,12 @@ def build_video(
         RuntimeError: If video generation fails.
     """
     # Validate inputs
-    if len(stanzas) != len(audio_paths):
-        raise ValueError(f"Mismatch: {len(stanzas)} stanzas but {len(audio_paths)} audio files")
+    if (audio_paths is None) == (audio_buffers is None):
+        raise ValueError("Provide exactly one of audio_paths or audio_buffers")
+    audio_sources = audio_paths if audio_paths is not None else audio_buffers
+    
+    if len(stanzas) != len(audio_sources):
+        raise ValueError(f"Mismatch: {len(stanzas)} stanzas but {len(audio_sources)} audio tracks")
     
     if len(backgrounds) < len(stanzas):
         raise ValueError(f"Not enough backgrounds: {len(backgrounds)} backgrounds for {len(stanzas)} stanzas")
@@ -46,7 +182,7 @@ def build_video(
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
     # Validate all files exist
-    for i, audio_path in enumerate(audio_paths, 1):
+    for i, audio_path in enumerate(audio_paths or [], 1):
         if not Path(audio_path).exists():
             raise ValueError(f"Audio file not found: {audio_path}")
     
@@ -54,77 +190,675 @@ def build_video(
         if not Path(bg_path).exists():
             raise ValueError(f"Background image not found: {bg_path}")
     
+    engine = settings.VIDEO_ENGINE.lower()
+    if engine not in ("moviepy", "ffmpeg", "segments"):
+        raise ValueError(
+            f"Unknown VIDEO_ENGINE '{settings.VIDEO_ENGINE}' (expected 'moviepy', 'ffmpeg' or 'segments')"
+        )
+    
+    spec = render_spec(preview, encoder_profile)
+    
+    if renditions is None:
+        renditions = settings.VIDEO_RENDITIONS
+    renditions = [get_rendition(r) if isinstance(r, str) else r for r in renditions]
+    if preview and renditions:
+        logger.info("Skipping extra renditions for preview render")
+        renditions = []
+    _validate_renditions(renditions, output_path)
+    
     try:
-        logger.info(f"Building video with {len(stanzas)} stanzas...")
+        logger.info(
+            f"Building {'preview ' if preview else ''}video with {len(stanzas)} stanzas "
+            f"({engine} engine, {spec.width}x{spec.height} @ {spec.fps}fps, {spec.encoder.name} profile)..."
+        )
         
-        # Create video clips for each stanza
-        video_clips = []
-        for i, (stanza, audio_path, bg_path) in enumerate(zip(stanzas, audio_paths, backgrounds), 1):
-            logger.info(f"Creating video clip {i}/{len(stanzas)}...")
-            clip = _create_stanza_clip(stanza, audio_path, bg_path, i)
-            video_clips.append(clip)
+        with instrumentation.stage("video", engine=engine, profile=spec.encoder.name, preview=preview) as stage:
+            if engine == "ffmpeg":
+                _render_with_ffmpeg_pipe(stanzas, audio_sources, backgrounds, output_path, spec, renditions)
+            elif engine == "segments":
+                _render_with_static_segments(stanzas, audio_sources, backgrounds, output_path, spec, renditions)
+            else:
+                _render_with_moviepy(stanzas, audio_sources, backgrounds, output_path, spec, renditions)
+            
+            stage.add_output(output_path)
+            for rendition in renditions:
+                stage.add_output(rendition_path(output_path, rendition))
+        
+        if settings.FRAME_CACHE_ENABLED:
+            frame_cache.prune()
         
-        # Concatenate all clips
-        logger.info("Concatenating video clips...")
-        final_video = concatenate_videoclips(video_clips, method="compose")
+        logger.info(f"Successfully created video: {output_path}")
+        for rendition in renditions:
+            logger.info(f"Successfully created {rendition.name} rendition: {rendition_path(output_path, rendition)}")
+        return str(output_path)
         
-        # Write video file
-        logger.info(f"Writing video to {output_path}...")
+    except Exception as e:
+        logger.error(f"Failed to build video: {e}")
+        raise RuntimeError(f"Video generation failed: {e}") from e
+
+
+def _validate_renditions(renditions: list[Rendition], output_path: str) -> None:
+    """
+    Check rendition names and sizes before any rendering work starts.
+    
+    Raises:
+        ValueError: If a rendition is misconfigured or two outputs would collide.
+    """
+    names = set()
+    for rendition in renditions:
+        if not rendition.name or rendition.name in names:
+            raise ValueError(f"Rendition names must be unique and non-empty: '{rendition.name}'")
+        names.add(rendition.name)
+        # libx264 with yuv420p needs even dimensions
+        if rendition.width <= 0 or rendition.height <= 0 or rendition.width % 2 or rendition.height % 2:
+            raise ValueError(
+                f"Rendition '{rendition.name}' needs positive even dimensions, got {rendition.width}x{rendition.height}"
+            )
+        if rendition_path(output_path, rendition).resolve() == Path(output_path).resolve():
+            raise ValueError(f"Rendition '{rendition.name}' would overwrite the main output")
+
+
+def _rendition_output_args(
+    video_input: str,
+    audio_input: str,
+    primary_args: list[str],
+    output_path: str,
+    renditions: list[Rendition],
+    spec: RenderSpec
+) -> list[str]:
+    """
+    Build ffmpeg output arguments for the main video plus every rendition.
+    
+    The video input is decoded once and split between the encoders; each
+    rendition is scaled to cover its size and center-cropped when its aspect
+    ratio differs from the composition.
+    
+    Args:
+        video_input: ffmpeg stream specifier of the composited video (e.g. "0:v")
+        audio_input: ffmpeg stream specifier of the narration (e.g. "1:a")
+        primary_args: Codec arguments for the main output
+        output_path: Main output path (renditions are written next to it)
+        renditions: Extra outputs
+        spec: Render spec of the composition
+    
+    Returns:
+        ffmpeg arguments following the inputs
+    """
+    if not renditions:
+        return ["-map", video_input, "-map", audio_input, *primary_args, str(output_path)]
+    
+    labels = ["main"] + [f"split{i}" for i in range(len(renditions))]
+    graph = [f"[{video_input}]split={len(labels)}" + "".join(f"[{label}]" for label in labels)]
+    for i, rendition in enumerate(renditions):
+        graph.append(
+            f"[split{i}]scale={rendition.width}:{rendition.height}:force_original_aspect_ratio=increase,"
+            f"crop={rendition.width}:{rendition.height},setsar=1[rendition{i}]"
+        )
+    
+    args = ["-filter_complex", ";".join(graph)]
+    args += ["-map", "[main]", "-map", audio_input, *primary_args, str(output_path)]
+    for i, rendition in enumerate(renditions):
+        encoder = _rendition_encoder(rendition, spec)
+        args += [
+            "-map", f"[rendition{i}]", "-map", audio_input,
+            *_video_codec_args(encoder, spec.fps, codec=rendition.codec, video_bitrate=rendition.video_bitrate),
+            *_audio_codec_args(encoder),
+            str(rendition_path(output_path, rendition))
+        ]
+    return args
+
+
+def _rendition_encoder(rendition: Rendition, spec: RenderSpec) -> EncoderProfile:
+    """Return the main video's encoder profile with the rendition's preset override applied."""
+    return spec.encoder._replace(preset=rendition.preset or spec.encoder.preset)
+
+
+def _video_codec_args(
+    encoder: EncoderProfile,
+    fps: float,
+    threads: int | None = None,
+    gop: int | None = None,
+    codec: str | None = None,
+    video_bitrate: str | None = None
+) -> list[str]:
+    """
+    Build ffmpeg video encoder arguments for an encoder profile.
+    
+    Args:
+        encoder: Encoder profile
+        fps: Output frame rate, used to turn the keyframe interval into frames
+        threads: Thread count used when the profile leaves it to ffmpeg (0)
+        gop: Keyframe interval in frames, overriding the profile's
+            (omitted when neither is set)
+        codec: Video codec (defaults to settings.VIDEO_CODEC)
+        video_bitrate: Target bitrate replacing the profile's CRF
+    """
+    args = ["-c:v", codec or settings.VIDEO_CODEC, "-preset", encoder.preset]
+    args += ["-b:v", video_bitrate] if video_bitrate else ["-crf", str(encoder.crf)]
+    if encoder.tune:
+        args += ["-tune", encoder.tune]
+    if not gop and encoder.keyframe_interval:
+        gop = max(1, round(encoder.keyframe_interval * fps))
+    if gop:
+        args += ["-g", str(gop)]
+    threads = encoder.threads or threads
+    if threads:
+        args += ["-threads", str(threads)]
+    return args + ["-pix_fmt", "yuv420p"]
+
+
+def _audio_codec_args(encoder: EncoderProfile) -> list[str]:
+    """Build ffmpeg AAC encoder arguments for an encoder profile."""
+    return ["-c:a", "aac", "-b:a", encoder.audio_bitrate]
+
+
+def _render_with_moviepy(
+    stanzas: list[str],
+    audio_sources: list,
+    backgrounds: list[str],
+    output_path: str,
+    spec: RenderSpec,
+    renditions: list[Rendition] | None = None
+) -> None:
+    """
+    Composite every frame through moviepy and encode with write_videofile.
+    
+    write_videofile has one output, so when renditions are requested the
+    composited frames are piped into a single ffmpeg process that encodes
+    the main video and every rendition instead (see _pipe_frames_to_ffmpeg).
+    """
+    # Create video clips for each stanza
+    video_clips = []
+    for i, (stanza, audio, bg_path) in enumerate(zip(stanzas, audio_sources, backgrounds), 1):
+        logger.info(f"Creating video clip {i}/{len(stanzas)}...")
+        with instrumentation.stage("video.compose", stanza=i):
+            clip = _create_stanza_clip(stanza, audio, bg_path, i, spec)
+        video_clips.append(clip)
+    
+    # Concatenate all clips
+    logger.info("Concatenating video clips...")
+    final_video = concatenate_videoclips(video_clips, method="compose")
+    
+    if renditions:
+        with tempfile.TemporaryDirectory(prefix="poem_video_") as tmp_dir:
+            audio_path = Path(tmp_dir) / "narration.wav"
+            final_video.audio.write_audiofile(str(audio_path), fps=44100, nbytes=2, codec="pcm_s16le", logger=None)
+            frames = (frame.tobytes() for frame in final_video.iter_frames(fps=spec.fps, dtype="uint8"))
+            _pipe_frames_to_ffmpeg(frames, audio_path, output_path, spec, renditions, Path(tmp_dir))
+        final_video.close()
+        for clip in video_clips:
+            clip.close()
+        return
+    
+    # Write video file
+    logger.info(f"Writing video to {output_path}...")
+    encoder = spec.encoder
+    with instrumentation.stage("video.encode") as stage:
         final_video.write_videofile(
             str(output_path),
-            fps=settings.VIDEO_FPS,
+            fps=spec.fps,
             codec=settings.VIDEO_CODEC,
             audio_codec="aac",
-            preset="medium",
+            audio_bitrate=encoder.audio_bitrate,
+            preset=encoder.preset,
+            threads=encoder.threads or None,
+            ffmpeg_params=[
+                "-crf", str(encoder.crf),
+                *(["-tune", encoder.tune] if encoder.tune else []),
+                *(["-g", str(max(1, round(encoder.keyframe_interval * spec.fps)))] if encoder.keyframe_interval else [])
+            ],
             logger=None  # Suppress moviepy's verbose logging
         )
+        stage.add_output(output_path)
+    
+    # Clean up
+    final_video.close()
+    for clip in video_clips:
+        clip.close()
+
+
+def _render_with_ffmpeg_pipe(
+    stanzas: list[str],
+    audio_sources: list,
+    backgrounds: list[str],
+    output_path: str,
+    spec: RenderSpec,
+    renditions: list[Rendition] | None = None
+) -> None:
+    """
+    Render by streaming pre-composited stanza frames to a single ffmpeg process.
+    
+    Each stanza is a still background plus a still caption, so its frame is
+    composited once with PIL and written repeatedly over a rawvideo pipe.
+    The concatenated narration is muxed in the same ffmpeg invocation, and
+    any renditions are encoded from the same frames by that process.
+    """
+    audio_tracks, sample_rate = _load_audio_tracks(audio_sources)
+    
+    def frames() -> Iterable[bytes]:
+        elapsed = 0.0
+        written_frames = 0
+        for i, (stanza, samples, bg_path) in enumerate(zip(stanzas, audio_tracks, backgrounds), 1):
+            logger.info(f"Rendering stanza {i}/{len(stanzas)}...")
+            with instrumentation.stage("video.compose", stanza=i):
+                frame = _get_stanza_frame(stanza, bg_path, spec).tobytes()
+            
+            # Round on the cumulative timeline so per-stanza rounding never drifts from the audio
+            elapsed += len(samples) / sample_rate
+            target_frames = round(elapsed * spec.fps)
+            for _ in range(target_frames - written_frames):
+                yield frame
+            written_frames = target_frames
+    
+    with tempfile.TemporaryDirectory(prefix="poem_video_") as tmp_dir:
+        audio_path = Path(tmp_dir) / "narration.wav"
+        _write_pcm_wav(np.concatenate(audio_tracks), sample_rate, audio_path)
+        _pipe_frames_to_ffmpeg(frames(), audio_path, output_path, spec, renditions or [], Path(tmp_dir))
+
+
+def _pipe_frames_to_ffmpeg(
+    frames: Iterable[bytes],
+    audio_path: Path,
+    output_path: str,
+    spec: RenderSpec,
+    renditions: list[Rendition],
+    tmp_dir: Path
+) -> None:
+    """
+    Encode raw RGB frames plus a narration WAV into the main video and every rendition.
+    
+    One ffmpeg process reads the frames over a rawvideo pipe and splits them
+    between the encoders (see _rendition_output_args).
+    
+    Args:
+        frames: spec.width x spec.height rgb24 frames at spec.fps
+        audio_path: Narration WAV muxed into every output
+        output_path: Main output path
+        spec: Render spec of the composition
+        renditions: Extra outputs
+        tmp_dir: Scratch directory for ffmpeg's log
+    
+    Raises:
+        RuntimeError: If ffmpeg exits with a non-zero code.
+    """
+    cmd = [
+        _ffmpeg_binary(), "-y", "-loglevel", "error",
+        "-f", "rawvideo", "-pix_fmt", "rgb24",
+        "-s", f"{spec.width}x{spec.height}",
+        "-r", str(spec.fps), "-i", "-",
+        "-i", str(audio_path),
+        *_rendition_output_args(
+            "0:v", "1:a",
+            _video_codec_args(spec.encoder, spec.fps) + _audio_codec_args(spec.encoder),
+            output_path, renditions, spec
+        )
+    ]
+    
+    logger.info(f"Writing video to {output_path}...")
+    with open(tmp_dir / "ffmpeg.log", "w+") as log_file, instrumentation.stage("video.encode") as stage:
+        process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=log_file)
+        try:
+            for frame in frames:
+                process.stdin.write(frame)
+            process.stdin.close()
+        except BrokenPipeError:
+            # ffmpeg exited early; its exit code and log say why
+            pass
+        except BaseException:
+            # ffmpeg would wait on its open stdin forever: stop it and surface our error instead
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            returncode = process.wait()
         
-        # Clean up
-        final_video.close()
-        for clip in video_clips:
-            clip.close()
+        if returncode != 0:
+            log_file.seek(0)
+            raise RuntimeError(f"ffmpeg exited with code {returncode}: {log_file.read().strip()}")
+        stage.add_output(output_path)
+        for rendition in renditions:
+            stage.add_output(rendition_path(output_path, rendition))
+
+
+def _render_with_static_segments(
+    stanzas: list[str],
+    audio_sources: list,
+    backgrounds: list[str],
+    output_path: str,
+    spec: RenderSpec,
+    renditions: list[Rendition] | None = None
+) -> None:
+    """
+    Render each stanza as a still-image segment and join them with the concat demuxer.
+    
+    A stanza's frame never changes, so its segment is encoded at
+    SEGMENT_FPS with a single-keyframe GOP and tune=stillimage; the concat
+    list's duration directives stretch every segment to its exact audio
+    length at the container level. Segments are joined without re-encoding
+    and the narration is encoded once over the whole timeline, so encode time
+    scales with the number of stanzas rather than duration × fps.
+    
+    Renditions get their own still segments, encoded from the same composited
+    frame scaled and cropped to their size, and are joined the same way in
+    the same ffmpeg call as the main video.
+    """
+    renditions = renditions or []
+    audio_tracks, sample_rate = _load_audio_tracks(audio_sources)
+    
+    with tempfile.TemporaryDirectory(prefix="poem_video_") as tmp_dir:
+        tmp = Path(tmp_dir)
+        audio_path = tmp / "narration.wav"
+        _write_pcm_wav(np.concatenate(audio_tracks), sample_rate, audio_path)
         
-        logger.info(f"Successfully created video: {output_path}")
-        return str(output_path)
+        jobs = []
+        # One concat list per output: the main video first, then each rendition
+        concat_lines: list[list[str]] = [[] for _ in range(1 + len(renditions))]
+        total_duration = 0.0
+        for i, (stanza, samples, bg_path) in enumerate(zip(stanzas, audio_tracks, backgrounds), 1):
+            duration = len(samples) / sample_rate
+            total_duration += duration
+            segment_paths = [tmp / f"segment_{i}.mp4"] + [tmp / f"segment_{i}_r{j}.mp4" for j in range(len(renditions))]
+            jobs.append((
+                i, len(stanzas), stanza, bg_path, duration, str(segment_paths[0]), spec,
+                [(rendition, str(path)) for rendition, path in zip(renditions, segment_paths[1:])]
+            ))
+            for lines, path in zip(concat_lines, segment_paths):
+                lines += [f"file '{path.name}'", f"duration {duration:.6f}"]
         
-    except Exception as e:
-        logger.error(f"Failed to build video: {e}")
-        raise RuntimeError(f"Video generation failed: {e}") from e
+        _render_segments(jobs, settings.VIDEO_RENDER_WORKERS)
+        
+        inputs = []
+        for j, lines in enumerate(concat_lines):
+            concat_list = tmp / f"segments_{j}.txt"
+            concat_list.write_text("\n".join(lines) + "\n", encoding='utf-8')
+            inputs += ["-f", "concat", "-safe", "0", "-i", str(concat_list)]
+        
+        outputs = []
+        output_paths = [Path(output_path)] + [rendition_path(output_path, rendition) for rendition in renditions]
+        for j, path in enumerate(output_paths):
+            outputs += [
+                "-map", f"{j}:v", "-map", f"{len(output_paths)}:a",
+                "-c:v", "copy", *_audio_codec_args(spec.encoder),
+                # Stop at the end of the narration rather than the last frame's nominal duration
+                "-t", f"{total_duration:.6f}",
+                str(path.resolve())
+            ]
+        
+        logger.info(f"Concatenating segments into {output_path}...")
+        with instrumentation.stage("video.concat") as stage:
+            _run_ffmpeg([*inputs, "-i", str(audio_path), *outputs])
+            for path in output_paths:
+                stage.add_output(path)
+
+
+def _render_segments(jobs: list[tuple], workers: int) -> None:
+    """
+    Render stanza segments, in parallel worker processes when workers > 1.
+    
+    At most `workers` segments are in flight at any time, which bounds memory
+    to that many composited frames. The first failure cancels the rest.
+    
+    Args:
+        jobs: Argument tuples for _render_segment
+        workers: Number of worker processes
+    """
+    workers = max(1, min(workers, len(jobs)))
+    if workers == 1:
+        for job in jobs:
+            _render_segment(*job)
+        return
+    
+    logger.info(f"Rendering {len(jobs)} segments with {workers} worker processes...")
+    # Split the machine between concurrent encoders instead of oversubscribing it
+    encoder_threads = max(1, (os.cpu_count() or 1) // workers)
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        try:
+            for job in jobs:
+                if len(pending) >= workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        instrumentation.add_record(future.result())
+                pending.add(executor.submit(_render_segment, *job, encoder_threads))
+            for future in pending:
+                instrumentation.add_record(future.result())
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+
+def _render_segment(
+    index: int,
+    total: int,
+    stanza: str,
+    background_path: str,
+    duration: float,
+    segment_path: str,
+    spec: RenderSpec,
+    rendition_segments: list[tuple[Rendition, str]] | None = None,
+    encoder_threads: int | None = None
+) -> dict:
+    """
+    Compose one stanza's frame and encode it as a still segment (runs in worker processes).
+    
+    Each rendition's segment is encoded from the same frame, scaled and
+    cropped to the rendition's size.
+    
+    Returns:
+        The segment's instrumentation record, for the parent process to collect
+    """
+    logger.info(f"Encoding stanza segment {index}/{total}...")
+    with instrumentation.stage("video.segment", stanza=index) as stage:
+        frame = _get_stanza_frame(stanza, background_path, spec)
+        _encode_still_segment(frame, duration, Path(segment_path), spec.encoder, encoder_threads)
+        stage.add_output(segment_path)
+        for rendition, rendition_segment in rendition_segments or []:
+            _encode_still_segment(
+                _fit_frame(frame, rendition.width, rendition.height), duration, Path(rendition_segment),
+                _rendition_encoder(rendition, spec), encoder_threads,
+                codec=rendition.codec, video_bitrate=rendition.video_bitrate
+            )
+            stage.add_output(rendition_segment)
+    return stage.record
+
+
+def _fit_frame(frame: np.ndarray, width: int, height: int) -> np.ndarray:
+    """Scale a frame to cover width x height and center-crop the overflow."""
+    if frame.shape[:2] == (height, width):
+        return frame
+    return np.asarray(ImageOps.fit(Image.fromarray(frame), (width, height), method=Image.BICUBIC))
+
+
+def _encode_still_segment(
+    frame: np.ndarray,
+    duration: float,
+    segment_path: Path,
+    encoder: EncoderProfile | None = None,
+    encoder_threads: int | None = None,
+    codec: str | None = None,
+    video_bitrate: str | None = None
+) -> None:
+    """
+    Encode a still frame as a short low-frame-rate segment covering duration seconds.
+    
+    Args:
+        frame: RGB frame of shape (height, width, 3)
+        duration: Segment length in seconds
+        segment_path: Output .mp4 path
+        encoder: Encoder profile (defaults to settings.ENCODER_PROFILE)
+        encoder_threads: Encoder thread count when the profile doesn't set one (None lets ffmpeg decide)
+        codec: Video codec (defaults to settings.VIDEO_CODEC)
+        video_bitrate: Target bitrate replacing the profile's CRF
+    """
+    frame_path = segment_path.with_suffix(".png")
+    Image.fromarray(frame).save(frame_path, compress_level=1)
+    
+    # Stretch the frame rate slightly so frame_count frames span exactly duration
+    frame_count = max(1, math.ceil(duration * settings.SEGMENT_FPS))
+    frame_rate = Fraction(frame_count / duration).limit_denominator(100000)
+    encoder = encoder or get_encoder_profile()
+    # Segments are always still images, whatever the profile's general tuning
+    encoder = encoder._replace(tune=encoder.tune or "stillimage")
+    # Every segment starts on a keyframe; a still image rarely needs another one
+    gop = frame_count
+    if encoder.keyframe_interval:
+        gop = min(frame_count, max(1, round(encoder.keyframe_interval * settings.SEGMENT_FPS)))
+    _run_ffmpeg([
+        "-loop", "1", "-framerate", str(frame_rate), "-i", str(frame_path),
+        "-frames:v", str(frame_count),
+        *_video_codec_args(
+            encoder, settings.SEGMENT_FPS, threads=encoder_threads, gop=gop, codec=codec, video_bitrate=video_bitrate
+        ),
+        "-bf", "0",
+        # A shared timescale keeps stream copy concatenation of segments exact
+        "-video_track_timescale", "90000",
+        str(segment_path)
+    ])
+
+
+def _run_ffmpeg(args: list[str]) -> None:
+    """
+    Run ffmpeg with args to completion.
+    
+    Raises:
+        RuntimeError: If ffmpeg exits with a non-zero code.
+    """
+    cmd = [_ffmpeg_binary(), "-y", "-loglevel", "error"] + args
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg exited with code {result.returncode}: {result.stderr.strip()}")
+
+
+def _get_stanza_frame(stanza: str, background_path: str, spec: RenderSpec) -> np.ndarray:
+    """
+    Return the composited frame for a stanza, reusing the frame cache when possible.
+    
+    Args:
+        stanza: Stanza text
+        background_path: Path to background image
+        spec: Render geometry
+    
+    Returns:
+        uint8 array of shape (spec.height, spec.width, 3), possibly a read-only memory map
+    """
+    if not settings.FRAME_CACHE_ENABLED:
+        return _compose_stanza_frame(stanza, background_path, spec)
+    
+    key = frame_cache.frame_key(
+        background_path, stanza, _resolve_font_path(), spec.width, spec.height
+    )
+    frame = frame_cache.lookup(key)
+    if frame is not None:
+        logger.debug(f"Frame cache hit for {background_path}")
+        return frame
+    
+    frame = _compose_stanza_frame(stanza, background_path, spec)
+    frame_cache.store(key, frame)
+    return frame
+
+
+def _compose_stanza_frame(stanza: str, background_path: str, spec: RenderSpec) -> np.ndarray:
+    """
+    Composite the caption over the background into one RGB frame.
+    
+    Args:
+        stanza: Stanza text
+        background_path: Path to background image
+        spec: Render geometry
+    
+    Returns:
+        uint8 array of shape (spec.height, spec.width, 3)
+    """
+    background = assets.normalized_background(background_path, spec.width, spec.height)
+    
+    frame = Image.fromarray(np.asarray(background)).convert('RGBA')
+    frame.alpha_composite(_render_caption_image(stanza, spec))
+    return np.array(frame.convert('RGB'))
+
+
+def _load_audio_tracks(audio_sources: list) -> tuple[list[np.ndarray], int]:
+    """
+    Load every stanza's audio as int16 samples of shape (n, channels).
+    
+    Returns:
+        Tuple of (per-stanza sample arrays, shared sample rate)
+    
+    Raises:
+        ValueError: If the stanzas do not share one sample rate.
+    """
+    loaded = [_load_audio_samples(audio) for audio in audio_sources]
+    sample_rate = loaded[0][1]
+    if any(rate != sample_rate for _, rate in loaded):
+        raise ValueError("All stanza audio must share the same sample rate")
+    return [samples for samples, _ in loaded], sample_rate
+
+
+def _load_audio_samples(audio) -> tuple[np.ndarray, int]:
+    """
+    Return a stanza's audio as int16 samples of shape (n, channels) plus sample rate.
+    
+    Args:
+        audio: Path to a WAV file, or a buffer with samples and sample_rate
+    """
+    if isinstance(audio, (str, Path)):
+        from audio.tts import read_wav
+        audio = read_wav(str(audio))
+    
+    samples = np.asarray(audio.samples)
+    if samples.dtype != np.int16:
+        samples = (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+    return samples.reshape(len(samples), -1), audio.sample_rate
+
+
+def _write_pcm_wav(samples: np.ndarray, sample_rate: int, path: Path) -> None:
+    """Write int16 samples of shape (n, channels) as a PCM WAV file."""
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(samples.shape[1])
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(samples.astype('<i2').tobytes())
+
+
+def _ffmpeg_binary() -> str:
+    """Return the ffmpeg executable moviepy is configured to use."""
+    from moviepy.config import get_setting
+    return get_setting("FFMPEG_BINARY")
 
 
 def _create_stanza_clip(
     stanza: str,
-    audio_path: str,
+    audio,
     background_path: str,
-    stanza_number: int
-) -> CompositeVideoClip:
+    stanza_number: int,
+    spec: RenderSpec
+) -> ImageClip:
     """
     Create a single video clip for one stanza.
     
     Args:
         stanza: Stanza text
-        audio_path: Path to audio file
+        audio: Path to audio file, or an in-memory audio buffer
         background_path: Path to background image
         stanza_number: Stanza number (for logging)
+        spec: Render geometry and frame rate
     
     Returns:
-        CompositeVideoClip with background, text, and audio
+        ImageClip with the composited frame and audio
     """
     # Load audio to get duration
-    audio_clip = AudioFileClip(audio_path)
+    audio_clip = _load_audio_clip(audio)
     duration = audio_clip.duration
     
-    # Load and prepare background image
-    bg_clip = ImageClip(background_path)
-    bg_clip = bg_clip.resize((settings.VIDEO_WIDTH, settings.VIDEO_HEIGHT))
-    bg_clip = bg_clip.set_duration(duration)
-    bg_clip = bg_clip.set_fps(settings.VIDEO_FPS)
-    
-    # Create text overlay
-    text_clip = _create_text_clip(stanza, duration)
-    
-    # Composite background and text
-    video_clip = CompositeVideoClip([bg_clip, text_clip])
+    # Background and caption are both static, so use the pre-composited frame
+    video_clip = ImageClip(_get_stanza_frame(stanza, background_path, spec))
+    video_clip = video_clip.set_duration(duration)
+    video_clip = video_clip.set_fps(spec.fps)
     
     # Add audio
     video_clip = video_clip.set_audio(audio_clip)
@@ -132,58 +866,107 @@ def _create_stanza_clip(
     return video_clip
 
 
-def _create_text_clip(text: str, duration: float) -> ImageClip:
+def _load_audio_clip(audio) -> AudioFileClip | AudioArrayClip:
     """
-    Create a text clip using PIL (no ImageMagick required).
+    Wrap a stanza's audio in a moviepy audio clip.
     
     Args:
-        text: Text to display
-        duration: Duration of the clip
+        audio: Path to an audio file, or an audio.tts.AudioBuffer
     
     Returns:
-        ImageClip with formatted text
+        AudioFileClip for paths, AudioArrayClip for in-memory buffers
     """
-    # Clean text - preserve line breaks for poetry
-    clean_text = text.strip()
+    if isinstance(audio, (str, Path)):
+        return AudioFileClip(str(audio))
     
-    # Calculate font size based on text length and video dimensions
-    font_size = _calculate_font_size(clean_text)
+    samples = audio.to_float32()
+    if samples.shape[1] == 1:
+        # moviepy 1.0.3's AudioArrayClip always emits stereo frames; feeding it
+        # mono makes the writer interleave them as twice as many mono samples
+        samples = np.repeat(samples, 2, axis=1)
+    return AudioArrayClip(samples, fps=audio.sample_rate)
+
+
+def _render_caption_image(
+    text: str,
+    spec: RenderSpec | None = None,
+    stroke_width: int | None = None
+) -> Image.Image:
+    """
+    Render the caption as a full-frame transparent RGBA image.
     
-    # Try to load font, fallback to default
-    try:
-        font = ImageFont.truetype(settings.CAPTION_FONT, font_size)
-    except (OSError, IOError):
-        try:
-            # Try common system fonts
-            font_paths = [
-                "/System/Library/Fonts/Helvetica.ttc",
-                "/System/Library/Fonts/Arial.ttf",
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            ]
-            font = None
-            for path in font_paths:
-                try:
-                    font = ImageFont.truetype(path, font_size)
-                    break
-                except (OSError, IOError):
-                    continue
-            if font is None:
-                font = ImageFont.load_default()
-        except Exception:
-            font = ImageFont.load_default()
+    The outline is drawn by FreeType's native stroker in the same pass as the
+    fill, so each line is rasterized once whatever the stroke width.
+    
+    Args:
+        text: Text to display
+        spec: Render geometry (defaults to the full-size video)
+        stroke_width: Outline width in pixels (defaults to settings.CAPTION_STROKE_WIDTH, scaled with spec)
+    
+    Returns:
+        PIL RGBA image of size (spec.width, spec.height)
+    """
+    spec = spec or render_spec()
+    if stroke_width is None:
+        stroke_width = settings.CAPTION_STROKE_WIDTH
+        if stroke_width:
+            stroke_width = max(1, round(stroke_width * spec.scale))
+    
+    font, placements = _layout_caption(text, spec)
     
     # Create transparent image for text
-    img = Image.new('RGBA', (settings.VIDEO_WIDTH, settings.VIDEO_HEIGHT), (0, 0, 0, 0))
+    img = Image.new('RGBA', (spec.width, spec.height), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
     
+    # Draw each line of text with stroke (outline)
+    for x, y, line in placements:
+        draw.text(
+            (x, y),
+            line,
+            font=font,
+            fill=settings.CAPTION_COLOR + (255,),
+            stroke_width=stroke_width,
+            stroke_fill=settings.CAPTION_STROKE_COLOR + (255,)
+        )
+    
+    return img
+
+
+def _layout_caption(
+    text: str,
+    spec: RenderSpec | None = None
+) -> tuple[ImageFont.ImageFont, list[tuple[int, int, str]]]:
+    """
+    Choose the caption font and position every wrapped line.
+    
+    Font size, wrap width and margins are scaled by spec.scale so previews
+    keep the full-size layout proportions.
+    
+    Args:
+        text: Text to display
+        spec: Render geometry (defaults to the full-size video)
+    
+    Returns:
+        Tuple of (font, [(x, y, line), ...]) for the non-blank lines
+    """
+    spec = spec or render_spec()
+    
+    # Clean text - preserve line breaks for poetry
+    clean_text = text.strip()
+    
+    # Calculate font size based on text length and video dimensions
+    font_size = max(1, round(_calculate_font_size(clean_text) * spec.scale))
+    font = _load_font(font_size)
+    margin = round(100 * spec.scale)
+    
     # Word wrap text
-    lines = _wrap_text(clean_text, font, settings.CAPTION_MAX_WIDTH)
+    lines = _wrap_text(clean_text, font, round(settings.CAPTION_MAX_WIDTH * spec.scale))
     
     # Calculate text dimensions
     line_heights = []
     line_widths = []
     for line in lines:
-        bbox = draw.textbbox((0, 0), line, font=font)
+        bbox = font.getbbox(line)
         line_widths.append(bbox[2] - bbox[0])
         line_heights.append(bbox[3] - bbox[1])
     
@@ -192,53 +975,74 @@ def _create_text_clip(text: str, duration: float) -> ImageClip:
     # Calculate starting position (centered)
     position = settings.CAPTION_POSITION.lower()
     if position == "center":
-        start_y = (settings.VIDEO_HEIGHT - total_height) // 2
+        start_y = (spec.height - total_height) // 2
     elif position == "bottom":
-        start_y = settings.VIDEO_HEIGHT - total_height - 100
+        start_y = spec.height - total_height - margin
     else:  # top
-        start_y = 100
+        start_y = margin
     
-    # Draw each line of text with stroke (outline)
+    placements = []
     current_y = start_y
     for i, line in enumerate(lines):
-        if not line.strip():
-            current_y += line_heights[i] + (font_size // 4)
-            continue
-        
-        # Calculate x position (centered)
-        line_width = line_widths[i]
-        x = (settings.VIDEO_WIDTH - line_width) // 2
-        
-        # Draw stroke (outline) first
-        for adj in range(-settings.CAPTION_STROKE_WIDTH, settings.CAPTION_STROKE_WIDTH + 1):
-            for adj2 in range(-settings.CAPTION_STROKE_WIDTH, settings.CAPTION_STROKE_WIDTH + 1):
-                if adj != 0 or adj2 != 0:
-                    draw.text(
-                        (x + adj, current_y + adj2),
-                        line,
-                        font=font,
-                        fill=settings.CAPTION_STROKE_COLOR + (255,)
-                    )
-        
-        # Draw main text
-        draw.text(
-            (x, current_y),
-            line,
-            font=font,
-            fill=settings.CAPTION_COLOR + (255,)
-        )
-        
+        if line.strip():
+            # Calculate x position (centered)
+            x = (spec.width - line_widths[i]) // 2
+            placements.append((x, current_y, line))
         current_y += line_heights[i] + (font_size // 4)
     
-    # Convert PIL image to numpy array for MoviePy
-    img_array = np.array(img)
+    return font, placements
+
+
+def _load_font(font_size: int) -> ImageFont.ImageFont:
+    """Return the caption font at font_size from the process-wide font registry."""
+    return _get_font(_resolve_font_path(), font_size)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_font_path() -> str | None:
+    """
+    Find the caption font file once per process.
     
-    # Create ImageClip from the array
-    text_clip = ImageClip(img_array)
-    text_clip = text_clip.set_duration(duration)
-    text_clip = text_clip.set_fps(settings.VIDEO_FPS)
+    Tries settings.CAPTION_FONT, then common system fonts.
     
-    return text_clip
+    Returns:
+        Loadable font path, or None to use PIL's built-in default font
+    """
+    candidates = [
+        settings.CAPTION_FONT,
+        "/System/Library/Fonts/Helvetica.ttc",
+        "/System/Library/Fonts/Arial.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    ]
+    for path in candidates:
+        try:
+            ImageFont.truetype(path, settings.CAPTION_FONT_SIZE)
+            return path
+        except (OSError, IOError):
+            continue
+    logger.warning(f"Caption font '{settings.CAPTION_FONT}' not found; using PIL's default font")
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def _get_font(path: str | None, font_size: int) -> ImageFont.ImageFont:
+    """Load (once) the FreeTypeFont for (path, font_size)."""
+    if path is None:
+        return ImageFont.load_default()
+    return ImageFont.truetype(path, font_size)
+
+
+@functools.lru_cache(maxsize=8192)
+def _text_width(font: ImageFont.ImageFont, text: str) -> int:
+    """Rendered width of text in font, memoized (fonts come from the registry, so identity is stable)."""
+    bbox = font.getbbox(text)
+    return bbox[2] - bbox[0]
+
+
+@functools.lru_cache(maxsize=64)
+def _space_width(font: ImageFont.ImageFont) -> int:
+    """Advance used for the space between words."""
+    return font.getbbox(" ")[2]
 
 
 def _wrap_text(text: str, font: ImageFont.ImageFont, max_width: int) -> list[str]:
@@ -257,9 +1061,7 @@ def _wrap_text(text: str, font: ImageFont.ImageFont, max_width: int) -> list[str
     paragraphs = text.split('\n')
     wrapped_lines = []
     
-    # Create a temporary image for measuring text
-    temp_img = Image.new('RGB', (1, 1))
-    temp_draw = ImageDraw.Draw(temp_img)
+    space_width = _space_width(font)
     
     for paragraph in paragraphs:
         if not paragraph.strip():
@@ -271,13 +1073,11 @@ def _wrap_text(text: str, font: ImageFont.ImageFont, max_width: int) -> list[str
         current_width = 0
         
         for word in words:
-            # Measure word width
-            bbox = temp_draw.textbbox((0, 0), word, font=font)
-            word_width = bbox[2] - bbox[0]
+            # Measure word width (memoized per font)
+            word_width = _text_width(font, word)
             
             # Add space width if not first word
             if current_line:
-                space_width = temp_draw.textbbox((0, 0), " ", font=font)[2]
                 word_width += space_width
             
             # Check if adding this word would exceed max width
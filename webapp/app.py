@@ -1,17 +1,23 @@
 """Flask web application for the Poem Short Generator."""
 
+import contextvars
 import os
 import sys
 import threading
+import time
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from flask import Flask, render_template, request, jsonify, send_file, url_for
+from flask import Flask, Response, g, render_template, request, jsonify, send_file, url_for
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import instrumentation
+import profiling
 import settings
+from webapp import metrics
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.getenv('FLASK_SECRET_KEY', 'dev-secret-key-change-in-production')
@@ -25,6 +31,30 @@ generation_status = {
 }
 generation_lock = threading.Lock()  # Protect concurrent access to generation_status
 
+# Feed pipeline stage timings and TTS cache results into /metrics
+instrumentation.add_listener(metrics.observe_stage)
+
+
+@app.before_request
+def start_request_timer():
+    """Remember when the request started for the latency histogram."""
+    g.request_start = time.perf_counter()
+
+
+@app.after_request
+def record_request_metrics(response):
+    """Record per-route latency and bytes served for video playback."""
+    start = g.get('request_start')
+    if start is not None:
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        metrics.REQUEST_DURATION.observe(
+            time.perf_counter() - start, route=route, method=request.method, status=response.status_code
+        )
+    if (request.endpoint == 'serve_video' and request.method == 'GET'
+            and response.status_code in (200, 206) and response.content_length):
+        metrics.VIDEO_BYTES_SERVED.inc(response.content_length)
+    return response
+
 
 def get_all_videos():
     """Scan output directory and return all generated videos with metadata."""
@@ -43,15 +73,11 @@ def get_all_videos():
         if folder.name == 'latest':
             continue
         
-        # Find video file in folder
-        video_file = None
-        for f in folder.iterdir():
-            if f.suffix.lower() in ['.mp4', '.mov', '.avi', '.webm']:
-                video_file = f
-                break
-        
-        if not video_file:
+        # Find video file in folder (renditions are named <main stem>_<rendition>)
+        video_files = [f for f in folder.iterdir() if f.suffix.lower() in ['.mp4', '.mov', '.avi', '.webm']]
+        if not video_files:
             continue
+        video_file = min(video_files, key=lambda f: (len(f.stem), f.name))
         
         # Read metadata
         summary = ''
@@ -97,17 +123,24 @@ def get_all_videos():
     return videos
 
 
-def run_generation(tone, stanzas_count, model):
+def run_generation(tone, stanzas_count, model, preview=False, renditions=None, encoder_profile=None, profile=False):
     """Run the poem generation pipeline in background."""
     global generation_status
     
+    output_dir = None
+    status = 'error'
+    instrumentation.start_run(
+        tone=tone, model=model, stanzas=stanzas_count, engine=settings.VIDEO_ENGINE,
+        preview=preview, encoder_profile=encoder_profile
+    )
+    profiler = profiling.Profiler().start() if profile else None
     try:
         generation_status['progress'] = 'Starting generation...'
         
         # Import here to avoid circular imports
         from poem.summarizer import get_world_news_summary, generate_short_title
         from poem.poem_writer import make_stanzas
-        from audio.tts import generate_audio_files
+        from audio.tts import generate_audio_buffers
         from video.video_maker import build_video
         import random
         import re
@@ -117,26 +150,27 @@ def run_generation(tone, stanzas_count, model):
         output_dir = settings.OUTPUT_BASE_DIR / timestamp
         output_dir.mkdir(parents=True, exist_ok=True)
         audio_dir = output_dir / "audio"
-        audio_dir.mkdir(exist_ok=True)
         
         # Step 1: Get news summary
         generation_status['progress'] = 'Step 1/4: Fetching world news...'
         summary = get_world_news_summary(model=model)
         (output_dir / "summary.txt").write_text(summary, encoding='utf-8')
         
-        # Step 2: Generate poem
+        # Step 2: Generate poem (the title is generated alongside and only awaited for the filename)
         generation_status['progress'] = 'Step 2/4: Writing poem stanzas...'
+        title_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="title")
+        title_future = title_pool.submit(contextvars.copy_context().run, generate_short_title, summary, model=model)
+        title_pool.shutdown(wait=False)
         stanzas = make_stanzas(summary, tone=tone, model=model, stanza_count=stanzas_count)
         stanzas_text = "\n\n".join(f"Stanza {i}:\n{stanza}" for i, stanza in enumerate(stanzas, 1))
         (output_dir / "stanzas.txt").write_text(stanzas_text, encoding='utf-8')
         
-        # Generate title
-        title = generate_short_title(summary, model=model)
-        safe_title = re.sub(r"[^a-z0-9]+", "-", title.lower().strip()).strip("-") or "video"
-        
         # Step 3: Generate audio
         generation_status['progress'] = 'Step 3/4: Generating audio narration...'
-        audio_paths = generate_audio_files(stanzas, str(audio_dir))
+        audio_buffers = generate_audio_buffers(
+            stanzas,
+            output_dir=str(audio_dir) if settings.SAVE_AUDIO_FILES else None
+        )
         
         # Step 4: Build video
         generation_status['progress'] = 'Step 4/4: Building video...'
@@ -156,24 +190,36 @@ def run_generation(tone, stanzas_count, model):
             background_paths = random.sample(image_files, stanzas_count)
         
         # Build video
+        title = title_future.result()
+        safe_title = re.sub(r"[^a-z0-9]+", "-", title.lower().strip()).strip("-") or "video"
         date_prefix = timestamp.split("_")[0]
-        video_filename = f"{date_prefix}_{safe_title}.{settings.OUTPUT_VIDEO_FORMAT}"
+        suffix = "_preview" if preview else ""
+        video_filename = f"{date_prefix}_{safe_title}{suffix}.{settings.OUTPUT_VIDEO_FORMAT}"
         video_path = output_dir / video_filename
         
         build_video(
             backgrounds=background_paths,
             stanzas=stanzas,
-            audio_paths=audio_paths,
-            output_path=str(video_path)
+            output_path=str(video_path),
+            audio_buffers=audio_buffers,
+            preview=preview,
+            renditions=renditions,
+            encoder_profile=encoder_profile
         )
         
         generation_status['progress'] = 'Complete!'
+        status = 'success'
         generation_status['last_video'] = timestamp
         
     except Exception as e:
         generation_status['error'] = str(e)
         generation_status['progress'] = f'Error: {e}'
     finally:
+        if profiler is not None:
+            profiler.stop(output_dir)
+        instrumentation.finish_run(output_dir)
+        metrics.GENERATIONS.inc(status=status)
+        metrics.QUEUE_DEPTH.dec()
         generation_status['is_generating'] = False
 
 
@@ -212,10 +258,22 @@ def api_generate():
     tone = data.get('tone', 'poetic insight')
     stanzas_count = int(data.get('stanzas', 7))
     model = data.get('model', settings.OPENAI_MODEL)
+    preview = bool(data.get('preview', False))
+    profile = bool(data.get('profile', False))
+    renditions = data.get('renditions')
+    if renditions is not None:
+        if not isinstance(renditions, list) or any(r not in settings.VIDEO_RENDITION_PRESETS for r in renditions):
+            available = ', '.join(settings.VIDEO_RENDITION_PRESETS)
+            return jsonify({'error': f'renditions must be a list of: {available}'}), 400
+    encoder_profile = data.get('encoder_profile')
+    if encoder_profile is not None and encoder_profile not in settings.ENCODER_PROFILES:
+        available = ', '.join(settings.ENCODER_PROFILES)
+        return jsonify({'error': f'encoder_profile must be one of: {available}'}), 400
     
     # Atomic check-and-set to prevent race condition
     with generation_lock:
         if generation_status['is_generating']:
+            metrics.GENERATIONS_REJECTED.inc()
             return jsonify({'error': 'Generation already in progress'}), 400
         
         # Reset status while holding the lock
@@ -226,8 +284,10 @@ def api_generate():
             'last_video': None
         }
     
+    metrics.QUEUE_DEPTH.inc()
+    
     # Run generation in background thread (outside lock)
-    thread = threading.Thread(target=run_generation, args=(tone, stanzas_count, model))
+    thread = threading.Thread(target=run_generation, args=(tone, stanzas_count, model, preview, renditions, encoder_profile, profile))
     thread.daemon = True
     thread.start()
     
@@ -276,6 +336,12 @@ def serve_video(video_id):
     return send_file(video_path, mimetype='video/mp4')
 
 
+@app.route('/metrics')
+def prometheus_metrics():
+    """Expose in-process metrics in the Prometheus text format."""
+    return Response(metrics.render(), content_type=metrics.CONTENT_TYPE)
+
+
 @app.route('/api/videos')
 def api_videos():
     """API endpoint to get all videos as JSON."""
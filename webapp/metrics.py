@@ -0,0 +1,178 @@
+"""In-process Prometheus metrics for the web app, rendered in the text exposition format.
+
+Collectors are plain counters, gauges and histograms guarded by a lock, so
+updating them costs a dict lookup and an addition; /metrics renders them on
+demand without touching the disk.
+"""
+
+import bisect
+import math
+import threading
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Stage durations span sub-second cache hits to multi-minute encodes
+STAGE_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+_registry: list = []
+
+
+class _Metric:
+    """Shared label handling for all metric types."""
+    
+    type_name = "untyped"
+    
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: dict[tuple, object] = {}
+        _registry.append(self)
+    
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+    
+    def _label_text(self, key: tuple, extra: tuple = ()) -> str:
+        pairs = list(zip(self.labelnames, key)) + list(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+    
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.type_name}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        if not items and not self.labelnames:
+            items = [((), self._empty())]
+        for key, value in items:
+            lines += self._render_sample(key, value)
+        return lines
+    
+    def _empty(self):
+        return 0.0
+    
+    def _render_sample(self, key: tuple, value) -> list[str]:
+        return [f"{self.name}{self._label_text(key)} {_format(value)}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+    
+    type_name = "counter"
+    
+    def inc(self, amount: float = 1, **labels) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+    
+    type_name = "gauge"
+    
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+    
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+    
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram of observed values."""
+    
+    type_name = "histogram"
+    
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = (), buckets: tuple = REQUEST_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+    
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = self._empty()
+            if index < len(self.buckets):
+                state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+    
+    def _empty(self):
+        # [per-bucket counts, sum, count]
+        return [[0] * len(self.buckets), 0.0, 0]
+    
+    def _render_sample(self, key: tuple, value) -> list[str]:
+        counts, total, count = value
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            lines.append(f"{self.name}_bucket{self._label_text(key, (('le', _format(bound)),))} {cumulative}")
+        lines.append(f"{self.name}_bucket{self._label_text(key, (('le', '+Inf'),))} {count}")
+        lines.append(f"{self.name}_sum{self._label_text(key)} {_format(total)}")
+        lines.append(f"{self.name}_count{self._label_text(key)} {count}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(value: float) -> str:
+    if isinstance(value, float) and math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+GENERATIONS = Counter("poem_generations_total", "Finished generation runs by outcome.", ("status",))
+GENERATIONS_REJECTED = Counter(
+    "poem_generations_rejected_total", "Generation requests rejected because a run was already in progress."
+)
+QUEUE_DEPTH = Gauge("poem_generation_queue_depth", "Generation runs in progress or waiting.")
+STAGE_DURATION = Histogram(
+    "poem_stage_duration_seconds", "Wall time of pipeline stages.", ("stage",), buckets=STAGE_BUCKETS
+)
+TTS_CACHE_REQUESTS = Counter("poem_tts_cache_requests_total", "TTS cache lookups by result.", ("result",))
+VIDEO_BYTES_SERVED = Counter("poem_video_bytes_served_total", "Video bytes sent by /serve/<video_id>.")
+REQUEST_DURATION = Histogram(
+    "poem_http_request_duration_seconds", "HTTP request latency by route.", ("route", "method", "status")
+)
+
+# Export zeroes for the known label values so rates work from the first scrape
+for _status in ("success", "error"):
+    GENERATIONS.inc(0, status=_status)
+for _result in ("hit", "miss"):
+    TTS_CACHE_REQUESTS.inc(0, result=_result)
+
+
+def observe_stage(record: dict) -> None:
+    """Instrumentation listener: feed finished pipeline stages into the collectors."""
+    STAGE_DURATION.observe(record["wall_seconds"], stage=record["stage"])
+    cache = record["labels"].get("cache")
+    if record["stage"] == "tts.stanza" and cache in ("hit", "miss"):
+        TTS_CACHE_REQUESTS.inc(result=cache)
+
+
+def render() -> str:
+    """Render every collector in the Prometheus text format."""
+    lines = []
+    for metric in _registry:
+        lines += metric.render()
+    return "\n".join(lines) + "\n"